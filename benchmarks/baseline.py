@@ -0,0 +1,74 @@
+"""
+Helpers for storing benchmark baselines and flagging regressions.
+
+Baselines live in benchmarks/baselines.json as {"<suite>": {"<metric>": value}}.
+Every metric records whether lower or higher values are better, so a single
+tolerance can be applied to timings and throughputs alike.
+"""
+import json
+import os
+from typing import Dict, List, Tuple
+
+BASELINES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+
+def load_baselines(path: str = BASELINES_PATH) -> Dict[str, Dict[str, dict]]:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baselines(suite: str, results: Dict[str, dict], path: str = BASELINES_PATH) -> None:
+    baselines = load_baselines(path)
+    baselines[suite] = results
+    with open(path, "w") as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(
+        suite: str,
+        results: Dict[str, dict],
+        tolerance: float,
+        min_delta: float = 0.0,
+        path: str = BASELINES_PATH
+) -> List[Tuple[str, float, float]]:
+    """
+    Compare results against the stored baseline of a suite.
+
+    :param suite: Suite name in the baselines file
+    :param results: Mapping of metric name to {"value": float, "unit": str, "better": "lower"|"higher"}
+    :param tolerance: Allowed relative slowdown, e.g. 0.25 for 25%
+    :param min_delta: Absolute difference below which changes are treated as noise
+    :return: List of (metric, baseline, current) for every regressed metric
+    """
+    baseline = load_baselines(path).get(suite, {})
+    regressions = []
+
+    for metric, result in results.items():
+        reference = baseline.get(metric)
+        if reference is None:
+            continue
+
+        old, new = reference["value"], result["value"]
+        if abs(new - old) <= min_delta:
+            continue
+
+        if result.get("better", "lower") == "lower":
+            regressed = new > old * (1 + tolerance)
+        else:
+            regressed = new < old * (1 - tolerance)
+
+        if regressed:
+            regressions.append((metric, old, new))
+
+    return regressions
+
+
+def report(suite: str, results: Dict[str, dict], regressions: List[Tuple[str, float, float]]) -> None:
+    print(f"== {suite}")
+    regressed = {metric for metric, _, _ in regressions}
+    for metric, result in results.items():
+        flag = "  REGRESSION" if metric in regressed else ""
+        print(f"  {metric:<45} {result['value']:>12.3f} {result['unit']}{flag}")
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Client throughput benchmarks against the in-process StubServer.
+
+Measures calls/sec of create_scheduled_posts, pagination throughput, upload
+MB/s from a file and from memory, model parse time per item and the overhead
+of a status poll. The stub answers instantly, so the figures are dominated by
+client-side cost. Request encoding and response decoding through the protocol
+core are also measured on their own, without any network. Startup latency
+compares the first calls of a fresh client with those of a client that ran
+warmup() with a DNSCache; the stub is addressed as "localhost" so name
+resolution is part of the figure. Compression figures give the bytes on the
+wire of a long scheduled post and of a list_media page with and without gzip,
+and the CPU time it costs. The create_scheduled_posts figure is repeated with
+a Profiler sampling 1% of calls, the rate meant to stay enabled in production.
+
+    python benchmarks/bench_client.py            # measure and compare with baselines.json
+    python benchmarks/bench_client.py --update   # store the current figures as the baseline
+"""
+import argparse
+import gzip
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from baseline import compare, report, save_baselines  # noqa: E402
+
+from robopost_client import protocol  # noqa: E402
+from robopost_client import (  # noqa: E402
+    DNSCache,
+    Profiler,
+    PublicAPIGeneratedFacelessVideoSeriesRead,
+    PublicAPIMediaRead,
+    PublicAPIScheduledPostCreateHTTPPayload,
+    RobopostClient,
+    StubConfig,
+    StubServer,
+)
+
+SUITE = "client"
+
+
+def median_of(repeats: int, func) -> float:
+    return statistics.median(func() for _ in range(repeats))
+
+
+def bench_create_scheduled_posts(client: RobopostClient, calls: int) -> float:
+    payload = PublicAPIScheduledPostCreateHTTPPayload(text="Benchmark post #perf", channel_ids=["c1", "c2"])
+    start = time.perf_counter()
+    for _ in range(calls):
+        client.create_scheduled_posts(payload)
+    return calls / (time.perf_counter() - start)
+
+
+def bench_pagination(client: RobopostClient, page_size: int) -> float:
+    start = time.perf_counter()
+    items, skip = 0, 0
+    while True:
+        page = client.list_media(skip=skip, limit=page_size)
+        items += len(page)
+        if len(page) < page_size:
+            break
+        skip += page_size
+    return items / (time.perf_counter() - start)
+
+
+def bench_upload(client: RobopostClient, path: str) -> float:
+    size = os.path.getsize(path)
+    start = time.perf_counter()
+    client.upload_media(path)
+    return size / (1024 * 1024) / (time.perf_counter() - start)
+
+
+def bench_upload_buffer(client: RobopostClient, data: bytes) -> float:
+    start = time.perf_counter()
+    client.upload_media(data, filename="benchmark.bin")
+    return len(data) / (1024 * 1024) / (time.perf_counter() - start)
+
+
+def bench_parse(model, items: list) -> float:
+    start = time.perf_counter()
+    for item in items:
+        model(**item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+
+def bench_encode(calls: int) -> float:
+    payload = PublicAPIScheduledPostCreateHTTPPayload(text="Benchmark post #perf " * 20, channel_ids=["c1", "c2"])
+    start = time.perf_counter()
+    for _ in range(calls):
+        protocol.create_scheduled_posts(payload).body()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def bench_decode(items: list) -> float:
+    body = json.dumps(items).encode()
+    spec = protocol.list_media(limit=len(items))
+    start = time.perf_counter()
+    protocol.parse_response(spec, 200, body)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+
+def long_post() -> PublicAPIScheduledPostCreateHTTPPayload:
+    """A post with long text and first comment, worded like real captions rather than repeated"""
+    words = ("launch", "summer", "collection", "discover", "our", "new", "behind", "the", "scenes", "today",
+             "limited", "offer", "link", "in", "bio", "#sale", "#travel", "#design", "team", "customers")
+    rng = random.Random(0)
+
+    def text(n: int) -> str:
+        return " ".join(rng.choice(words) for _ in range(n))
+
+    return PublicAPIScheduledPostCreateHTTPPayload(text=text(1200), first_comment=text(300), channel_ids=["c1"])
+
+
+def bench_gzip(body: bytes, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        gzip.compress(body, compresslevel=protocol.GZIP_LEVEL, mtime=0)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def bench_page(client: RobopostClient, limit: int, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        client.list_media(limit=limit)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def page_on_wire(stub: StubServer, client: RobopostClient, limit: int) -> float:
+    stub.bytes_sent = 0
+    client.list_media(limit=limit)
+    return stub.bytes_sent
+
+
+def bench_first_calls(base_url: str, warm: bool, calls: int = 4) -> float:
+    """Milliseconds until `calls` concurrent first calls of a new client have all returned"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    client = RobopostClient(apikey="benchmark", base_url=base_url, dns_cache=DNSCache() if warm else None)
+    try:
+        if warm:
+            client.warmup(n_connections=calls)
+        with ThreadPoolExecutor(max_workers=calls) as executor:
+            start = time.perf_counter()
+            list(executor.map(lambda _: client.list_media(limit=1), range(calls)))
+            return (time.perf_counter() - start) * 1000
+    finally:
+        client.close()
+
+
+def bench_warmup(base_url: str, connections: int = 4) -> float:
+    client = RobopostClient(apikey="benchmark", base_url=base_url, dns_cache=DNSCache())
+    try:
+        start = time.perf_counter()
+        client.warmup(n_connections=connections)
+        return (time.perf_counter() - start) * 1000
+    finally:
+        client.close()
+
+
+def bench_polling(stub: StubServer, client: RobopostClient, polls: int) -> float:
+    stub.config.polls_to_complete = polls
+    series = stub.seed_video_series(1)[0]
+    task = client.generate_video(series["id"])
+    start = time.perf_counter()
+    client.wait_for_video_completion(task.task_id, poll_interval=0, timeout=600)
+    return (time.perf_counter() - start) / polls * 1e6
+
+
+def run(scale: float = 1.0, repeats: int = 3) -> dict:
+    def n(value: int) -> int:
+        return max(1, int(value * scale))
+
+    with StubServer(StubConfig()) as stub:
+        client = RobopostClient(apikey="benchmark", base_url=stub.base_url)
+        profiled_client = RobopostClient(apikey="benchmark", base_url=stub.base_url,
+                                         profiler=Profiler(sample_rate=0.01, seed=0))
+        stub.seed_media(n(5000))
+        series_items = stub.seed_video_series(n(1000))
+        media_items = list(stub.media.values())
+        local_url = stub.base_url.replace(stub.host, "localhost")
+
+        upload_data = os.urandom(n(16) * 1024 * 1024)
+        with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as f:
+            f.write(upload_data)
+            upload_path = f.name
+
+        post_body = protocol.create_scheduled_posts(long_post()).body().encode()
+        gzipped_post_body = protocol.gzip_body(post_body, protocol.JSON_HEADERS, 0)[0]
+
+        try:
+            # Warm up connections and pydantic validators
+            client.list_media(limit=1)
+            bench_create_scheduled_posts(client, 5)
+            bench_create_scheduled_posts(profiled_client, 5)
+
+            plain_page_bytes = page_on_wire(stub, client, 100)
+            plain_page = median_of(repeats, lambda: bench_page(client, 100, n(200)))
+            stub.config.compress_min_size = 1024
+            gzip_page_bytes = page_on_wire(stub, client, 100)
+            gzip_page = median_of(repeats, lambda: bench_page(client, 100, n(200)))
+            stub.config.compress_min_size = None
+
+            results = {
+                "create_scheduled_posts": (
+                    median_of(repeats, lambda: bench_create_scheduled_posts(client, n(300))), "calls/s", "higher"),
+                "create_scheduled_posts (profiling 1%)": (
+                    median_of(repeats, lambda: bench_create_scheduled_posts(profiled_client, n(300))), "calls/s",
+                    "higher"),
+                "list_media pagination (100/page)": (
+                    median_of(repeats, lambda: bench_pagination(client, 100)), "items/s", "higher"),
+                "upload_media": (median_of(repeats, lambda: bench_upload(client, upload_path)), "MB/s", "higher"),
+                "upload_media from bytes": (
+                    median_of(repeats, lambda: bench_upload_buffer(client, upload_data)), "MB/s", "higher"),
+                "parse PublicAPIGeneratedFacelessVideoSeriesRead": (
+                    median_of(repeats, lambda: bench_parse(PublicAPIGeneratedFacelessVideoSeriesRead, series_items)),
+                    "us/item", "lower"),
+                "parse PublicAPIMediaRead": (
+                    median_of(repeats, lambda: bench_parse(PublicAPIMediaRead, media_items)), "us/item", "lower"),
+                "protocol encode create_scheduled_posts": (
+                    median_of(repeats, lambda: bench_encode(n(2000))), "us/call", "lower"),
+                "protocol decode list_media": (
+                    median_of(repeats, lambda: bench_decode(media_items)), "us/item", "lower"),
+                "startup: 4 first calls (cold)": (
+                    median_of(repeats * 5, lambda: bench_first_calls(local_url, warm=False)), "ms", "lower"),
+                "startup: 4 first calls (after warmup)": (
+                    median_of(repeats * 5, lambda: bench_first_calls(local_url, warm=True)), "ms", "lower"),
+                "startup: warmup(4)": (median_of(repeats * 5, lambda: bench_warmup(local_url)), "ms", "lower"),
+                "compression: long post body (plain)": (len(post_body), "bytes", "lower"),
+                "compression: long post body (gzip)": (len(gzipped_post_body), "bytes", "lower"),
+                "compression: gzip long post body": (
+                    median_of(repeats, lambda: bench_gzip(post_body, n(500))), "us/call", "lower"),
+                "compression: list_media page of 100 on wire (plain)": (plain_page_bytes, "bytes", "lower"),
+                "compression: list_media page of 100 on wire (gzip)": (gzip_page_bytes, "bytes", "lower"),
+                "compression: list_media page of 100 (plain)": (plain_page, "us/page", "lower"),
+                "compression: list_media page of 100 (gzip)": (gzip_page, "us/page", "lower"),
+                "wait_for_video_completion poll": (
+                    median_of(repeats, lambda: bench_polling(stub, client, n(200))), "us/poll", "lower"),
+            }
+        finally:
+            os.unlink(upload_path)
+
+    return {
+        name: {"value": round(value, 3), "unit": unit, "better": better}
+        for name, (value, unit, better) in results.items()
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier of the number of calls and items")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per metric; the median is reported")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="Allowed relative slowdown")
+    parser.add_argument("--update", action="store_true", help="Store results as the new baseline")
+    args = parser.parse_args(argv)
+
+    results = run(args.scale, args.repeats)
+    if args.update:
+        save_baselines(SUITE, results)
+        regressions = []
+    else:
+        regressions = compare(SUITE, results, args.tolerance)
+
+    report(SUITE, results, regressions)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
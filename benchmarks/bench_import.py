@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for robopost_client.
+
+Each scenario runs in a fresh interpreter so nothing is cached between runs.
+The median of several runs is reported in milliseconds.
+
+    python benchmarks/bench_import.py            # measure and compare with baselines.json
+    python benchmarks/bench_import.py --update   # store the current figures as the baseline
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from baseline import compare, report, save_baselines  # noqa: E402
+
+SUITE = "import"
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    "import robopost_client": "import robopost_client",
+    "import enums": "from robopost_client import AIVoice, VideoColor",
+    "import models": "from robopost_client import PublicAPIGeneratedFacelessVideoSeriesCreate",
+    "import client": "from robopost_client import RobopostClient",
+    "first model instance": (
+        "from robopost_client import PublicAPIScheduledPostCreateHTTPPayload;"
+        "PublicAPIScheduledPostCreateHTTPPayload(text='x')"
+    ),
+}
+
+TIMER = (
+    "import time; _start = time.perf_counter()\n"
+    "{statement}\n"
+    "print((time.perf_counter() - _start) * 1000)"
+)
+
+
+def measure(statement: str, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, "-c", TIMER.format(statement=statement)],
+            cwd=ROOT,
+        )
+        samples.append(float(output.decode().strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def run(runs: int = 7) -> dict:
+    return {
+        name: {"value": round(measure(statement, runs), 3), "unit": "ms", "better": "lower"}
+        for name, statement in SCENARIOS.items()
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=7, help="Interpreter launches per scenario")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed relative slowdown")
+    parser.add_argument("--update", action="store_true", help="Store results as the new baseline")
+    args = parser.parse_args(argv)
+
+    results = run(args.runs)
+    if args.update:
+        save_baselines(SUITE, results)
+        regressions = []
+    else:
+        regressions = compare(SUITE, results, args.tolerance, min_delta=2.0)
+
+    report(SUITE, results, regressions)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+import sys
+
+from .robopost_cli import main
+
+sys.exit(main())
@@ -0,0 +1,7 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class DeferredModel(BaseModel):
+    # Validators are built on first use instead of at import time, which keeps
+    # importing the package cheap for short-lived processes.
+    model_config = ConfigDict(defer_build=True)
@@ -0,0 +1,42 @@
+import logging
+import os
+import weakref
+from typing import Any, List
+
+logger = logging.getLogger(__name__)
+
+# Objects whose _reset_after_fork() runs in the child of every fork
+_instances: "weakref.WeakSet" = weakref.WeakSet()
+# Resources inherited from the parent that the child must neither use nor close
+_abandoned: List[Any] = []
+
+
+def register(obj: Any) -> None:
+    """
+    Have obj._reset_after_fork() called in the child process after os.fork().
+
+    The child starts with a single thread, so anything tied to the parent's
+    threads or file descriptors has to be replaced there: locks that another
+    thread may have held at the time of the fork, pooled sockets the parent
+    keeps using, SQLite connections, executors and worker threads. The method
+    runs before any other code in the child and must keep the object's
+    configuration intact.
+    """
+    _instances.add(obj)
+
+
+def abandon(resource: Any) -> None:
+    """Keep a resource inherited from the parent referenced, so the child never closes it"""
+    _abandoned.append(resource)
+
+
+def _after_fork_in_child() -> None:
+    for obj in list(_instances):
+        try:
+            obj._reset_after_fork()
+        except Exception:
+            logger.exception("Resetting %r after fork failed", obj)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -0,0 +1,349 @@
+import abc
+import asyncio
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from . import protocol
+from .enums import GeneratedFacelessVideoProcessState
+from .models import (
+    PublicAPIGeneratedFacelessVideoSeriesCreate,
+    PublicAPIGeneratedFacelessVideoSeriesRead,
+    PublicAPIGeneratedFacelessVideoSeriesUpdate,
+    PublicAPIMediaRead,
+    PublicAPIScheduledPostCreateHTTPPayload,
+    PublicAPIScheduledPostRead,
+    PublicAPIVideoTaskResponse,
+)
+from .protocol import Body, RequestSpec
+
+
+# ---------------------------------------------------------
+# Transports
+# ---------------------------------------------------------
+class AsyncTransport(abc.ABC):
+    """
+    Sends one HTTP request for an AsyncRobopostClient.
+
+    Subclass it to plug in any asyncio HTTP library; `send` only has to move
+    bytes, since building requests and parsing responses is done by the client.
+    Upload bodies are MultipartBody iterables of chunks, with their size in `len`
+    when known; `bytes(body)` joins them for libraries that cannot stream.
+    """
+
+    @abc.abstractmethod
+    async def send(self, method: str, url: str, params: Dict[str, Any], headers: Optional[Dict[str, str]],
+                   body: Optional[Body]) -> Tuple[int, bytes]:
+        """
+        :return: Tuple of (status code, response body)
+        """
+
+    async def aclose(self) -> None:
+        pass
+
+
+class ThreadedTransport(AsyncTransport):
+    """
+    Default transport: runs a pooled requests Session in worker threads, so it
+    needs no extra dependencies.
+    """
+
+    def __init__(self, pool_maxsize: int = 32):
+        """
+        :param pool_maxsize: Maximum number of keep-alive connections kept per host
+        """
+        import requests
+
+        from .instrumentation import InstrumentedAdapter
+
+        self.session = requests.Session()
+        adapter = InstrumentedAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _send(self, method, url, params, headers, body) -> Tuple[int, bytes]:
+        response = self.session.request(method, url, params=params, headers=headers, data=body)
+        return response.status_code, response.content
+
+    async def send(self, method, url, params, headers, body) -> Tuple[int, bytes]:
+        return await asyncio.to_thread(self._send, method, url, params, headers, body)
+
+    async def aclose(self) -> None:
+        self.session.close()
+
+
+# ---------------------------------------------------------
+# Async Client
+# ---------------------------------------------------------
+class AsyncRobopostClient:
+    """
+    asyncio counterpart of RobopostClient.
+
+    Every endpoint of robopost_client.protocol is available as a coroutine method
+    with the same name and arguments as on RobopostClient:
+
+        async with AsyncRobopostClient(apikey="YOUR_API_KEY") as client:
+            media = await client.list_media(limit=20)
+
+    Requests are built and responses parsed by the shared protocol core; the
+    transport only moves bytes, so another HTTP library can be used by passing
+    an AsyncTransport subclass.
+    """
+
+    def __init__(
+            self,
+            apikey: str,
+            base_url: str = "https://public-api.robopost.app/v1",
+            transport: Optional[AsyncTransport] = None,
+            compress_min_size: Optional[int] = None
+    ):
+        """
+        :param apikey: Robopost API key
+        :param base_url: Base URL of the public API
+        :param transport: Transport sending the requests; a ThreadedTransport by default
+        :param compress_min_size: Optional size in bytes from which JSON request bodies are sent gzipped
+        """
+        self.apikey = apikey
+        self.base_url = base_url
+        self.transport = transport or ThreadedTransport()
+        self.compress_min_size = compress_min_size
+
+    async def request(self, spec: RequestSpec) -> Any:
+        """
+        Send a RequestSpec and parse its response.
+
+        :param spec: Spec built by one of the robopost_client.protocol endpoint functions
+        :return: Parsed result of the call
+        """
+        body, headers = spec.body(), spec.headers
+        if self.compress_min_size is not None:
+            body, headers = protocol.gzip_body(body, headers, self.compress_min_size)
+        status, data = await self.transport.send(spec.method, spec.url(self.base_url), spec.query(self.apikey),
+                                                 headers, body)
+        return protocol.parse_response(spec, status, data)
+
+    # ---------------------------------------------------------
+    # Media Methods
+    # ---------------------------------------------------------
+    async def upload_media(self, file: Union[str, os.PathLike, protocol.MediaContent], filename: Optional[str] = None,
+                           content_type: Optional[str] = None, size: Optional[int] = None) -> PublicAPIMediaRead:
+        """
+        Upload an image or video, from a local file or from memory.
+
+        Takes the same arguments as RobopostClient.upload_media. The body is
+        streamed by the transport; the default one reads files in a worker thread.
+
+        :param file: Path to a local file, bytes or another buffer, a binary file object,
+            or an iterable of byte chunks.
+        :param filename: File name reported to the API; defaults to the name of the path or file object.
+        :param content_type: Optional MIME type of the media.
+        :param size: Content size in bytes of an iterable.
+        :return: A PublicAPIMediaRead instance containing the uploaded media info.
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "rb") as f:
+                return await self.request(protocol.upload_media(filename or os.path.basename(file), f,
+                                                                content_type, size))
+        return await self.request(protocol.upload_media(protocol.media_filename(file, filename), file,
+                                                        content_type, size))
+
+    async def list_media(self, skip: int = 0, limit: int = 50) -> List[PublicAPIMediaRead]:
+        """
+        Get a list of uploaded media files.
+
+        :param skip: Number of items to skip (pagination)
+        :param limit: Maximum number of items to return
+        :return: List of PublicAPIMediaRead instances
+        """
+        return await self.request(protocol.list_media(skip, limit))
+
+    async def get_media(self, media_id: str) -> PublicAPIMediaRead:
+        """
+        Get a specific media file by ID.
+
+        :param media_id: ID of the media file
+        :return: PublicAPIMediaRead instance
+        """
+        return await self.request(protocol.get_media(media_id))
+
+    async def delete_media(self, media_id: str) -> dict:
+        """
+        Delete a media file.
+
+        :param media_id: ID of the media file to delete
+        :return: Success message
+        """
+        return await self.request(protocol.delete_media(media_id))
+
+    # ---------------------------------------------------------
+    # Scheduled Posts Methods
+    # ---------------------------------------------------------
+    async def create_scheduled_posts(
+            self,
+            payload: PublicAPIScheduledPostCreateHTTPPayload,
+    ) -> List[PublicAPIScheduledPostRead]:
+        """
+        Create new scheduled posts or drafts.
+
+        :param payload: A PublicAPIScheduledPostCreateHTTPPayload instance with post details.
+        :return: A list of PublicAPIScheduledPostRead instances.
+        """
+        return await self.request(protocol.create_scheduled_posts(payload))
+
+    # ---------------------------------------------------------
+    # Video Series Methods
+    # ---------------------------------------------------------
+    async def create_video_series(
+            self,
+            payload: PublicAPIGeneratedFacelessVideoSeriesCreate
+    ) -> PublicAPIGeneratedFacelessVideoSeriesRead:
+        """
+        Create a new faceless video series.
+
+        :param payload: Video series configuration
+        :return: Created video series
+        """
+        return await self.request(protocol.create_video_series(payload))
+
+    async def list_video_series(
+            self,
+            search_text: Optional[str] = None,
+            skip: int = 0,
+            limit: int = 10,
+            sort_by_field: str = "created_at",
+            sort_order: str = "desc"
+    ) -> List[PublicAPIGeneratedFacelessVideoSeriesRead]:
+        """
+        List video series with optional filtering and pagination.
+
+        :param search_text: Search in series names
+        :param skip: Number of items to skip
+        :param limit: Maximum number of items to return
+        :param sort_by_field: Field to sort by
+        :param sort_order: Sort order ('asc' or 'desc')
+        :return: List of video series
+        """
+        return await self.request(protocol.list_video_series(search_text, skip, limit, sort_by_field, sort_order))
+
+    async def get_video_series(self, series_id: str) -> PublicAPIGeneratedFacelessVideoSeriesRead:
+        """
+        Get a specific video series by ID.
+
+        :param series_id: ID of the video series
+        :return: Video series details
+        """
+        return await self.request(protocol.get_video_series(series_id))
+
+    async def update_video_series(
+            self,
+            series_id: str,
+            payload: PublicAPIGeneratedFacelessVideoSeriesUpdate
+    ) -> PublicAPIGeneratedFacelessVideoSeriesRead:
+        """
+        Update an existing video series.
+
+        :param series_id: ID of the video series to update
+        :param payload: Update data
+        :return: Updated video series
+        """
+        return await self.request(protocol.update_video_series(series_id, payload))
+
+    async def delete_video_series(self, series_id: str) -> dict:
+        """
+        Delete a video series (soft delete).
+
+        :param series_id: ID of the video series to delete
+        :return: Success message
+        """
+        return await self.request(protocol.delete_video_series(series_id))
+
+    # ---------------------------------------------------------
+    # Video Tasks Methods
+    # ---------------------------------------------------------
+    async def generate_video(self, series_id: str) -> PublicAPIVideoTaskResponse:
+        """
+        Generate a new video from the specified video series.
+
+        :param series_id: ID of the video series to generate from
+        :return: Video generation task details
+        """
+        return await self.request(protocol.generate_video(series_id))
+
+    async def get_video_task(self, task_id: str) -> PublicAPIVideoTaskResponse:
+        """
+        Get the status and details of a video generation task.
+
+        :param task_id: ID of the video generation task
+        :return: Task status and details
+        """
+        return await self.request(protocol.get_video_task(task_id))
+
+    async def list_video_tasks(
+            self,
+            series_id: Optional[str] = None,
+            status: Optional[GeneratedFacelessVideoProcessState] = None,
+            skip: int = 0,
+            limit: int = 10,
+            sort_order: str = "desc"
+    ) -> List[PublicAPIVideoTaskResponse]:
+        """
+        List video generation tasks with optional filtering.
+
+        :param series_id: Filter by video series ID
+        :param status: Filter by task status
+        :param skip: Number of items to skip
+        :param limit: Maximum number of items to return
+        :param sort_order: Sort order ('asc' or 'desc')
+        :return: List of video tasks
+        """
+        return await self.request(protocol.list_video_tasks(series_id, status, skip, limit, sort_order))
+
+    async def get_video_task_details(self, task_id: str) -> dict:
+        """
+        Get detailed information about a video generation task.
+
+        :param task_id: ID of the video generation task
+        :return: Detailed task information including errors and results
+        """
+        return await self.request(protocol.get_video_task_details(task_id))
+
+    async def cancel_video_task(self, task_id: str) -> dict:
+        """
+        Cancel a video generation task.
+
+        :param task_id: ID of the video generation task to cancel
+        :return: Success message
+        """
+        return await self.request(protocol.cancel_video_task(task_id))
+
+    # ---------------------------------------------------------
+    # Convenience Methods
+    # ---------------------------------------------------------
+    async def wait_for_video_completion(self, task_id: str, poll_interval: float = 10,
+                                        timeout: float = 300) -> PublicAPIVideoTaskResponse:
+        """
+        Wait for a video generation task to complete.
+
+        :param task_id: ID of the video generation task
+        :param poll_interval: Seconds to wait between status checks
+        :param timeout: Maximum seconds to wait before timing out
+        :return: Final task status
+        :raises: TimeoutError if task doesn't complete within timeout
+        """
+        start_time = time.monotonic()
+        while time.monotonic() - start_time < timeout:
+            task = await self.get_video_task(task_id)
+            if task.status in ["COMPLETE", "ERROR", "NO_CREDITS"]:
+                return task
+            await asyncio.sleep(poll_interval)
+
+        raise TimeoutError(f"Video generation task {task_id} did not complete within {timeout} seconds")
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    async def __aenter__(self) -> "AsyncRobopostClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
@@ -0,0 +1,187 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+from pydantic import Field
+
+from . import _forksafe
+from ._base import DeferredModel
+
+
+# Resource types that can be cached by RobopostClient, keyed by the ID used to fetch them.
+CACHEABLE_RESOURCES = ("video_series", "media", "video_task_details")
+
+_MISSING = object()
+
+
+class CacheConfig(DeferredModel):
+    """Configuration of the read cache for a single resource type"""
+    maxsize: int = Field(default=1024, ge=1, description="Maximum number of entries kept")
+    ttl: float = Field(default=60.0, gt=0, description="Seconds an entry stays valid")
+
+
+class CacheStats(DeferredModel):
+    """Snapshot of the counters of a single cache"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = Field(0, description="Entries dropped to stay within maxsize")
+    expirations: int = Field(0, description="Entries dropped because their TTL elapsed")
+    invalidations: int = Field(0, description="Entries dropped by mutating calls")
+    size: int = 0
+    maxsize: int = 0
+    saved_seconds: float = Field(0.0, description="Estimated request time saved by hits")
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory cache with LRU eviction and a per-entry time to live.
+
+    Cached values are shared between callers and should be treated as read-only.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+        self._load_seconds = 0.0
+        # Loads in flight per key, and how often the key was deleted during them;
+        # a load whose key was deleted meanwhile returns its value without storing it.
+        self._loading: Dict[Hashable, int] = {}
+        self._generations: Dict[Hashable, int] = {}
+        self._epoch = 0
+        _forksafe.register(self)
+
+    def _reset_after_fork(self) -> None:
+        # Entries stay valid in the child; only the lock may have been held by another thread.
+        # Loads in flight belong to the parent's threads.
+        self._lock = threading.Lock()
+        self._loading = {}
+        self._generations = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value = self._lookup(key)
+            if value is _MISSING:
+                self._misses += 1
+                return default
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._store(key, value)
+
+    def delete(self, key: Hashable) -> bool:
+        with self._lock:
+            if key in self._loading:
+                self._generations[key] = self._generations.get(key, 0) + 1
+            if self._data.pop(key, None) is None:
+                return False
+            self._invalidations += 1
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._epoch += 1
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, calling loader on a miss and storing its result.
+
+        The time spent in loader is tracked to estimate the latency saved by hits.
+        If the key is deleted or the cache cleared while loader runs, the loaded
+        value may predate that change and is returned without being stored.
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is not _MISSING:
+                self._hits += 1
+                return value
+            self._misses += 1
+            self._loading[key] = self._loading.get(key, 0) + 1
+            generation = (self._epoch, self._generations.get(key, 0))
+
+        start = time.perf_counter()
+        try:
+            value = loader()
+        except BaseException:
+            with self._lock:
+                self._finish_load(key)
+            raise
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self._load_seconds += elapsed
+            current = (self._epoch, self._generations.get(key, 0))
+            self._finish_load(key)
+            if current == generation:
+                self._store(key, value)
+        return value
+
+    def _finish_load(self, key: Hashable) -> None:
+        # Must be called with the lock held
+        remaining = self._loading.get(key, 1) - 1
+        if remaining:
+            self._loading[key] = remaining
+        else:
+            self._loading.pop(key, None)
+            self._generations.pop(key, None)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            avg_load = self._load_seconds / self._misses if self._misses else 0.0
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                invalidations=self._invalidations,
+                size=len(self._data),
+                maxsize=self.maxsize,
+                saved_seconds=self._hits * avg_load,
+            )
+
+    def keys(self) -> list:
+        """Keys currently stored, including entries whose TTL has elapsed but were not dropped yet"""
+        with self._lock:
+            return list(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        # Must be called with the lock held
+        self._data[key] = (self._clock() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self._evictions += 1
+
+    def _lookup(self, key: Hashable) -> Any:
+        # Must be called with the lock held
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._data[key]
+            self._expirations += 1
+            return _MISSING
+
+        self._data.move_to_end(key)
+        return value
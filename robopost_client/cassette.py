@@ -0,0 +1,326 @@
+import base64
+import functools
+import gzip
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from pydantic import Field
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from . import _forksafe
+from ._base import DeferredModel
+from .instrumentation import InstrumentedAdapter, body_size
+from .metrics import endpoint_template
+
+SCRUBBED = "<scrubbed>"
+DEFAULT_SCRUB_PARAMS = ("apikey",)
+DEFAULT_SCRUB_HEADERS = ("Authorization", "Cookie", "Set-Cookie")
+# The body is stored decoded, so its transfer headers no longer apply
+_TRANSFER_HEADERS = ("content-encoding", "transfer-encoding", "content-length")
+
+
+class Interaction(DeferredModel):
+    """A recorded request/response pair"""
+    method: str
+    path: str = Field(..., description="Request path and scrubbed query string")
+    request_bytes: Optional[int] = Field(None, description="Request body size")
+    request_body: Optional[str] = Field(
+        None, description="Request body before compression; None for streamed uploads or when not recorded"
+    )
+    request_body_encoding: str = Field("utf-8", description='"utf-8" or "base64"')
+    status: int
+    reason: str = ""
+    headers: Dict[str, str] = Field(default_factory=dict)
+    body: str = ""
+    body_encoding: str = Field("utf-8", description='"utf-8" or "base64"')
+    elapsed: float = Field(0.0, description="Seconds from sending the request to receiving the body")
+    offset: float = Field(0.0, description="Seconds since the recording started")
+
+    def content(self) -> bytes:
+        return _decode(self.body, self.body_encoding)
+
+    def request_content(self) -> Optional[bytes]:
+        """The recorded request body, or None if it was not recorded"""
+        if self.request_body is None:
+            return None
+        return _decode(self.request_body, self.request_body_encoding)
+
+
+def _encode(content: bytes) -> Tuple[str, str]:
+    try:
+        return content.decode("utf-8"), "utf-8"
+    except UnicodeDecodeError:
+        return base64.b64encode(content).decode("ascii"), "base64"
+
+
+def _decode(text: str, encoding: str) -> bytes:
+    if encoding == "base64":
+        return base64.b64decode(text)
+    return text.encode("utf-8")
+
+
+def _request_body(request: PreparedRequest) -> Optional[bytes]:
+    """Body of a prepared request as the server decodes it, or None for streamed bodies"""
+    body = request.body
+    if body is None:
+        return b""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    if not isinstance(body, (bytes, bytearray, memoryview)):
+        # Streamed uploads are read by the transport once; they are not buffered for the cassette
+        return None
+    body = bytes(body)
+    if request.headers.get("Content-Encoding", "").lower() == "gzip":
+        body = gzip.decompress(body)
+    return body
+
+
+class _RecordedResponse(Response):
+    """Response that is written to the cassette once its body has been read"""
+
+    @property
+    def content(self):
+        content = super().content
+        record = self.__dict__.pop("_robopost_record", None)
+        if record is not None:
+            record(self)
+        return content
+
+
+def scrub_path(url: str, scrub_params: Sequence[str] = DEFAULT_SCRUB_PARAMS) -> str:
+    """Path and query of a URL, with secret query parameters replaced"""
+    parts = urlsplit(url)
+    query = [(k, SCRUBBED if k in scrub_params else v) for k, v in parse_qsl(parts.query, keep_blank_values=True)]
+    return parts.path + ("?" + urlencode(sorted(query)) if query else "")
+
+
+def load_cassette(path: str) -> List[Interaction]:
+    """Read all interactions of a gzip-compressed JSON Lines cassette"""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [Interaction.model_validate_json(line) for line in f if line.strip()]
+
+
+# ---------------------------------------------------------
+# Recording
+# ---------------------------------------------------------
+class RecordingTransport(InstrumentedAdapter):
+    """
+    Transport adapter that sends requests normally and appends every exchange to
+    a cassette: gzip-compressed JSON Lines, one Interaction per line.
+
+    Secret query parameters (`apikey` by default) and headers are scrubbed before
+    anything is written. Request bodies are recorded uncompressed, except for
+    streamed uploads; `redact_body` can rewrite or drop them first. Pass it as
+    `transport=` to RobopostClient and close the client (or the transport) to
+    flush the file.
+
+    An exchange is written once its response body has been read, so a streamed
+    response keeps its time to first byte apart from the body transfer.
+    """
+
+    def __init__(
+            self,
+            path: str,
+            scrub_params: Iterable[str] = DEFAULT_SCRUB_PARAMS,
+            scrub_headers: Iterable[str] = DEFAULT_SCRUB_HEADERS,
+            record_request_bodies: bool = True,
+            redact_body: Optional[Callable[[bytes], Optional[bytes]]] = None,
+            **kwargs
+    ):
+        """
+        :param path: Cassette file; new interactions are appended to an existing file
+        :param scrub_params: Query parameters whose values are replaced before recording
+        :param scrub_headers: Response headers dropped before recording
+        :param record_request_bodies: Whether request bodies are written to the cassette
+        :param redact_body: Optional function returning the request body to record, or None to leave it out
+        :param kwargs: Passed on to HTTPAdapter (pool_connections, pool_maxsize, ...)
+        """
+        super().__init__(**kwargs)
+        self.path = path
+        self.scrub_params = tuple(scrub_params)
+        self.scrub_headers = {name.lower() for name in scrub_headers} | set(_TRANSFER_HEADERS)
+        self.record_request_bodies = record_request_bodies
+        self.redact_body = redact_body
+        self.recorded = 0
+        self._lock = threading.Lock()
+        self._file = None
+        self._started_at = time.monotonic()
+
+    def _reset_after_fork(self) -> None:
+        super()._reset_after_fork()
+        self._lock = threading.Lock()
+        if self._file is not None:
+            # The buffered, still compressed data belongs to the parent. Point the
+            # inherited descriptor at /dev/null so this copy can never flush it into
+            # the cassette; the child appends a gzip member of its own.
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, self._file.fileno())
+            os.close(devnull)
+            _forksafe.abandon(self._file)
+            self._file = None
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        start = time.monotonic()
+        response = super().send(request, **kwargs)
+        response.__class__ = _RecordedResponse
+        response._robopost_record = functools.partial(self._record, request, start)
+        return response
+
+    def _record(self, request: PreparedRequest, start: float, response: Response) -> None:
+        elapsed = time.monotonic() - start
+        body, encoding = _encode(response.content)
+
+        request_body = request_encoding = None
+        if self.record_request_bodies:
+            content = _request_body(request)
+            if content is not None and self.redact_body is not None:
+                content = self.redact_body(content)
+            if content is not None:
+                request_body, request_encoding = _encode(content)
+
+        interaction = Interaction(
+            method=request.method,
+            path=scrub_path(request.url, self.scrub_params),
+            request_bytes=body_size(request.body),
+            request_body=request_body,
+            request_body_encoding=request_encoding or "utf-8",
+            status=response.status_code,
+            reason=response.reason or "",
+            headers={k: v for k, v in response.headers.items() if k.lower() not in self.scrub_headers},
+            body=body,
+            body_encoding=encoding,
+            elapsed=elapsed,
+            offset=start - self._started_at,
+        )
+        line = interaction.model_dump_json() + "\n"
+
+        with self._lock:
+            if self._file is None:
+                self._file = gzip.open(self.path, "at", encoding="utf-8")
+            self._file.write(line)
+            self.recorded += 1
+
+    def close(self) -> None:
+        super().close()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+# ---------------------------------------------------------
+# Replay
+# ---------------------------------------------------------
+class ReplayTransport(BaseAdapter):
+    """
+    Transport adapter that answers requests from a cassette without touching the
+    network, reproducing the recorded response sizes and latencies.
+
+    A request is matched by method, path and query (secrets scrubbed); recorded
+    responses for the same request are returned in order. Unmatched requests fall
+    back to responses recorded for the same endpoint (IDs ignored) unless `strict`.
+
+    With `pace`, a response is also held back until as much time has passed since
+    the first replayed request as had passed between the recorded ones, so bursts
+    and pauses of the recording are kept when requests arrive faster than recorded.
+    """
+
+    def __init__(self, path: str, speed: Optional[float] = 1.0, loop: bool = True, strict: bool = False,
+                 scrub_params: Iterable[str] = DEFAULT_SCRUB_PARAMS, pace: bool = False):
+        """
+        :param path: Cassette written by RecordingTransport
+        :param speed: Replay speed multiplier; 2.0 halves recorded latencies, None or 0 replays without delay
+        :param loop: Start over once the responses recorded for a request are used up
+        :param strict: Raise LookupError instead of falling back to responses of the same endpoint
+        :param scrub_params: Query parameters scrubbed when the cassette was recorded
+        :param pace: Also replay the recorded request offsets, scaled by `speed`
+        """
+        super().__init__()
+        self.speed = speed
+        self.loop = loop
+        self.strict = strict
+        self.scrub_params = tuple(scrub_params)
+        self.pace = pace
+        self.interactions = load_cassette(path)
+        self.replayed = 0
+        self._first_offset = min((i.offset for i in self.interactions), default=0.0)
+        self._started_at: Optional[float] = None
+
+        self._lock = threading.Lock()
+        self._exact: Dict[Tuple[str, str], List[Interaction]] = {}
+        self._by_endpoint: Dict[Tuple[str, str], List[Interaction]] = {}
+        self._positions: Dict[Tuple[str, str, str], int] = {}
+        for interaction in self.interactions:
+            self._exact.setdefault((interaction.method, interaction.path), []).append(interaction)
+            endpoint = endpoint_template(interaction.path.split("?", 1)[0])
+            self._by_endpoint.setdefault((interaction.method, endpoint), []).append(interaction)
+        _forksafe.register(self)
+
+    def _reset_after_fork(self) -> None:
+        self._lock = threading.Lock()
+
+    def _next(self, kind: str, key: Tuple[str, str], candidates: List[Interaction]) -> Optional[Interaction]:
+        position_key = (kind,) + key
+        position = self._positions.get(position_key, 0)
+        if position >= len(candidates):
+            if not self.loop:
+                return None
+            position = 0
+        self._positions[position_key] = position + 1
+        return candidates[position]
+
+    def match(self, method: str, url: str) -> Interaction:
+        path = scrub_path(url, self.scrub_params)
+        key = (method, path)
+        with self._lock:
+            interaction = None
+            if key in self._exact:
+                interaction = self._next("exact", key, self._exact[key])
+            if interaction is None and not self.strict:
+                endpoint_key = (method, endpoint_template(path.split("?", 1)[0]))
+                if endpoint_key in self._by_endpoint:
+                    interaction = self._next("endpoint", endpoint_key, self._by_endpoint[endpoint_key])
+            if interaction is not None:
+                self.replayed += 1
+
+        if interaction is None:
+            raise LookupError(f"No recorded response for {method} {path}")
+        return interaction
+
+    def send(self, request: PreparedRequest, stream=False, timeout=None, verify=True, cert=None,
+             proxies=None) -> Response:
+        interaction = self.match(request.method, request.url)
+        if self.speed:
+            if self.pace:
+                self._wait_for_offset(interaction)
+            time.sleep(interaction.elapsed / self.speed)
+
+        response = Response()
+        response.status_code = interaction.status
+        response.reason = interaction.reason
+        response.headers = CaseInsensitiveDict(interaction.headers)
+        response._content = interaction.content()
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.encoding = "utf-8"
+        return response
+
+    def _wait_for_offset(self, interaction: Interaction) -> None:
+        """Sleep until the interaction's recorded offset, scaled by speed, has passed since the first request"""
+        now = time.monotonic()
+        with self._lock:
+            if self._started_at is None:
+                self._started_at = now
+            started_at = self._started_at
+        delay = started_at + (interaction.offset - self._first_offset) / self.speed - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,904 @@
+import logging
+import os
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from . import _forksafe, protocol
+from .cache import CACHEABLE_RESOURCES, CacheConfig, CacheStats, TTLCache
+from .enums import GeneratedFacelessVideoProcessState
+from .exceptions import RobopostPlanLimitError, RobopostQuotaExhaustedError
+from .instrumentation import (
+    InstrumentedAdapter,
+    RequestInfo,
+    body_size,
+    pop_connect_time,
+    reset_connect_time,
+    reset_pools,
+    wire_size,
+)
+from .models import (
+    PublicAPIGeneratedFacelessVideoSeriesCreate,
+    PublicAPIGeneratedFacelessVideoSeriesRead,
+    PublicAPIGeneratedFacelessVideoSeriesUpdate,
+    PublicAPIMediaRead,
+    PublicAPIScheduledPostCreateHTTPPayload,
+    PublicAPIScheduledPostRead,
+    PublicAPIVideoTaskResponse,
+)
+from .singleflight import SingleFlight, SingleFlightStats
+from .tracing import current_context, get_tracer, span, traced
+
+# Optional features are imported when they are used, so creating a plain client
+# does not load sqlite3, tracemalloc or thread pools it will never need
+if TYPE_CHECKING:
+    from .dns import DNSCache
+    from .hedging import HedgingPolicy
+    from .http_cache import DiskResponseCache
+    from .lanes import LaneStats, Priority, PriorityLanes
+    from .metrics import MetricsRegistry
+    from .profiling import MethodProfile, Profiler
+    from .quota import QuotaStats, QuotaTracker
+    from .shared_cache import SharedCache
+
+logger = logging.getLogger(__name__)
+
+# Public methods sampled by a Profiler
+PROFILED_METHODS = (*protocol.ENDPOINTS, "wait_for_video_completion", "create_video_series_and_generate")
+
+
+def _profiler_from_env() -> Optional["Profiler"]:
+    """Profiler.from_env(), without importing the profiler unless ROBOPOST_PROFILE is set"""
+    if not os.environ.get("ROBOPOST_PROFILE", "").strip():
+        return None
+    from .profiling import Profiler
+
+    return Profiler.from_env()
+
+
+# ---------------------------------------------------------
+# Robopost Client
+# ---------------------------------------------------------
+class RobopostClient:
+    """
+    A client to interact with the Robopost public API.
+
+    The API key is provided during initialization and passed as a query parameter
+    with every request.
+
+    An optional in-memory read cache can be enabled per resource type
+    ("video_series", "media", "video_task_details"). Cached entries are invalidated
+    automatically by the client's own update, delete and cancel calls. With a
+    SharedCache the read cache lives in a SQLite file shared by every process on
+    the host instead of in memory.
+
+    GET responses can additionally be kept in a DiskResponseCache that survives
+    restarts and is revalidated with ETag/Last-Modified when the server supplies them.
+
+    With coalesce_gets enabled, concurrent identical GETs from different threads share
+    a single in-flight request and its parsed result, and a HedgingPolicy can send a
+    duplicate of a slow GET to cut tail latency.
+
+    Requests share a pooled requests.Session. Before-request and after-response
+    hooks receive a RequestInfo with status, sizes and a timing breakdown
+    (connect, time to first byte, body transfer, JSON decode, model validation).
+    A MetricsRegistry collects request, error, latency and connection-pool metrics
+    from these hooks and renders them for Prometheus.
+
+    A client is safe to share between threads and should be: all threads then
+    reuse the same keep-alive connections. Caches, coalescing and metrics are
+    locked internally, arguments passed to the client are never modified, and
+    hooks may be added or removed while requests are in flight.
+
+    JSON request bodies above compress_min_size bytes can be sent gzipped.
+    Compressed responses are negotiated by requests (Accept-Encoding: gzip,
+    deflate) and decoded transparently; RequestInfo reports both sizes.
+
+    A client created before os.fork() (e.g. in a prefork server's master process)
+    can be used in the children: each child drops the inherited connections,
+    locks, SQLite handles and background threads and starts with fresh ones,
+    keeping the configuration and cached entries.
+
+    With PriorityLanes, requests wait for a slot in the lane selected with
+    use_priority() (interactive, normal or bulk), so a bulk backlog cannot take
+    the connections reserved for interactive calls. A QuotaTracker remembers
+    plan limits reported by the API and fails calls locally once a limit is
+    known to be reached.
+
+    A Profiler (or the ROBOPOST_PROFILE environment variable) samples the wall
+    and CPU time of client methods, split into encoding, connecting, waiting,
+    transfer, JSON decoding and model validation.
+    """
+
+    def __init__(
+            self,
+            apikey: str,
+            base_url: str = "https://public-api.robopost.app/v1",
+            cache: Optional[Dict[str, CacheConfig]] = None,
+            http_cache: Optional["DiskResponseCache"] = None,
+            coalesce_gets: bool = False,
+            hedging: Optional["HedgingPolicy"] = None,
+            pool_maxsize: int = 32,
+            metrics: Optional["MetricsRegistry"] = None,
+            transport: Optional[BaseAdapter] = None,
+            session: Optional[requests.Session] = None,
+            dns_cache: Optional["DNSCache"] = None,
+            priority_lanes: Optional["PriorityLanes"] = None,
+            quota: Optional["QuotaTracker"] = None,
+            shared_cache: Optional["SharedCache"] = None,
+            compress_min_size: Optional[int] = None,
+            profiler: Optional["Profiler"] = None
+    ):
+        """
+        :param apikey: Robopost API key
+        :param base_url: Base URL of the public API
+        :param cache: Optional read cache configuration per resource type
+        :param http_cache: Optional persistent cache for GET responses
+        :param coalesce_gets: Whether concurrent identical GETs share one request
+        :param hedging: Optional hedging policy applied to GET requests
+        :param pool_maxsize: Maximum number of keep-alive connections kept per host
+        :param metrics: Optional registry recording request metrics; may be shared between clients
+        :param transport: Optional requests transport adapter used instead of the default connection pool,
+            e.g. a RecordingTransport or ReplayTransport
+        :param session: Optional requests Session shared with other clients; its adapters are used
+            as they are, and close() leaves it open
+        :param dns_cache: Optional DNSCache resolving the API host for new pooled connections
+        :param priority_lanes: Optional PriorityLanes admitting requests by the priority set with use_priority()
+        :param quota: Optional QuotaTracker failing calls locally once a plan limit is known to be reached
+        :param shared_cache: Optional SharedCache storing the read cache in a file shared by processes,
+            instead of in memory
+        :param compress_min_size: Optional size in bytes from which JSON request bodies are sent gzipped
+            (Content-Encoding: gzip); the server must accept compressed requests
+        :param profiler: Optional Profiler sampling the client methods; may be shared between clients.
+            Defaults to Profiler.from_env(), i.e. profiling is enabled by ROBOPOST_PROFILE
+        """
+        self.apikey = apikey
+        self.base_url = base_url
+        self.http_cache = http_cache
+        self._caches: Dict[str, TTLCache] = {}
+        # Parsed models of cached HTTP bodies, keyed by (cache key, validator), so a 304
+        # skips JSON decoding and model validation as well as the body transfer.
+        self._parsed_responses = TTLCache(maxsize=1024, ttl=3600) if http_cache is not None else None
+        self._singleflight = SingleFlight() if coalesce_gets else None
+        self.hedging = hedging
+        self.priority_lanes = priority_lanes
+        self.quota = quota
+        self.compress_min_size = compress_min_size
+        self.before_request_hooks: List[Callable[[RequestInfo], None]] = []
+        self.after_response_hooks: List[Callable[[RequestInfo], None]] = []
+        # Hook lists are replaced rather than modified, so requests iterate over a stable snapshot
+        self._hooks_lock = threading.Lock()
+
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            adapter = transport or InstrumentedAdapter(pool_connections=4, pool_maxsize=pool_maxsize,
+                                                        dns_cache=dns_cache)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+        self.dns_cache = dns_cache
+
+        self.metrics = metrics
+        if metrics is not None:
+            self.add_before_request_hook(metrics.request_started)
+            self.add_after_response_hook(metrics.request_finished)
+            if self._owns_session:
+                # A weak reference lets a registry shared between clients outlive them
+                from .metrics import pool_samples
+
+                adapter_ref = weakref.ref(adapter)
+                metrics.add_collector(lambda: pool_samples(adapter_ref()))
+
+        for resource, config in (cache or {}).items():
+            if resource not in CACHEABLE_RESOURCES:
+                raise ValueError(f"Unknown cache resource {resource!r}, expected one of {CACHEABLE_RESOURCES}")
+            if shared_cache is not None:
+                self._caches[resource] = shared_cache.view(resource, f"{base_url} {apikey}", config.maxsize,
+                                                           config.ttl)
+            else:
+                self._caches[resource] = TTLCache(maxsize=config.maxsize, ttl=config.ttl)
+
+        self.profiler = profiler if profiler is not None else _profiler_from_env()
+        if self.profiler is not None:
+            for name in PROFILED_METHODS:
+                setattr(self, name, self.profiler.wrap(name, getattr(self, name)))
+        _forksafe.register(self)
+
+    def _reset_after_fork(self) -> None:
+        # Caches, coalescing, hedging, lanes, metrics and InstrumentedAdapters reset
+        # themselves; other pooling adapters mounted on the session are reset here.
+        self._hooks_lock = threading.Lock()
+        for adapter in self.session.adapters.values():
+            if isinstance(adapter, HTTPAdapter) and not isinstance(adapter, InstrumentedAdapter):
+                reset_pools(adapter)
+
+    # ---------------------------------------------------------
+    # Cache Methods
+    # ---------------------------------------------------------
+    def cache_stats(self) -> Dict[str, CacheStats]:
+        """
+        Get hit/miss/eviction counters for every enabled cache.
+
+        :return: Mapping of resource type to CacheStats
+        """
+        return {resource: cache.stats() for resource, cache in self._caches.items()}
+
+    def clear_cache(self, resource: Optional[str] = None) -> None:
+        """
+        Drop cached entries.
+
+        :param resource: Resource type to clear; all caches are cleared when omitted
+        """
+        for name, cache in self._caches.items():
+            if resource is None or name == resource:
+                cache.clear()
+
+    def priority_stats(self) -> Optional[Dict[str, "LaneStats"]]:
+        """
+        Get per-lane counters of request admission.
+
+        :return: Mapping of lane name to LaneStats, or None without priority_lanes
+        """
+        return self.priority_lanes.stats() if self.priority_lanes is not None else None
+
+    def quota_stats(self) -> Optional[Dict[str, "QuotaStats"]]:
+        """
+        Get the quota known for this client's API key, per endpoint group.
+
+        :return: Mapping of group name to QuotaStats, or None without a QuotaTracker
+        """
+        return self.quota.stats(self.apikey) if self.quota is not None else None
+
+    def profile_report(self) -> Optional[Dict[str, "MethodProfile"]]:
+        """
+        Get the profile sampled so far, per client method.
+
+        :return: Mapping of method name to MethodProfile, or None without a Profiler
+        """
+        return self.profiler.report() if self.profiler is not None else None
+
+    def coalescing_stats(self) -> Optional[SingleFlightStats]:
+        """
+        Get counters of GET request coalescing.
+
+        :return: SingleFlightStats, or None if coalesce_gets is disabled
+        """
+        return self._singleflight.stats() if self._singleflight is not None else None
+
+    # ---------------------------------------------------------
+    # Instrumentation Hooks
+    # ---------------------------------------------------------
+    def add_before_request_hook(self, hook: Callable[[RequestInfo], None]) -> None:
+        """
+        Register a function called with a RequestInfo before each request is sent.
+
+        :param hook: Callable receiving the RequestInfo of the call
+        """
+        with self._hooks_lock:
+            self.before_request_hooks = self.before_request_hooks + [hook]
+
+    def add_after_response_hook(self, hook: Callable[[RequestInfo], None]) -> None:
+        """
+        Register a function called with the completed RequestInfo after each call,
+        once the response has been decoded and validated (or has failed).
+
+        :param hook: Callable receiving the RequestInfo of the call
+        """
+        with self._hooks_lock:
+            self.after_response_hooks = self.after_response_hooks + [hook]
+
+    def remove_hook(self, hook: Callable[[RequestInfo], None]) -> None:
+        with self._hooks_lock:
+            self.before_request_hooks = [h for h in self.before_request_hooks if h != hook]
+            self.after_response_hooks = [h for h in self.after_response_hooks if h != hook]
+
+    # ---------------------------------------------------------
+    # Connections
+    # ---------------------------------------------------------
+    def warmup(self, n_connections: int = 4, timeout: Optional[float] = 10.0) -> int:
+        """
+        Resolve the API host and open keep-alive connections ahead of the first
+        calls, so they do not pay for DNS, TCP and TLS setup.
+
+        Connections are opened in parallel and parked in the pool. Only transports
+        built on InstrumentedAdapter (the default) can be warmed up; the host is
+        still resolved into the DNSCache for any other transport.
+
+        :param n_connections: Connections to open, capped by pool_maxsize
+        :param timeout: Connect timeout per connection in seconds
+        :return: Number of open connections to the API host in the pool
+        """
+        with span("robopost.warmup", {"robopost.n_connections": n_connections}):
+            url = self.base_url
+            if self.dns_cache is not None:
+                parts = urlsplit(url)
+                self.dns_cache.resolve(parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+
+            adapter = self.session.get_adapter(url)
+            if not isinstance(adapter, InstrumentedAdapter):
+                return 0
+            settings = self.session.merge_environment_settings(url, {}, None, None, None)
+            return adapter.warmup(url, n_connections, timeout, verify=settings["verify"], cert=settings["cert"],
+                                  proxies=settings["proxies"])
+
+    def metrics_text(self) -> str:
+        """
+        Render the client's metrics in the Prometheus text exposition format.
+
+        :return: Metrics text, empty if the client was created without a MetricsRegistry
+        """
+        return self.metrics.render() if self.metrics is not None else ""
+
+    def close(self) -> None:
+        """Close pooled connections and the transport (flushing a recorded cassette)"""
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> "RobopostClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _run_hooks(self, hooks: List[Callable[[RequestInfo], None]], info: RequestInfo) -> None:
+        for hook in hooks:
+            try:
+                hook(info)
+            except Exception:
+                logger.exception("Robopost client hook %r failed", hook)
+
+    def _cached(self, resource: str, key: str, loader):
+        cache = self._caches.get(resource)
+        if cache is None:
+            return loader()
+        return cache.get_or_load(key, loader)
+
+    def _invalidate(self, resource: str, key: str, read: protocol.RequestSpec) -> None:
+        """Drop a changed resource from the read cache, and its GET response `read` from the disk cache"""
+        cache = self._caches.get(resource)
+        if cache is not None:
+            cache.delete(key)
+        if self.http_cache is not None:
+            from .http_cache import cache_key
+
+            url = f"{self.base_url}/{read.path.lstrip('/')}"
+            self.http_cache.delete(cache_key(read.method, url, dict(read.params or (), apikey=self.apikey)))
+
+    def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """Make an HTTP request with error handling"""
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        # Copy, never update, the caller's params: they may be shared with other threads
+        params = dict(kwargs.get('params') or (), apikey=self.apikey)
+        kwargs['params'] = params
+
+        if method == "GET" and self.http_cache is not None:
+            from .http_cache import cache_key, resolve_cached
+
+            key = cache_key(method, url, params)
+
+            def send(headers):
+                return self._send(method, url, **dict(kwargs, headers=headers))
+
+            response, validator = resolve_cached(self.http_cache, key, send, kwargs.get('headers'))
+            if validator is not None:
+                response.robopost_cache_version = (key, validator)
+        else:
+            response = self._send(method, url, **kwargs)
+
+        # Handle API errors
+        if not response.ok:
+            raise protocol.error_response(response.status_code, response.content)
+
+        return response
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a single HTTP request, hedging idempotent GETs if a policy is configured"""
+        # Hedged attempts run on other threads, so the caller's lane and whether its
+        # call is sampled by the profiler are captured here
+        lane = None
+        if self.priority_lanes is not None:
+            from .lanes import current_priority
+
+            lane = current_priority()
+        timed = bool(self.after_response_hooks) or self._profiling()
+        if method != "GET" or self.hedging is None:
+            return self._attempt(method, url, 1, None, lane, timed, **kwargs)
+
+        attempts = []
+        # Hedged attempts run on pool threads; parent their spans explicitly
+        parent = current_context()
+
+        def attempt():
+            attempts.append(None)
+            return self._attempt(method, url, len(attempts), parent, lane, timed, **kwargs)
+
+        response = self.hedging.run(attempt)
+        response.robopost_attempts = len(attempts)
+        return response
+
+    def _attempt(self, method: str, url: str, number: int, parent, lane: Optional["Priority"] = None,
+                 timed: bool = False, **kwargs) -> requests.Response:
+        if lane is not None:
+            with self.priority_lanes.slot(lane):
+                return self._attempt(method, url, number, parent, None, timed, **kwargs)
+
+        if get_tracer() is None:
+            return self._transmit(method, url, timed, **kwargs)
+
+        attributes = {"http.request.method": method, "url.full": url, "robopost.attempt": number}
+        with span(method, attributes, context=parent) as current:
+            response = self._transmit(method, url, timed, **kwargs)
+            if current.is_recording():
+                current.set_attribute("http.response.status_code", response.status_code)
+                current.set_attribute("http.response.body.size", len(response.content))
+                sent = body_size(response.request.body)
+                if sent is not None:
+                    current.set_attribute("http.request.body.size", sent)
+            return response
+
+    def _transmit(self, method: str, url: str, timed: bool, **kwargs) -> requests.Response:
+        """
+        Send the request on this thread. With `timed`, the body is streamed so the
+        connect time, time to first byte and transfer can be told apart.
+        """
+        if not timed:
+            return self.session.request(method, url, **kwargs)
+
+        reset_connect_time()
+        start = time.perf_counter()
+        response = self.session.request(method, url, stream=True, **kwargs)
+        headers_at = time.perf_counter()
+        response.content
+        connect = pop_connect_time()
+        response.robopost_timing = (connect, headers_at - start - connect, time.perf_counter() - headers_at)
+        return response
+
+    def _call(self, method: str, endpoint: str, parse, encode: Optional[Callable[[], str]] = None, **kwargs):
+        """
+        Make a request and parse its JSON body with `parse`, running instrumentation
+        hooks and reusing parsed results of cached bodies. `encode` returns the
+        request body and is timed separately.
+        """
+        if not (self.before_request_hooks or self.after_response_hooks or self._profiling()):
+            if encode is not None:
+                self._encode_body(encode, kwargs)
+            response = self._make_request(method, endpoint, **kwargs)
+            version = getattr(response, "robopost_cache_version", None)
+            if version is None:
+                return parse(self._decode(response, parse))
+            return self._parsed_responses.get_or_load(version, lambda: parse(self._decode(response, parse)))
+
+        info = RequestInfo(method, endpoint, f"{self.base_url}/{endpoint.lstrip('/')}")
+        self._run_hooks(self.before_request_hooks, info)
+
+        if encode is not None:
+            start, cpu_start = time.perf_counter(), time.thread_time()
+            self._encode_body(encode, kwargs)
+            info.timing.encode = time.perf_counter() - start
+            info.timing.serialization_cpu = time.thread_time() - cpu_start
+
+        try:
+            response = self._make_request(method, endpoint, **kwargs)
+        except Exception as e:
+            info.error = e
+            info.status = getattr(e, "status_code", None)
+            self._finish_info(info)
+            raise
+
+        info.status = getattr(response, "status_code", None)
+        info.retries = getattr(response, "robopost_attempts", 1) - 1
+        request = getattr(response, "request", None)
+        info.bytes_sent = body_size(request.body) if request is not None else None
+        content = getattr(response, "content", None)
+        info.bytes_received = len(content) if content is not None else None
+        info.bytes_received_wire = wire_size(response)
+
+        timing = getattr(response, "robopost_timing", None)
+        if timing is not None:
+            info.timing.connect, info.timing.ttfb, info.timing.transfer = timing
+
+        version = getattr(response, "robopost_cache_version", None)
+        info.from_cache = getattr(response, "robopost_from_cache", False)
+
+        try:
+            if version is not None:
+                cached = self._parsed_responses.get(version)
+                if cached is not None:
+                    return cached
+
+            start, cpu_start = time.perf_counter(), time.thread_time()
+            data = self._decode(response, parse)
+            decoded_at = time.perf_counter()
+            result = parse(data) if self.profiler is None else self.profiler.build(parse, data)
+            info.timing.decode = decoded_at - start
+            info.timing.validate = time.perf_counter() - decoded_at
+            info.timing.serialization_cpu += time.thread_time() - cpu_start
+
+            if version is not None:
+                self._parsed_responses.set(version, result)
+            return result
+        except Exception as e:
+            info.error = e
+            raise
+        finally:
+            self._finish_info(info)
+
+    @staticmethod
+    def _decode(response: requests.Response, parse) -> Any:
+        """JSON of a successful response; an empty body is handled like protocol.parse_response does"""
+        try:
+            return response.json()
+        except ValueError:
+            if response.content:
+                raise
+            return protocol.decode_body(parse, response.status_code, response.content)
+
+    def _profiling(self) -> bool:
+        """Whether the call running on this thread is sampled by the profiler"""
+        return self.profiler is not None and self.profiler.current() is not None
+
+    def _encode_body(self, encode: Callable[[], protocol.Body], kwargs: dict) -> None:
+        body = encode()
+        if self.compress_min_size is not None:
+            body, headers = protocol.gzip_body(body, kwargs.get("headers"), self.compress_min_size)
+            if headers is not None:
+                kwargs["headers"] = headers
+        kwargs["data"] = body
+
+    def _finish_info(self, info: RequestInfo) -> None:
+        info.timing.total = time.perf_counter() - info._start
+        if self.profiler is not None:
+            self.profiler.record_request(info)
+        self._run_hooks(self.after_response_hooks, info)
+
+    def _execute(self, spec: protocol.RequestSpec):
+        """Send a RequestSpec through the session, coalescing GETs and running hooks"""
+        if self.quota is None:
+            return self._dispatch(spec)
+
+        group = self.quota.group_for(spec.method, spec.path)
+        if group is None:
+            result = self._dispatch(spec)
+            released = self.quota.release_group_for(spec.method, spec.path)
+            if released is not None:
+                self.quota.record_release(self.apikey, released)
+            return result
+
+        try:
+            self.quota.check(self.apikey, group)
+        except RobopostQuotaExhaustedError as e:
+            self._report_rejected(spec, e)
+            raise
+        try:
+            result = self._dispatch(spec)
+        except RobopostPlanLimitError as e:
+            self.quota.record_limit(self.apikey, group, e)
+            raise
+        except BaseException:
+            self.quota.record_error(self.apikey, group)
+            raise
+        self.quota.record_success(self.apikey, group, result)
+        return result
+
+    def _report_rejected(self, spec: protocol.RequestSpec, error: BaseException) -> None:
+        """Run the hooks for a call failed locally before anything was sent, so it is counted like other errors"""
+        if not (self.before_request_hooks or self.after_response_hooks or self._profiling()):
+            return
+        info = RequestInfo(spec.method, spec.path, f"{self.base_url}/{spec.path.lstrip('/')}")
+        self._run_hooks(self.before_request_hooks, info)
+        info.error = error
+        self._finish_info(info)
+
+    def _dispatch(self, spec: protocol.RequestSpec):
+        if spec.method == "GET":
+            return self._get(spec.path, spec.parse, spec.params)
+        if spec.headers:
+            return self._call(spec.method, spec.path, spec.parse, encode=spec.encode, headers=spec.headers)
+        return self._call(spec.method, spec.path, spec.parse, encode=spec.encode)
+
+    def _get(self, endpoint: str, parse, params: Optional[dict] = None):
+        """Make a GET request and parse its JSON body; identical concurrent GETs may be coalesced"""
+        if self._singleflight is None:
+            return self._call("GET", endpoint, parse, params=params)
+
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        return self._singleflight.do(key, lambda: self._call("GET", endpoint, parse, params=params))
+
+    # ---------------------------------------------------------
+    # Media Methods
+    # ---------------------------------------------------------
+    @traced("file", "filename", "content_type")
+    def upload_media(self, file: Union[str, os.PathLike, protocol.MediaContent], filename: Optional[str] = None,
+                     content_type: Optional[str] = None, size: Optional[int] = None) -> PublicAPIMediaRead:
+        """
+        Calls the POST /medias/upload endpoint to upload an image or video.
+
+        The content is streamed: files are read in blocks and buffers are sent
+        without being copied, so rendered media never has to go through a temp file.
+
+        :param file: Path to a local file, bytes or another buffer (bytearray, memoryview, ...),
+            a binary file object, or an iterable of byte chunks such as a generator.
+        :param filename: File name reported to the API; defaults to the name of the path or file object.
+        :param content_type: Optional MIME type of the media, e.g. "video/mp4".
+        :param size: Content size in bytes of an iterable, so it is sent with a Content-Length
+            rather than chunked.
+        :return: A PublicAPIMediaRead instance containing the uploaded media info.
+        :raises: ValueError if in-memory content is given without a filename
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "rb") as file_data:
+                return self._execute(protocol.upload_media(filename or os.path.basename(file), file_data,
+                                                           content_type, size))
+        return self._execute(protocol.upload_media(protocol.media_filename(file, filename), file, content_type, size))
+
+    @traced("skip", "limit")
+    def list_media(self, skip: int = 0, limit: int = 50) -> List[PublicAPIMediaRead]:
+        """
+        Get a list of uploaded media files.
+
+        :param skip: Number of items to skip (pagination)
+        :param limit: Maximum number of items to return
+        :return: List of PublicAPIMediaRead instances
+        """
+        return self._execute(protocol.list_media(skip, limit))
+
+    @traced("media_id")
+    def get_media(self, media_id: str) -> PublicAPIMediaRead:
+        """
+        Get a specific media file by ID.
+
+        :param media_id: ID of the media file
+        :return: PublicAPIMediaRead instance
+        """
+        def load():
+            return self._execute(protocol.get_media(media_id))
+
+        return self._cached("media", media_id, load)
+
+    @traced("media_id")
+    def delete_media(self, media_id: str) -> dict:
+        """
+        Delete a media file.
+
+        :param media_id: ID of the media file to delete
+        :return: Success message
+        """
+        result = self._execute(protocol.delete_media(media_id))
+        self._invalidate("media", media_id, protocol.get_media(media_id))
+        return result
+
+    # ---------------------------------------------------------
+    # Scheduled Posts Methods
+    # ---------------------------------------------------------
+    @traced()
+    def create_scheduled_posts(
+            self,
+            payload: PublicAPIScheduledPostCreateHTTPPayload,
+    ) -> List[PublicAPIScheduledPostRead]:
+        """
+        Calls the POST /scheduled_posts endpoint to create new scheduled posts or drafts.
+
+        :param payload: A PublicAPIScheduledPostCreateHTTPPayload instance with post details.
+        :return: A list of PublicAPIScheduledPostRead instances.
+        """
+        return self._execute(protocol.create_scheduled_posts(payload))
+
+    # ---------------------------------------------------------
+    # Video Series Methods
+    # ---------------------------------------------------------
+    @traced()
+    def create_video_series(self,
+                            payload: PublicAPIGeneratedFacelessVideoSeriesCreate) -> PublicAPIGeneratedFacelessVideoSeriesRead:
+        """
+        Create a new faceless video series.
+
+        :param payload: Video series configuration
+        :return: Created video series
+        """
+        return self._execute(protocol.create_video_series(payload))
+
+    @traced("skip", "limit")
+    def list_video_series(
+            self,
+            search_text: Optional[str] = None,
+            skip: int = 0,
+            limit: int = 10,
+            sort_by_field: str = "created_at",
+            sort_order: str = "desc"
+    ) -> List[PublicAPIGeneratedFacelessVideoSeriesRead]:
+        """
+        List video series with optional filtering and pagination.
+
+        :param search_text: Search in series names
+        :param skip: Number of items to skip
+        :param limit: Maximum number of items to return
+        :param sort_by_field: Field to sort by
+        :param sort_order: Sort order ('asc' or 'desc')
+        :return: List of video series
+        """
+        return self._execute(protocol.list_video_series(search_text, skip, limit, sort_by_field, sort_order))
+
+    @traced("series_id")
+    def get_video_series(self, series_id: str) -> PublicAPIGeneratedFacelessVideoSeriesRead:
+        """
+        Get a specific video series by ID.
+
+        :param series_id: ID of the video series
+        :return: Video series details
+        """
+        def load():
+            return self._execute(protocol.get_video_series(series_id))
+
+        return self._cached("video_series", series_id, load)
+
+    @traced("series_id")
+    def update_video_series(
+            self,
+            series_id: str,
+            payload: PublicAPIGeneratedFacelessVideoSeriesUpdate
+    ) -> PublicAPIGeneratedFacelessVideoSeriesRead:
+        """
+        Update an existing video series.
+
+        :param series_id: ID of the video series to update
+        :param payload: Update data
+        :return: Updated video series
+        """
+        result = self._execute(protocol.update_video_series(series_id, payload))
+        self._invalidate("video_series", series_id, protocol.get_video_series(series_id))
+
+        return result
+
+    @traced("series_id")
+    def delete_video_series(self, series_id: str) -> dict:
+        """
+        Delete a video series (soft delete).
+
+        :param series_id: ID of the video series to delete
+        :return: Success message
+        """
+        result = self._execute(protocol.delete_video_series(series_id))
+        self._invalidate("video_series", series_id, protocol.get_video_series(series_id))
+        return result
+
+    # ---------------------------------------------------------
+    # Video Tasks Methods
+    # ---------------------------------------------------------
+    @traced("series_id")
+    def generate_video(self, series_id: str) -> PublicAPIVideoTaskResponse:
+        """
+        Generate a new video from the specified video series.
+
+        :param series_id: ID of the video series to generate from
+        :return: Video generation task details
+        """
+        return self._execute(protocol.generate_video(series_id))
+
+    @traced("task_id")
+    def get_video_task(self, task_id: str) -> PublicAPIVideoTaskResponse:
+        """
+        Get the status and details of a video generation task.
+
+        :param task_id: ID of the video generation task
+        :return: Task status and details
+        """
+        return self._execute(protocol.get_video_task(task_id))
+
+    @traced("series_id", "skip", "limit")
+    def list_video_tasks(
+            self,
+            series_id: Optional[str] = None,
+            status: Optional[GeneratedFacelessVideoProcessState] = None,
+            skip: int = 0,
+            limit: int = 10,
+            sort_order: str = "desc"
+    ) -> List[PublicAPIVideoTaskResponse]:
+        """
+        List video generation tasks with optional filtering.
+
+        :param series_id: Filter by video series ID
+        :param status: Filter by task status
+        :param skip: Number of items to skip
+        :param limit: Maximum number of items to return
+        :param sort_order: Sort order ('asc' or 'desc')
+        :return: List of video tasks
+        """
+        return self._execute(protocol.list_video_tasks(series_id, status, skip, limit, sort_order))
+
+    @traced("task_id")
+    def get_video_task_details(self, task_id: str) -> dict:
+        """
+        Get detailed information about a video generation task.
+
+        :param task_id: ID of the video generation task
+        :return: Detailed task information including errors and results
+        """
+        def load():
+            return self._execute(protocol.get_video_task_details(task_id))
+
+        return self._cached("video_task_details", task_id, load)
+
+    @traced("task_id")
+    def cancel_video_task(self, task_id: str) -> dict:
+        """
+        Cancel a video generation task.
+
+        :param task_id: ID of the video generation task to cancel
+        :return: Success message
+        """
+        result = self._execute(protocol.cancel_video_task(task_id))
+        self._invalidate("video_task_details", task_id, protocol.get_video_task_details(task_id))
+        return result
+
+    # ---------------------------------------------------------
+    # Convenience Methods
+    # ---------------------------------------------------------
+    @traced("task_id", "poll_interval", "timeout")
+    def wait_for_video_completion(
+            self,
+            task_id: str,
+            poll_interval: int = 10,
+            timeout: int = 300
+    ) -> PublicAPIVideoTaskResponse:
+        """
+        Wait for a video generation task to complete.
+
+        :param task_id: ID of the video generation task
+        :param poll_interval: Seconds to wait between status checks
+        :param timeout: Maximum seconds to wait before timing out
+        :return: Final task status
+        :raises: TimeoutError if task doesn't complete within timeout
+        """
+        import time
+
+        start_time = time.time()
+        iteration = 0
+
+        while time.time() - start_time < timeout:
+            iteration += 1
+            with span("robopost.wait_for_video_completion.poll",
+                      {"robopost.task_id": task_id, "robopost.poll.iteration": iteration}) as poll:
+                task = self.get_video_task(task_id)
+                poll.set_attribute("robopost.task.status", task.status)
+
+            if task.status in ["COMPLETE", "ERROR", "NO_CREDITS"]:
+                return task
+
+            time.sleep(poll_interval)
+
+        raise TimeoutError(f"Video generation task {task_id} did not complete within {timeout} seconds")
+
+    @traced("wait_for_completion")
+    def create_video_series_and_generate(
+            self,
+            series_config: PublicAPIGeneratedFacelessVideoSeriesCreate,
+            wait_for_completion: bool = True,
+            poll_interval: int = 10,
+            timeout: int = 300
+    ) -> tuple[PublicAPIGeneratedFacelessVideoSeriesRead, PublicAPIVideoTaskResponse]:
+        """
+        Create a video series and immediately generate a video from it.
+
+        :param series_config: Video series configuration
+        :param wait_for_completion: Whether to wait for video generation to complete
+        :param poll_interval: Seconds between status checks if waiting
+        :param timeout: Maximum seconds to wait for completion
+        :return: Tuple of (created_series, task_result)
+        """
+        # Create the series
+        series = self.create_video_series(series_config)
+
+        # Generate a video
+        task = self.generate_video(series.id)
+
+        # Wait for completion if requested
+        if wait_for_completion:
+            task = self.wait_for_video_completion(task.task_id, poll_interval, timeout)
+
+        return series, task
@@ -0,0 +1,72 @@
+import ipaddress
+import socket
+from typing import Callable, List, Optional
+
+from .cache import CacheStats, TTLCache
+
+
+def _is_ip_address(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host.strip("[]"))
+    except ValueError:
+        return False
+    return True
+
+
+class DNSCache:
+    """
+    In-process cache of resolved host addresses with a time to live.
+
+    Connections opened by RobopostClient's connection pool look the API host up
+    here instead of calling the system resolver each time, which takes DNS off
+    the path of every new connection. Addresses are tried in the order the
+    resolver returned them; a host whose addresses all refuse connections is
+    dropped from the cache and resolved again on the next attempt.
+
+    One DNSCache may be shared by several clients.
+    """
+
+    def __init__(self, ttl: float = 300.0, maxsize: int = 256,
+                 resolver: Callable[..., list] = socket.getaddrinfo):
+        """
+        :param ttl: Seconds a resolved address list is reused
+        :param maxsize: Maximum number of (host, port) entries kept
+        :param resolver: getaddrinfo-compatible function used on a miss
+        """
+        self.ttl = ttl
+        self._resolver = resolver
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def resolve(self, host: str, port: int) -> List[str]:
+        """
+        Addresses of a host, from the cache or the resolver.
+
+        :param host: Host name; IP literals are returned as they are
+        :param port: Port, part of the cache key as getaddrinfo results may depend on it
+        :return: Addresses in resolver order, without duplicates
+        :raises: socket.gaierror if the host cannot be resolved
+        """
+        if _is_ip_address(host):
+            return [host]
+        return self._cache.get_or_load((host.lower(), port), lambda: self._lookup(host, port))
+
+    def _lookup(self, host: str, port: int) -> List[str]:
+        addresses = []
+        for _, _, _, _, sockaddr in self._resolver(host, port, 0, socket.SOCK_STREAM):
+            if sockaddr[0] not in addresses:
+                addresses.append(sockaddr[0])
+        if not addresses:
+            raise socket.gaierror(socket.EAI_NONAME, f"No addresses for {host}")
+        return addresses
+
+    def invalidate(self, host: Optional[str] = None, port: Optional[int] = None) -> None:
+        """Forget the addresses of a host (any port unless given), or of all hosts"""
+        if host is None:
+            self._cache.clear()
+            return
+        for key in self._cache.keys():
+            if key[0] == host.lower() and (port is None or key[1] == port):
+                self._cache.delete(key)
+
+    def stats(self) -> CacheStats:
+        return self._cache.stats()
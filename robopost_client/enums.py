@@ -0,0 +1,235 @@
+from enum import Enum
+
+
+# ---------------------------------------------------------
+# Enums
+# ---------------------------------------------------------
+class AIImageModel(Enum):
+    Z_IMAGE = "Z_IMAGE"
+    DALLE = "DALLE"
+    FLUX_SCHNELL = "FLUX_SCHNELL"
+    FLUX_DEV = "FLUX_DEV"
+    FLUX_PRO = "FLUX_PRO"
+
+
+class PostAIGenerateVoiceTone(Enum):
+    POLITE = "POLITE"
+    WITTY = "WITTY"
+    ENTHUSIASTIC = "ENTHUSIASTIC"
+    INFORMATIONAL = "INFORMATIONAL"
+    FUNNY = "FUNNY"
+    FORMAL = "FORMAL"
+    INFORMAL = "INFORMAL"
+    HUMOROUS = "HUMOROUS"
+    SERIOUS = "SERIOUS"
+    OPTIMISTIC = "OPTIMISTIC"
+    MOTIVATING = "MOTIVATING"
+    RESPECTFUL = "RESPECTFUL"
+    ASSERTIVE = "ASSERTIVE"
+    CONVERSATIONAL = "CONVERSATIONAL"
+    CASUAL = "CASUAL"
+    PROFESSIONAL = "PROFESSIONAL"
+    SMART = "SMART"
+    NOSTALGIC = "NOSTALGIC"
+    FRIENDLY = "FRIENDLY"
+
+
+class AutomationRecurInterval(Enum):
+    DAILY_SPECIFIC_TIME_SLOTS = "DAILY_SPECIFIC_TIME_SLOTS"
+    WEEKLY_SPECIFIC_TIME_SLOTS = "WEEKLY_SPECIFIC_TIME_SLOTS"
+    EVERY_3_HOURS = "EVERY_3_HOURS"
+    EVERY_6_HOURS = "EVERY_6_HOURS"
+    BI_DAILY = "BI_DAILY"  # every 12 hours
+    DAILY = "DAILY"
+    WEEKLY = "WEEKLY"
+    MONTHLY = "MONTHLY"
+    YEARLY = "YEARLY"
+
+
+# New Enums for Social Media Settings
+class FacebookPostType(str, Enum):
+    POST = "POST"
+    REELS = "REELS"
+
+
+class InstagramPostType(str, Enum):
+    POST = "POST"
+    REELS = "REELS"
+    STORIES = "STORIES"
+
+
+class WordpressPostType(str, Enum):
+    POST = "POST"
+    PAGE = "PAGE"
+
+
+class YoutubeVideoType(str, Enum):
+    VIDEO = "video"
+    SHORT = "short"
+
+
+class YoutubePrivacyStatus(str, Enum):
+    PUBLIC = "public"
+    PRIVATE = "private"
+    UNLISTED = "unlisted"
+
+
+class TikTokPrivacyLevel(str, Enum):
+    PUBLIC_TO_EVERYONE = "PUBLIC_TO_EVERYONE"
+
+
+class GMBPostTopicType(str, Enum):
+    STANDARD = "STANDARD"
+    OFFER = "OFFER"
+    EVENT = "EVENT"
+
+
+class GMBCTAButtonActionType(str, Enum):
+    ACTION_TYPE_UNSPECIFIED = "ACTION_TYPE_UNSPECIFIED"
+    BOOK = "BOOK"
+    ORDER = "ORDER"
+    SHOP = "SHOP"
+    LEARN_MORE = "LEARN_MORE"
+    SIGN_UP = "SIGN_UP"
+    CALL = "CALL"
+
+
+# Fixed Video Series Enums - matching the original comprehensive options
+class GeneratedFacelessVideoSeriesContentType(str, Enum):
+    RANDOM_AI_STORY = "RANDOM_AI_STORY"
+    SCARY_STORIES = "SCARY_STORIES"
+    BEDTIME_STORIES = "BEDTIME_STORIES"
+    INTERESTING_HISTORY = "INTERESTING_HISTORY"
+    URBAN_LEGENDS = "URBAN_LEGENDS"
+    MOTIVATIONAL = "MOTIVATIONAL"
+    FUN_FACTS = "FUN_FACTS"
+    LONG_FORM_JOKES = "LONG_FORM_JOKES"
+    LIFE_PRO_TIPS = "LIFE_PRO_TIPS"
+    ELI5 = "ELI5"
+    DID_YOU_KNOW = "DID_YOU_KNOW"
+    PHILOSOPHY = "PHILOSOPHY"
+    RECIPES = "RECIPES"
+    FITNESS = "FITNESS"
+    BEAUTY = "BEAUTY"
+    GROWTH_ADVICE = "GROWTH_ADVICE"
+    # custom
+    PRODUCT_MARKETING = "PRODUCT_MARKETING"
+    CUSTOM = "CUSTOM"
+    BLOG_ARTICLE = "BLOG_ARTICLE"
+
+
+class GeneratedFacelessVideoStyle(str, Enum):
+    DEFAULT = "DEFAULT"
+    REALISM = "REALISM"
+    IMPRESSIONISM = "IMPRESSIONISM"
+    SURREALISM = "SURREALISM"
+    ABSTRACT = "ABSTRACT"
+    ART_NOUVEAU = "ART_NOUVEAU"
+    CUBISM = "CUBISM"
+    POP_ART = "POP_ART"
+    FUTURISM = "FUTURISM"
+    FANTASY_CONCEPT_ART = "FANTASY_CONCEPT_ART"
+    MINIMALISM = "MINIMALISM"
+    WATERCOLOR = "WATERCOLOR"
+    GOTHIC_MEDIEVAL_ART = "GOTHIC_MEDIEVAL_ART"
+    ANIME = "ANIME"
+    COMIC = "COMIC"
+
+
+class ImageStyle(Enum):
+    DEFAULT = "DEFAULT"
+    REALISM = "REALISM"
+    IMPRESSIONISM = "IMPRESSIONISM"
+    SURREALISM = "SURREALISM"
+    ABSTRACT = "ABSTRACT"
+    ART_NOUVEAU = "ART_NOUVEAU"
+    CUBISM = "CUBISM"
+    POP_ART = "POP_ART"
+    FUTURISM = "FUTURISM"
+    FANTASY_CONCEPT_ART = "FANTASY_CONCEPT_ART"
+    MINIMALISM = "MINIMALISM"
+    WATERCOLOR = "WATERCOLOR"
+    GOTHIC_MEDIEVAL_ART = "GOTHIC_MEDIEVAL_ART"
+    ANIME = "ANIME"
+    COMIC = "COMIC"
+
+
+class GeneratedVideoFormat(str, Enum):
+    PORTRAIT = "PORTRAIT"
+    WIDESCREEN = "WIDESCREEN"
+    SQUARE = "SQUARE"
+
+
+class AIVoice(str, Enum):
+    CUSTOM = "CUSTOM"
+    ALICE = "ALICE"
+    BILL = "BILL"
+    SARAH = "SARAH"
+    BRIAN = "BRIAN"
+    LAURA = "LAURA"
+    ARIA = "ARIA"
+    CALLUM = "CALLUM"
+    CHARLIE = "CHARLIE"
+
+
+class KokoroVoice(Enum):
+    """Available voices for Kokoro TTS"""
+    # Female voices (af_ prefix)
+    AF_ALLOY = "af_alloy"
+    AF_AOEDE = "af_aoede"
+    AF_BELLA = "af_bella"
+    AF_JESSICA = "af_jessica"
+    AF_KORE = "af_kore"
+    AF_NICOLE = "af_nicole"
+    AF_NOVA = "af_nova"
+    AF_RIVER = "af_river"
+    AF_SARAH = "af_sarah"
+    AF_SKY = "af_sky"
+
+    # Male voices (am_ prefix)
+    AM_ADAM = "am_adam"
+    AM_ECHO = "am_echo"
+    AM_ERIC = "am_eric"
+    AM_FENRIR = "am_fenrir"
+    AM_LIAM = "am_liam"
+    AM_MICHAEL = "am_michael"
+    AM_ONYX = "am_onyx"
+    AM_PUCK = "am_puck"
+
+
+class VideoColor(str, Enum):
+    BLACK = "BLACK"
+    WHITE = "WHITE"
+    YELLOW = "YELLOW"
+    RED = "RED"
+    BLUE = "BLUE"
+    GREEN = "GREEN"
+    ORANGE = "ORANGE"
+    PURPLE = "PURPLE"
+    CYAN = "CYAN"
+    MAGENTA = "MAGENTA"
+
+
+class VideoCaptionPosition(str, Enum):
+    CENTER_CENTER = "CENTER_CENTER"
+    CENTER_TOP = "CENTER_TOP"
+    CENTER_BOTTOM = "CENTER_BOTTOM"
+    LEFT_CENTER = "LEFT_CENTER"
+    LEFT_TOP = "LEFT_TOP"
+    LEFT_BOTTOM = "LEFT_BOTTOM"
+    RIGHT_CENTER = "RIGHT_CENTER"
+    RIGHT_TOP = "RIGHT_TOP"
+    RIGHT_BOTTOM = "RIGHT_BOTTOM"
+
+
+class AutomationPostTo(str, Enum):
+    DIRECT = "DIRECT"
+    DRAFT = "DRAFT"
+    POST_COLLECTION = "POST_COLLECTION"
+
+
+class GeneratedFacelessVideoProcessState(str, Enum):
+    IN_PROGRESS = "IN_PROGRESS"
+    COMPLETE = "COMPLETE"
+    ERROR = "ERROR"
+    NO_CREDITS = "NO_CREDITS"
@@ -0,0 +1,30 @@
+# ---------------------------------------------------------
+# API Exception Classes
+# ---------------------------------------------------------
+class RobopostAPIError(Exception):
+    """Base exception for Robopost API errors"""
+
+    def __init__(self, message: str, status_code: int = None, response_data: dict = None):
+        self.message = message
+        self.status_code = status_code
+        self.response_data = response_data
+        super().__init__(self.message)
+
+
+class RobopostPlanLimitError(RobopostAPIError):
+    """Exception for plan limit errors"""
+
+    def __init__(self, message: str, limit: int = None, current_usage: int = None):
+        self.limit = limit
+        self.current_usage = current_usage
+        super().__init__(message, status_code=409)
+
+
+class RobopostQuotaExhaustedError(RobopostPlanLimitError):
+    """Raised without contacting the server when a QuotaTracker knows the plan limit is reached"""
+
+    def __init__(self, message: str, limit: int = None, current_usage: int = None, group: str = None,
+                 retry_after: float = None):
+        self.group = group
+        self.retry_after = retry_after
+        super().__init__(message, limit=limit, current_usage=current_usage)
@@ -0,0 +1,203 @@
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, List, Tuple
+
+from pydantic import Field
+
+from . import _forksafe
+from ._base import DeferredModel
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples (0.0 for an empty list)"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = math.ceil(pct / 100.0 * len(ordered))
+    return ordered[min(len(ordered), max(1, rank)) - 1]
+
+
+def _close_loser(future: Future) -> None:
+    # The caller already has its answer; release the connection of the other attempt
+    if future.cancelled() or future.exception() is not None:
+        return
+    result, _ = future.result()
+    close = getattr(result, "close", None)
+    if close is not None:
+        close()
+
+
+class HedgingStats(DeferredModel):
+    """Counters and latency figures of a HedgingPolicy"""
+    requests: int = 0
+    hedges_sent: int = Field(0, description="Duplicate requests issued")
+    hedge_wins: int = Field(0, description="Calls answered by the duplicate first")
+    budget_denied: int = Field(0, description="Hedges skipped because max_hedge_ratio was reached")
+    hedge_delay: float = Field(0.0, description="Current delay in seconds before hedging")
+    latency_p50: float = Field(0.0, description="Median end-to-end call latency in seconds")
+    latency_p99: float = Field(0.0, description="99th percentile end-to-end call latency in seconds")
+
+
+class HedgingPolicy:
+    """
+    Hedged requests for idempotent GETs.
+
+    If a response has not arrived after the configured percentile of recently
+    observed latencies, a duplicate request is sent and whichever answers first is
+    used. The share of hedged requests is capped by max_hedge_ratio so a slow
+    backend is not hit with twice the traffic.
+
+    The losing attempt is cancelled if it has not started yet, and otherwise
+    closed (if its result has a close() method) once it returns. Only the
+    latencies of winning attempts feed the percentile.
+    """
+
+    def __init__(
+            self,
+            percentile: float = 95.0,
+            max_hedge_ratio: float = 0.05,
+            min_delay: float = 0.01,
+            initial_delay: float = 1.0,
+            min_samples: int = 20,
+            window: int = 1000,
+            max_workers: int = 64
+    ):
+        """
+        :param percentile: Latency percentile after which a hedge is sent
+        :param max_hedge_ratio: Maximum fraction of requests that may be hedged
+        :param min_delay: Lower bound for the hedge delay in seconds
+        :param initial_delay: Hedge delay used until min_samples latencies were observed
+        :param min_samples: Number of observations needed before the percentile is used
+        :param window: Number of recent latencies kept
+        :param max_workers: Threads available to run primary and hedged requests; this bounds
+                            the number of hedged-policy GETs in flight at the same time
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if not 0 <= max_hedge_ratio <= 1:
+            raise ValueError("max_hedge_ratio must be between 0 and 1")
+
+        self.percentile = percentile
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+
+        self._lock = threading.Lock()
+        self._attempt_latencies = deque(maxlen=window)
+        self._call_latencies = deque(maxlen=window)
+        self._delay = None
+        self._dirty = 0
+        self._executor = None
+        self._requests = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._budget_denied = 0
+        _forksafe.register(self)
+
+    def _reset_after_fork(self) -> None:
+        # The executor's threads do not exist in the child; a new one is started on demand
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def delay(self) -> float:
+        """Current delay in seconds after which a hedge is sent"""
+        with self._lock:
+            if len(self._attempt_latencies) < self.min_samples:
+                return self.initial_delay
+            # Re-sorting the window on every call is wasteful; refresh every few samples
+            if self._delay is None or self._dirty >= 16:
+                self._delay = max(self.min_delay, percentile(list(self._attempt_latencies), self.percentile))
+                self._dirty = 0
+            return self._delay
+
+    def run(self, send: Callable[[], object]):
+        """
+        Run send(), hedging it with a second identical call if it is slow.
+
+        :param send: Callable performing the request
+        :return: The result of whichever call finished first
+        """
+        start = time.perf_counter()
+        executor = self._get_executor()
+        primary = executor.submit(self._timed, send)
+
+        with self._lock:
+            self._requests += 1
+
+        done, _ = wait([primary], timeout=self.delay())
+        futures = [primary]
+
+        if not done:
+            if self._acquire_hedge():
+                futures.append(executor.submit(self._timed, send))
+
+            done, pending = wait(futures, return_when=FIRST_COMPLETED)
+            winner = next(iter(done))
+            if winner.exception() is not None and pending:
+                # The first answer failed; give the other attempt a chance
+                done, _ = wait(pending)
+                winner = next(iter(done))
+
+            if winner is not primary:
+                with self._lock:
+                    self._hedge_wins += 1
+            for future in futures:
+                if future is not winner and not future.cancel():
+                    future.add_done_callback(_close_loser)
+        else:
+            winner = primary
+
+        with self._lock:
+            self._call_latencies.append(time.perf_counter() - start)
+
+        result, elapsed = winner.result()
+        with self._lock:
+            self._attempt_latencies.append(elapsed)
+            self._dirty += 1
+        return result
+
+    def stats(self) -> HedgingStats:
+        with self._lock:
+            calls = list(self._call_latencies)
+            stats = HedgingStats(
+                requests=self._requests,
+                hedges_sent=self._hedges,
+                hedge_wins=self._hedge_wins,
+                budget_denied=self._budget_denied,
+                latency_p50=percentile(calls, 50),
+                latency_p99=percentile(calls, 99),
+            )
+        stats.hedge_delay = self.delay()
+        return stats
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def _timed(send: Callable[[], object]) -> Tuple[object, float]:
+        start = time.perf_counter()
+        result = send()
+        return result, time.perf_counter() - start
+
+    def _acquire_hedge(self) -> bool:
+        with self._lock:
+            if self._hedges + 1 > self.max_hedge_ratio * self._requests:
+                self._budget_denied += 1
+                return False
+            self._hedges += 1
+            return True
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="robopost-hedge")
+            return self._executor
+
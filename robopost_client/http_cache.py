@@ -0,0 +1,271 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from pydantic import Field
+
+from . import _forksafe
+from ._base import DeferredModel
+
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+class CachedResponse(DeferredModel):
+    """A stored GET response together with its revalidation metadata"""
+    url: str
+    body: bytes
+    headers: Dict[str, str] = Field(default_factory=dict)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    expires_at: float = Field(0.0, description="Unix time until which the entry can be served without revalidation")
+
+    @property
+    def validator(self) -> Optional[str]:
+        return self.etag or self.last_modified
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return self.expires_at > (time.time() if now is None else now)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = self.url
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.body
+        response.encoding = "utf-8"
+        return response
+
+    @classmethod
+    def from_response(cls, response: requests.Response) -> Optional["CachedResponse"]:
+        """
+        Build an entry from a successful response, or return None if it must not be cached
+        (no validators and no freshness lifetime, or Cache-Control: no-store).
+        """
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control:
+            return None
+
+        max_age = _MAX_AGE.search(cache_control)
+        expires_at = time.time() + int(max_age.group(1)) if max_age and "no-cache" not in cache_control else 0.0
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+        if not (etag or last_modified or expires_at):
+            return None
+
+        return cls(
+            url=response.url.split("?", 1)[0],
+            body=response.content,
+            headers={k: v for k, v in response.headers.items() if k.lower() in ("content-type", "etag", "last-modified")},
+            etag=etag,
+            last_modified=last_modified,
+            expires_at=expires_at,
+        )
+
+
+def cache_key(method: str, url: str, params: Optional[dict]) -> str:
+    """
+    Stable key for a request. The key is hashed so the API key that is part of the
+    query parameters is never written to disk in clear text.
+    """
+    items = sorted((str(k), str(v)) for k, v in (params or {}).items())
+    return hashlib.sha256(json.dumps([method.upper(), url, items]).encode()).hexdigest()
+
+
+class DiskResponseCache:
+    """
+    SQLite-backed HTTP response cache for GET endpoints, shared across client
+    instances and process restarts.
+
+    Entries are evicted least-recently-used first once the stored bodies exceed
+    max_bytes. Responses carrying an ETag or Last-Modified header are revalidated
+    with a conditional request, so unchanged resources cost a 304 only.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 100 * 1024 * 1024):
+        """
+        :param path: SQLite database file; parent directories are created if needed
+        :param max_bytes: Upper bound for the total size of cached bodies
+        """
+        self.path = os.path.expanduser(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = None
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        _forksafe.register(self)
+
+    def _reset_after_fork(self) -> None:
+        # SQLite connections must not be used across fork(); the child opens its own
+        self._lock = threading.Lock()
+        if self._conn is not None:
+            _forksafe.abandon(self._conn)
+        self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # Must be called with the lock held
+        if self._conn is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, entry TEXT NOT NULL, body BLOB NOT NULL,"
+                " size INTEGER NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute("SELECT entry, body FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+
+        entry = json.loads(row[0])
+        return CachedResponse(body=bytes(row[1]), **entry)
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        size = len(entry.body)
+        if size > self.max_bytes:
+            return
+
+        metadata = json.dumps(entry.model_dump(exclude={"body"}))
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, entry, body, size, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, metadata, entry.body, size, time.time())
+            )
+            self._evict(conn)
+
+    def touch(self, key: str, entry: CachedResponse) -> None:
+        """Refresh the freshness lifetime of an entry after a 304"""
+        metadata = json.dumps(entry.model_dump(exclude={"body"}))
+        with self._lock:
+            self._connection().execute(
+                "UPDATE responses SET entry = ?, accessed_at = ? WHERE key = ?", (metadata, time.time(), key)
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connection().execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection().execute("DELETE FROM responses")
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._connection().execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def record(self, outcome: str) -> None:
+        """Count the outcome of a lookup: hits, revalidations or misses"""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            entries, size = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            return {
+                "hits": self.hits,
+                "revalidations": self.revalidations,
+                "misses": self.misses,
+                "entries": entries,
+                "bytes": size,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall():
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                return
+
+
+def resolve_cached(
+        cache: DiskResponseCache,
+        key: str,
+        send,
+        headers: Optional[dict] = None
+) -> Tuple[requests.Response, Optional[str]]:
+    """
+    Perform a GET through the disk cache.
+
+    :param cache: Cache to read from and write to
+    :param key: Cache key of the request
+    :param send: Callable taking request headers and returning a requests.Response
+    :param headers: Headers of the original request
+    :return: Tuple of (response, validator); the validator identifies the body version
+             and is None when the response is not cached. A body served from the
+             cache (fresh entry or 304) is marked with robopost_from_cache = True
+    """
+    entry = cache.get(key)
+    if entry is not None and entry.is_fresh():
+        cache.record("hits")
+        return _from_cache(entry), entry.validator or str(entry.expires_at)
+
+    request_headers = dict(headers or {})
+    if entry is not None:
+        request_headers.update(entry.conditional_headers())
+
+    response = send(request_headers)
+
+    if response.status_code == 304 and entry is not None:
+        cache.record("revalidations")
+        refreshed = CachedResponse.from_response(response)
+        if refreshed is not None and refreshed.expires_at:
+            entry.expires_at = refreshed.expires_at
+            cache.touch(key, entry)
+        return _from_cache(entry), entry.validator or str(entry.expires_at)
+
+    cache.record("misses")
+    if response.ok:
+        new_entry = CachedResponse.from_response(response)
+        if new_entry is not None:
+            cache.set(key, new_entry)
+            return response, new_entry.validator or str(new_entry.expires_at)
+        cache.delete(key)
+
+    return response, None
+
+
+def _from_cache(entry: CachedResponse) -> requests.Response:
+    response = entry.to_response()
+    response.robopost_from_cache = True
+    return response
@@ -0,0 +1,270 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import socket
+
+from requests import Request
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError
+
+from . import _forksafe
+
+
+# Connect time of the request currently being sent on this thread. Requests are
+# synchronous, so the connection opened (if any) belongs to the caller's request.
+_local = threading.local()
+
+
+def reset_connect_time() -> None:
+    _local.connect_time = 0.0
+
+
+def pop_connect_time() -> float:
+    value = getattr(_local, "connect_time", 0.0)
+    _local.connect_time = 0.0
+    return value
+
+
+class _TimedConnectMixin:
+    # DNSCache consulted for new connections; set on per-adapter subclasses
+    dns_cache = None
+
+    def _new_conn(self):
+        if self.dns_cache is None:
+            return super()._new_conn()
+
+        host = self._dns_host
+        try:
+            addresses = self.dns_cache.resolve(host, self.port)
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e
+
+        # TLS still verifies self.host; only the address connected to comes from the cache
+        try:
+            for index, address in enumerate(addresses):
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except ConnectTimeoutError:
+                    if index == len(addresses) - 1:
+                        self.dns_cache.invalidate(host, self.port)
+                        raise
+        finally:
+            self._dns_host = host
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            _local.connect_time = getattr(_local, "connect_time", 0.0) + time.perf_counter() - start
+
+
+class TimedHTTPConnection(_TimedConnectMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectMixin, HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+def _pool_classes(dns_cache) -> Dict[str, type]:
+    if dns_cache is None:
+        return {"http": TimedHTTPConnectionPool, "https": TimedHTTPSConnectionPool}
+
+    attrs = {"dns_cache": dns_cache}
+    return {
+        "http": type("CachedDNSHTTPConnectionPool", (TimedHTTPConnectionPool,), {
+            "ConnectionCls": type("CachedDNSHTTPConnection", (TimedHTTPConnection,), attrs)}),
+        "https": type("CachedDNSHTTPSConnectionPool", (TimedHTTPSConnectionPool,), {
+            "ConnectionCls": type("CachedDNSHTTPSConnection", (TimedHTTPSConnection,), attrs)}),
+    }
+
+
+def reset_pools(adapter: HTTPAdapter) -> None:
+    """
+    Give an adapter new, empty connection pools with the same settings. The old
+    pools are dropped without closing their sockets, which a forked child shares
+    with its parent.
+    """
+    _forksafe.abandon((adapter.poolmanager, adapter.proxy_manager))
+    adapter.init_poolmanager(adapter._pool_connections, adapter._pool_maxsize, block=adapter._pool_block)
+    adapter.proxy_manager = {}
+
+
+class InstrumentedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose pooled connections record the time spent connecting (TCP + TLS)
+    and optionally resolve hosts through a DNSCache.
+    """
+
+    def __init__(self, *args, dns_cache=None, **kwargs):
+        # Set before HTTPAdapter.__init__, which creates the pool manager
+        self.dns_cache = dns_cache
+        super().__init__(*args, **kwargs)
+        _forksafe.register(self)
+
+    def _reset_after_fork(self) -> None:
+        reset_pools(self)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _pool_classes(getattr(self, "dns_cache", None))
+
+    def warmup(self, url: str, n_connections: int, timeout: Optional[float] = None, verify=True, cert=None,
+               proxies: Optional[dict] = None) -> int:
+        """
+        Open up to `n_connections` keep-alive connections to the host of `url` and
+        park them in the pool, connecting in parallel.
+
+        `verify`, `cert` and `proxies` must match the later requests, since they
+        select the connection pool those requests draw from.
+
+        :return: Number of connections open in the pool for that host afterwards
+        """
+        request = Request("GET", url).prepare()
+        if hasattr(self, "get_connection_with_tls_context"):
+            pool = self.get_connection_with_tls_context(request, verify, proxies=proxies, cert=cert)
+        else:  # requests < 2.32.2
+            pool = self.get_connection(url, proxies)
+        n_connections = min(n_connections, pool.pool.maxsize if pool.pool is not None else n_connections)
+        connections = [pool._get_conn() for _ in range(n_connections)]
+        if timeout is not None:
+            for conn in connections:
+                conn.timeout = timeout
+
+        def connect(conn):
+            if not conn.is_connected:
+                try:
+                    conn.connect()
+                except Exception:
+                    conn.close()
+
+        threads = [threading.Thread(target=connect, args=(conn,), daemon=True) for conn in connections]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        opened = 0
+        for conn in connections:
+            if conn.is_connected:
+                opened += 1
+            pool._put_conn(conn)
+        return opened
+
+
+class RequestTiming:
+    """
+    Timing breakdown of a single client call, in seconds.
+
+    The phases are wall-clock times. `serialization_cpu` is the CPU time of the
+    calling thread spent encoding, decoding and validating, which unlike the
+    wall times does not grow while the thread waits for the GIL.
+    """
+    __slots__ = ("encode", "connect", "ttfb", "transfer", "decode", "validate", "total", "serialization_cpu")
+
+    def __init__(self):
+        self.encode = 0.0
+        self.connect = 0.0
+        self.ttfb = 0.0
+        self.transfer = 0.0
+        self.decode = 0.0
+        self.validate = 0.0
+        self.total = 0.0
+        self.serialization_cpu = 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @property
+    def serialization(self) -> float:
+        """Time spent encoding the request body and decoding and validating the response"""
+        return self.encode + self.decode + self.validate
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name) * 1000:.2f}ms" for name in self.__slots__)
+        return f"RequestTiming({fields})"
+
+
+class RequestInfo:
+    """
+    Describes a client call to before-request and after-response hooks.
+
+    `url` never includes query parameters, so the API key is not exposed. Byte
+    counts are body sizes: `bytes_sent` as sent (after compression),
+    `bytes_received` once decoded and `bytes_received_wire` as transferred, before
+    a Content-Encoding was removed. `retries` counts additional attempts (e.g. hedges).
+    """
+    __slots__ = (
+        "method", "endpoint", "url", "status", "bytes_sent", "bytes_received", "bytes_received_wire",
+        "retries", "from_cache", "error", "timing", "_start",
+    )
+
+    def __init__(self, method: str, endpoint: str, url: str):
+        self.method = method
+        self.endpoint = endpoint
+        self.url = url
+        self.status: Optional[int] = None
+        self.bytes_sent: Optional[int] = None
+        self.bytes_received: Optional[int] = None
+        self.bytes_received_wire: Optional[int] = None
+        self.retries = 0
+        self.from_cache = False
+        self.error: Optional[BaseException] = None
+        self.timing = RequestTiming()
+        self._start = time.perf_counter()
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "method": self.method,
+            "endpoint": self.endpoint,
+            "url": self.url,
+            "status": self.status,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "bytes_received_wire": self.bytes_received_wire,
+            "retries": self.retries,
+            "from_cache": self.from_cache,
+            "error": repr(self.error) if self.error is not None else None,
+            "timing": self.timing.as_dict(),
+        }
+
+    def __repr__(self) -> str:
+        return f"RequestInfo({self.method} {self.endpoint} status={self.status} {self.timing!r})"
+
+
+def body_size(body) -> Optional[int]:
+    """Size of a prepared request body, or None for streamed bodies of unknown length"""
+    if body is None:
+        return 0
+    if isinstance(body, (bytes, bytearray, memoryview)):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    # Streamed bodies such as protocol.MultipartBody announce their size, if known, in `len`
+    length = getattr(body, "len", None)
+    return length if isinstance(length, int) else None
+
+
+def wire_size(response) -> Optional[int]:
+    """Bytes of a response body read from the connection, before content decoding"""
+    raw = getattr(response, "raw", None)
+    tell = getattr(raw, "tell", None)
+    if tell is None:
+        return None
+    try:
+        return tell()
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,163 @@
+import contextvars
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from enum import Enum
+from typing import Dict, Iterator, Optional, Union
+
+from pydantic import Field
+
+from . import _forksafe
+from ._base import DeferredModel
+
+
+class Priority(Enum):
+    INTERACTIVE = "interactive"
+    NORMAL = "normal"
+    BULK = "bulk"
+
+
+# Highest priority first
+_ORDER = (Priority.INTERACTIVE, Priority.NORMAL, Priority.BULK)
+
+_current: contextvars.ContextVar = contextvars.ContextVar("robopost_priority", default=Priority.NORMAL)
+
+
+def current_priority() -> Priority:
+    """Priority of calls made from the current thread or task"""
+    return _current.get()
+
+
+@contextmanager
+def use_priority(priority: Union[Priority, str]) -> Iterator[Priority]:
+    """
+    Run the client calls made inside the block in a priority lane.
+
+        with use_priority(Priority.BULK):
+            for payload in payloads:
+                client.create_scheduled_posts(payload)
+
+    :param priority: Priority or its value ("interactive", "normal", "bulk")
+    """
+    priority = Priority(priority)
+    token = _current.set(priority)
+    try:
+        yield priority
+    finally:
+        _current.reset(token)
+
+
+class LaneStats(DeferredModel):
+    """Counters of a single priority lane"""
+    limit: int = Field(0, description="Requests of this lane allowed in flight at once")
+    in_flight: int = 0
+    waiting: int = 0
+    completed: int = 0
+    wait_seconds: float = Field(0.0, description="Total time requests waited for a slot")
+    max_wait: float = 0.0
+
+
+class PriorityLanes:
+    """
+    Admission control for a client's connections with three priority lanes.
+
+    At most `capacity` requests are in flight at once. Capacity reserved for a
+    lane can only be used by that lane and the ones above it, so with
+    `reserved={Priority.INTERACTIVE: 4}` bulk and normal calls never hold the
+    last four slots. Freed slots go to the highest-priority waiting request;
+    within a lane, requests are served in arrival order.
+    """
+
+    def __init__(self, capacity: int = 32, reserved: Optional[Dict[Union[Priority, str], int]] = None):
+        """
+        :param capacity: Requests in flight at once across all lanes; keep it at or below the pool_maxsize
+        :param reserved: Slots reserved per lane; defaults to 1/8 of the capacity for interactive calls
+        """
+        if reserved is None:
+            reserved = {Priority.INTERACTIVE: max(1, capacity // 8)}
+        reserved = {Priority(lane): count for lane, count in reserved.items()}
+        if sum(reserved.values()) >= capacity:
+            raise ValueError("Reserved slots must leave at least one slot for bulk calls")
+
+        self.capacity = capacity
+        self.reserved = reserved
+        # A lane may use the capacity not reserved for the lanes above it
+        self.limits: Dict[Priority, int] = {}
+        above = 0
+        for lane in _ORDER:
+            self.limits[lane] = capacity - above
+            above += reserved.get(lane, 0)
+
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._lane_in_flight = {lane: 0 for lane in _ORDER}
+        self._queues: Dict[Priority, deque] = {lane: deque() for lane in _ORDER}
+        self._completed = {lane: 0 for lane in _ORDER}
+        self._wait_seconds = {lane: 0.0 for lane in _ORDER}
+        self._max_wait = {lane: 0.0 for lane in _ORDER}
+        _forksafe.register(self)
+
+    def _reset_after_fork(self) -> None:
+        # Slots held and waited for at the time of a fork belong to the parent's threads
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._lane_in_flight = {lane: 0 for lane in _ORDER}
+        self._queues = {lane: deque() for lane in _ORDER}
+
+    def acquire(self, lane: Priority) -> None:
+        """Wait for a slot in the lane's share of the capacity"""
+        with self._lock:
+            ahead = any(self._queues[other] for other in _ORDER[:_ORDER.index(lane) + 1])
+            if not ahead and self._in_flight < self.limits[lane]:
+                self._take(lane)
+                return
+            granted = threading.Event()
+            self._queues[lane].append(granted)
+
+        start = time.perf_counter()
+        granted.wait()
+        waited = time.perf_counter() - start
+        with self._lock:
+            self._wait_seconds[lane] += waited
+            self._max_wait[lane] = max(self._max_wait[lane], waited)
+
+    def release(self, lane: Priority) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._lane_in_flight[lane] -= 1
+            self._completed[lane] += 1
+            for waiting in _ORDER:
+                queue = self._queues[waiting]
+                while queue and self._in_flight < self.limits[waiting]:
+                    self._take(waiting)
+                    queue.popleft().set()
+
+    @contextmanager
+    def slot(self, lane: Optional[Priority] = None) -> Iterator[Priority]:
+        """Hold a slot for the duration of the block, in the given or the current lane"""
+        lane = lane or current_priority()
+        self.acquire(lane)
+        try:
+            yield lane
+        finally:
+            self.release(lane)
+
+    def _take(self, lane: Priority) -> None:
+        # Must be called with the lock held
+        self._in_flight += 1
+        self._lane_in_flight[lane] += 1
+
+    def stats(self) -> Dict[str, LaneStats]:
+        with self._lock:
+            return {
+                lane.value: LaneStats(
+                    limit=self.limits[lane],
+                    in_flight=self._lane_in_flight[lane],
+                    waiting=len(self._queues[lane]),
+                    completed=self._completed[lane],
+                    wait_seconds=self._wait_seconds[lane],
+                    max_wait=self._max_wait[lane],
+                )
+                for lane in _ORDER
+            }
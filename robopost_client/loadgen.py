@@ -0,0 +1,325 @@
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from pydantic import Field
+
+from ._base import DeferredModel
+from .hedging import percentile
+from .instrumentation import RequestInfo
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+DEFAULT_MIX = {"create_scheduled_posts": 3, "list_media": 1, "get_media": 2, "get_video_series": 1}
+
+
+# ---------------------------------------------------------
+# Workloads
+# ---------------------------------------------------------
+class _Fixtures:
+    """IDs of existing resources used by read workloads, collected by LoadGenerator.prepare()"""
+
+    def __init__(self):
+        self.media_ids: List[str] = []
+        self.series_ids: List[str] = []
+        self.task_ids: List[str] = []
+        self.post_payload = None
+
+
+def _create_scheduled_posts(client, fixtures: _Fixtures, rng: random.Random):
+    return client.create_scheduled_posts(fixtures.post_payload)
+
+
+def _get_media(client, fixtures: _Fixtures, rng: random.Random):
+    if not fixtures.media_ids:
+        return client.list_media(limit=1)
+    return client.get_media(rng.choice(fixtures.media_ids))
+
+
+def _get_video_series(client, fixtures: _Fixtures, rng: random.Random):
+    if not fixtures.series_ids:
+        return client.list_video_series(limit=1)
+    return client.get_video_series(rng.choice(fixtures.series_ids))
+
+
+def _get_video_task(client, fixtures: _Fixtures, rng: random.Random):
+    if not fixtures.task_ids:
+        return client.list_video_tasks(limit=1)
+    return client.get_video_task(rng.choice(fixtures.task_ids))
+
+
+WORKLOADS: Dict[str, Callable[[Any, _Fixtures, random.Random], Any]] = {
+    "create_scheduled_posts": _create_scheduled_posts,
+    "list_media": lambda client, fixtures, rng: client.list_media(limit=50),
+    "get_media": _get_media,
+    "list_video_series": lambda client, fixtures, rng: client.list_video_series(limit=10),
+    "get_video_series": _get_video_series,
+    "list_video_tasks": lambda client, fixtures, rng: client.list_video_tasks(limit=10),
+    "get_video_task": _get_video_task,
+}
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """Parse a workload mix such as "create_scheduled_posts=3,list_media=1" """
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in WORKLOADS:
+            raise ValueError(f"Unknown workload {name!r}, expected one of {sorted(WORKLOADS)}")
+        mix[name] = float(weight) if weight else 1.0
+    return mix
+
+
+def _rss_bytes() -> Optional[int]:
+    if resource is None:
+        return None
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+# ---------------------------------------------------------
+# Reports
+# ---------------------------------------------------------
+class LoadReport(DeferredModel):
+    """Results of a single load run"""
+    mode: str = Field(..., description='"concurrency" (closed loop) or "rps" (open loop)')
+    target: float = Field(..., description="Concurrency level or requests per second aimed for")
+    duration: float = 0.0
+    requests: int = 0
+    errors: int = 0
+    error_types: Dict[str, int] = Field(default_factory=dict)
+    throughput: float = Field(0.0, description="Completed calls per second")
+    latency_p50: float = 0.0
+    latency_p90: float = 0.0
+    latency_p99: float = 0.0
+    latency_max: float = 0.0
+    cpu_total: float = Field(0.0, description="CPU seconds spent by the calling threads")
+    cpu_serialization: float = Field(0.0, description="CPU seconds encoding requests, decoding JSON and validating models")
+    cpu_network: float = Field(0.0, description="Remaining CPU seconds: HTTP, sockets and client bookkeeping")
+    rss_mb: Optional[float] = Field(None, description="Resident memory at the end of the run")
+    rss_growth_mb: Optional[float] = Field(None, description="Resident memory growth during the run")
+    peak_rss_mb: Optional[float] = Field(None, description="Peak resident memory of the process")
+
+    @property
+    def cpu_per_request(self) -> float:
+        return self.cpu_total / self.requests if self.requests else 0.0
+
+
+class SweepResult(DeferredModel):
+    """Results of a concurrency sweep"""
+    runs: List[LoadReport] = Field(default_factory=list)
+    peak_throughput: float = 0.0
+    knee: Optional[int] = Field(None, description="Lowest concurrency reaching the knee threshold of the peak")
+
+
+class _Recorder:
+    """
+    Collects the results of the calls of a run. The serialization CPU is read from
+    the RequestInfo handed to a before-request hook once the call has returned: an
+    after-response hook would make the client time the transfer by streaming
+    responses, so the run would measure another code path than plain calls take.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies: List[float] = []
+        self.errors: Dict[str, int] = {}
+        self.cpu = 0.0
+        self.serialization = 0.0
+        self._local = threading.local()
+
+    def start(self) -> None:
+        """Called on the calling thread before each call"""
+        self._local.infos = []
+
+    def hook(self, info: RequestInfo) -> None:
+        self._local.infos.append(info)
+
+    def record(self, latency: float, cpu: float, error: Optional[BaseException]) -> None:
+        serialization = sum(info.timing.serialization_cpu for info in self._local.infos)
+        with self.lock:
+            self.latencies.append(latency)
+            self.cpu += cpu
+            self.serialization += serialization
+            if error is not None:
+                name = type(error).__name__
+                self.errors[name] = self.errors.get(name, 0) + 1
+
+
+# ---------------------------------------------------------
+# Load Generator
+# ---------------------------------------------------------
+class LoadGenerator:
+    """
+    Drives a RobopostClient with a weighted mix of workloads, either with a fixed
+    number of concurrent callers (closed loop) or at a target request rate (open
+    loop), and reports throughput, latency percentiles, CPU split and memory.
+
+    In rate mode latency is measured from the scheduled start of each call, so
+    queueing behind a saturated client shows up in the percentiles.
+    """
+
+    def __init__(self, client, mix: Optional[Dict[str, float]] = None, seed: Optional[int] = None):
+        """
+        :param client: RobopostClient to load
+        :param mix: Relative weight per workload name (see WORKLOADS)
+        :param seed: Seed for workload selection and ID choice
+        """
+        self.client = client
+        self.mix = dict(mix or DEFAULT_MIX)
+        for name in self.mix:
+            if name not in WORKLOADS:
+                raise ValueError(f"Unknown workload {name!r}, expected one of {sorted(WORKLOADS)}")
+        self.seed = seed
+        self.fixtures = _Fixtures()
+        self._prepared = False
+
+    def prepare(self) -> None:
+        """Collect IDs of existing media, series and tasks for the read workloads"""
+        from .models import PublicAPIScheduledPostCreateHTTPPayload
+
+        self.fixtures.post_payload = PublicAPIScheduledPostCreateHTTPPayload(
+            text="Load test post #robopost", channel_ids=["loadtest-channel"]
+        )
+        if "get_media" in self.mix:
+            self.fixtures.media_ids = [m.id for m in self.client.list_media(limit=100)]
+        if "get_video_series" in self.mix:
+            self.fixtures.series_ids = [s.id for s in self.client.list_video_series(limit=100)]
+        if "get_video_task" in self.mix:
+            self.fixtures.task_ids = [t.task_id for t in self.client.list_video_tasks(limit=100)]
+        self._prepared = True
+
+    def _call(self, rng: random.Random, recorder: _Recorder, scheduled_at: Optional[float] = None) -> None:
+        names = list(self.mix)
+        name = rng.choices(names, weights=[self.mix[n] for n in names])[0]
+        recorder.start()
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        error = None
+        try:
+            WORKLOADS[name](self.client, self.fixtures, rng)
+        except Exception as e:
+            error = e
+        end = time.perf_counter()
+        recorder.record(end - (scheduled_at if scheduled_at is not None else start),
+                        time.thread_time() - cpu_start, error)
+
+    def run(self, duration: float = 10.0, concurrency: Optional[int] = None, rps: Optional[float] = None,
+            max_workers: int = 256) -> LoadReport:
+        """
+        Run the workload mix for `duration` seconds.
+
+        :param duration: Seconds to generate load
+        :param concurrency: Number of callers issuing calls back to back (closed loop)
+        :param rps: Target calls per second, issued on a schedule (open loop)
+        :param max_workers: Upper bound on concurrent calls in rate mode
+        :return: LoadReport of the run
+        """
+        if (concurrency is None) == (rps is None):
+            raise ValueError("Pass exactly one of concurrency or rps")
+        if not self._prepared:
+            self.prepare()
+
+        recorder = _Recorder()
+        self.client.add_before_request_hook(recorder.hook)
+        rss_start = _rss_bytes()
+        start = time.perf_counter()
+        try:
+            if concurrency is not None:
+                self._closed_loop(concurrency, start + duration, recorder)
+            else:
+                self._open_loop(rps, start + duration, max_workers, recorder)
+        finally:
+            self.client.remove_hook(recorder.hook)
+        elapsed = time.perf_counter() - start
+        rss_end = _rss_bytes()
+        peak = _peak_rss_bytes()
+
+        latencies = recorder.latencies
+        mb = 1024 * 1024
+        return LoadReport(
+            mode="concurrency" if concurrency is not None else "rps",
+            target=concurrency if concurrency is not None else rps,
+            duration=elapsed,
+            requests=len(latencies),
+            errors=sum(recorder.errors.values()),
+            error_types=recorder.errors,
+            throughput=len(latencies) / elapsed if elapsed else 0.0,
+            latency_p50=percentile(latencies, 50),
+            latency_p90=percentile(latencies, 90),
+            latency_p99=percentile(latencies, 99),
+            latency_max=max(latencies, default=0.0),
+            cpu_total=recorder.cpu,
+            cpu_serialization=recorder.serialization,
+            cpu_network=max(0.0, recorder.cpu - recorder.serialization),
+            rss_mb=rss_end / mb if rss_end is not None else None,
+            rss_growth_mb=(rss_end - rss_start) / mb if rss_end is not None and rss_start is not None else None,
+            peak_rss_mb=peak / mb if peak is not None else None,
+        )
+
+    def _closed_loop(self, concurrency: int, deadline: float, recorder: _Recorder) -> None:
+        def caller(index: int) -> None:
+            rng = random.Random(None if self.seed is None else self.seed + index)
+            while time.perf_counter() < deadline:
+                self._call(rng, recorder)
+
+        threads = [threading.Thread(target=caller, args=(i,), name=f"robopost-load-{i}", daemon=True)
+                   for i in range(max(1, concurrency))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def _open_loop(self, rps: float, deadline: float, max_workers: int, recorder: _Recorder) -> None:
+        rng = random.Random(self.seed)
+        interval = 1.0 / rps
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="robopost-load") as executor:
+            scheduled_at = time.perf_counter()
+            while scheduled_at < deadline:
+                delay = scheduled_at - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                executor.submit(self._call, random.Random(rng.random()), recorder, scheduled_at)
+                scheduled_at += interval
+
+    def sweep(self, levels: Sequence[int] = (1, 2, 4, 8, 16, 32, 64), duration: float = 5.0,
+              threshold: float = 0.9, callback: Optional[Callable[[LoadReport], None]] = None) -> SweepResult:
+        """
+        Run the mix at increasing concurrency levels and locate the knee: the lowest
+        level reaching `threshold` of the peak throughput. Beyond it, more callers
+        mostly add latency.
+
+        :param levels: Concurrency levels to run, in order
+        :param duration: Seconds per level
+        :param threshold: Share of the peak throughput that defines the knee
+        :param callback: Called with the report of each level as soon as it finishes
+        :return: SweepResult with every run and the knee
+        """
+        runs = []
+        for level in levels:
+            report = self.run(duration=duration, concurrency=level)
+            runs.append(report)
+            if callback is not None:
+                callback(report)
+
+        peak = max((r.throughput for r in runs), default=0.0)
+        knee = next((int(r.target) for r in runs if peak and r.throughput >= threshold * peak), None)
+        return SweepResult(runs=runs, peak_throughput=peak, knee=knee)
@@ -0,0 +1,241 @@
+import bisect
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from . import _forksafe
+from .instrumentation import RequestInfo
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Path segments that are part of an endpoint; any other segment is an ID
+_ENDPOINT_SEGMENTS = frozenset((
+    "medias", "upload", "scheduled_posts", "video-series", "video-tasks", "generate", "details",
+))
+
+# (metric name, labels, value) produced by collectors at render time
+Sample = Tuple[str, Dict[str, str], float]
+
+_GAUGE_HELP = {
+    "pool_connections": "Pooled HTTP connections by host and state (idle or in_use).",
+    "pool_maxsize": "Maximum number of pooled connections kept per host.",
+}
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Replace IDs in an endpoint path with `{id}` so metrics are labelled per endpoint
+    rather than per resource, e.g. "/video-tasks/abc/details" -> "/video-tasks/{id}/details".
+    """
+    segments = endpoint.split("/")
+    return "/".join(s if not s or s in _ENDPOINT_SEGMENTS else "{id}" for s in segments)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class MetricsRegistry:
+    """
+    Request metrics of one or more RobopostClient instances, rendered in the
+    Prometheus text exposition format.
+
+    Pass an instance as `metrics=` to RobopostClient and serve `render()` (or
+    `client.metrics_text()`) from your exporter. Updates are a few dictionary
+    operations under a single lock, so recording adds negligible overhead.
+
+    Exported metrics (prefixed with `namespace`):
+        requests_total{method,endpoint,status}
+        errors_total{method,endpoint,exception}
+        request_duration_seconds{method,endpoint} (histogram)
+        requests_in_flight{method,endpoint}
+        pool_connections{host,state} and pool_maxsize{host}
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, namespace: str = "robopost_client"):
+        """
+        :param buckets: Upper bounds of the latency histogram buckets, in seconds
+        :param namespace: Prefix of the exported metric names
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._requests: Dict[Tuple[str, str, str], int] = {}
+        self._errors: Dict[Tuple[str, str, str], int] = {}
+        self._durations: Dict[Tuple[str, str], _Histogram] = {}
+        self._in_flight: Dict[Tuple[str, str], int] = {}
+        self._collectors: List[Callable[[], Iterable[Sample]]] = []
+        _forksafe.register(self)
+
+    def _reset_after_fork(self) -> None:
+        # Requests in flight at the time of the fork belong to the parent
+        self._lock = threading.Lock()
+        self._in_flight = {}
+
+    # ---------------------------------------------------------
+    # Recording
+    # ---------------------------------------------------------
+    def request_started(self, info: RequestInfo) -> None:
+        """Before-request hook: count the request as in flight"""
+        key = (info.method, endpoint_template(info.endpoint))
+        with self._lock:
+            self._in_flight[key] = self._in_flight.get(key, 0) + 1
+
+    def request_finished(self, info: RequestInfo) -> None:
+        """After-response hook: record the outcome and latency of the request"""
+        method, endpoint = info.method, endpoint_template(info.endpoint)
+        status = str(info.status) if info.status is not None else "none"
+        bucket = bisect.bisect_left(self.buckets, info.timing.total)
+
+        with self._lock:
+            key = (method, endpoint)
+            in_flight = self._in_flight.get(key, 0)
+            if in_flight > 0:
+                self._in_flight[key] = in_flight - 1
+
+            request_key = (method, endpoint, status)
+            self._requests[request_key] = self._requests.get(request_key, 0) + 1
+
+            if info.error is not None:
+                error_key = (method, endpoint, type(info.error).__name__)
+                self._errors[error_key] = self._errors.get(error_key, 0) + 1
+
+            histogram = self._durations.get(key)
+            if histogram is None:
+                histogram = self._durations[key] = _Histogram(len(self.buckets) + 1)
+            histogram.counts[bucket] += 1
+            histogram.sum += info.timing.total
+            histogram.count += 1
+
+    def add_collector(self, collector: Callable[[], Iterable[Sample]]) -> None:
+        """
+        Register a function called at render time that returns gauge samples as
+        (name, labels, value) tuples. Samples with the same name and labels are summed.
+        """
+        with self._lock:
+            self._collectors.append(collector)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._requests.clear()
+            self._errors.clear()
+            self._durations.clear()
+            self._in_flight.clear()
+
+    # ---------------------------------------------------------
+    # Export
+    # ---------------------------------------------------------
+    def request_count(self, method: Optional[str] = None, endpoint: Optional[str] = None) -> int:
+        """Total number of recorded requests, optionally filtered by method and endpoint template"""
+        with self._lock:
+            return sum(
+                count for (m, e, _), count in self._requests.items()
+                if (method is None or m == method) and (endpoint is None or e == endpoint)
+            )
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format (version 0.0.4)"""
+        with self._lock:
+            requests = sorted(self._requests.items())
+            errors = sorted(self._errors.items())
+            in_flight = sorted(self._in_flight.items())
+            durations = sorted(
+                (key, (list(h.counts), h.sum, h.count)) for key, h in self._durations.items()
+            )
+            collectors = list(self._collectors)
+
+        ns = self.namespace
+        lines: List[str] = []
+
+        def header(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        name = f"{ns}_requests_total"
+        header(name, "counter", "Requests made by the client, by endpoint and HTTP status.")
+        for labels, value in requests:
+            lines.append(f"{name}{_format_labels(('method', 'endpoint', 'status'), labels)} {value}")
+
+        name = f"{ns}_errors_total"
+        header(name, "counter", "Failed requests by exception class.")
+        for labels, value in errors:
+            lines.append(f"{name}{_format_labels(('method', 'endpoint', 'exception'), labels)} {value}")
+
+        name = f"{ns}_request_duration_seconds"
+        header(name, "histogram", "Request latency, including response decoding and validation.")
+        for labels, (counts, total, count) in durations:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                bucket_labels = _format_labels(("method", "endpoint", "le"), labels + (_format_value(bound),))
+                lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+            label_text = _format_labels(("method", "endpoint"), labels)
+            lines.append(f"{name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{name}_count{label_text} {count}")
+
+        name = f"{ns}_requests_in_flight"
+        header(name, "gauge", "Requests currently in flight.")
+        for labels, value in in_flight:
+            lines.append(f"{name}{_format_labels(('method', 'endpoint'), labels)} {value}")
+
+        gauges: Dict[str, Dict[Tuple[Tuple[str, str], ...], float]] = {}
+        for collector in collectors:
+            for sample_name, sample_labels, value in collector():
+                series = gauges.setdefault(sample_name, {})
+                label_key = tuple(sorted(sample_labels.items()))
+                series[label_key] = series.get(label_key, 0) + value
+
+        for sample_name in sorted(gauges):
+            name = f"{ns}_{sample_name}"
+            header(name, "gauge", _GAUGE_HELP.get(sample_name, sample_name.replace("_", " ").capitalize() + "."))
+            for label_key, value in sorted(gauges[sample_name].items()):
+                names = tuple(k for k, _ in label_key)
+                values = tuple(v for _, v in label_key)
+                lines.append(f"{name}{_format_labels(names, values)} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+def pool_samples(adapter) -> List[Sample]:
+    """Connection-pool usage of a requests HTTPAdapter, as collector samples"""
+    samples: List[Sample] = []
+    poolmanager = getattr(adapter, "poolmanager", None)
+    if poolmanager is None:
+        return samples
+
+    for key in list(poolmanager.pools.keys()):
+        pool = poolmanager.pools.get(key)
+        if pool is None or pool.pool is None:
+            continue
+        host = f"{pool.host}:{pool.port}" if pool.port else pool.host
+        queue = pool.pool
+        # The pool queue holds idle connections plus None placeholders for unopened slots
+        idle = sum(1 for conn in list(queue.queue) if conn is not None)
+        in_use = max(0, queue.maxsize - queue.qsize())
+        samples.append(("pool_connections", {"host": host, "state": "idle"}, idle))
+        samples.append(("pool_connections", {"host": host, "state": "in_use"}, in_use))
+        samples.append(("pool_maxsize", {"host": host}, queue.maxsize))
+    return samples
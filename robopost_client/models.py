@@ -0,0 +1,499 @@
+import uuid
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import Field, field_serializer
+
+from ._base import DeferredModel
+from .enums import (
+    AIImageModel,
+    AIVoice,
+    AutomationPostTo,
+    AutomationRecurInterval,
+    FacebookPostType,
+    GeneratedFacelessVideoSeriesContentType,
+    GeneratedFacelessVideoStyle,
+    GeneratedVideoFormat,
+    GMBCTAButtonActionType,
+    GMBPostTopicType,
+    InstagramPostType,
+    PostAIGenerateVoiceTone,
+    TikTokPrivacyLevel,
+    VideoCaptionPosition,
+    VideoColor,
+    WordpressPostType,
+    YoutubePrivacyStatus,
+    YoutubeVideoType,
+)
+
+
+# ---------------------------------------------------------
+# Models for Social Media Settings
+# ---------------------------------------------------------
+class FacebookSettings(DeferredModel):
+    postType: FacebookPostType = Field(default=FacebookPostType.POST)
+
+
+class InstagramSettings(DeferredModel):
+    postType: InstagramPostType = Field(default=InstagramPostType.POST)
+
+
+class PinterestSettings(DeferredModel):
+    pinTitle: str = ""
+    destinationLink: str = ""
+
+
+class WordpressSettings(DeferredModel):
+    postTitle: str = ""
+    postText: str = ""
+    postSlug: str = ""
+    postType: WordpressPostType = Field(default=WordpressPostType.POST)
+    postCategories: List[str] = Field(default_factory=list)
+    postTags: List[str] = Field(default_factory=list)
+    postFeaturedImage: Optional[str] = None
+    postParentPage: int = 0
+
+
+class YoutubeSettings(DeferredModel):
+    videoTitle: str = ""
+    videoType: YoutubeVideoType = Field(default=YoutubeVideoType.VIDEO)
+    videoDescription: str = ""
+    videoPrivacyStatus: YoutubePrivacyStatus = Field(default=YoutubePrivacyStatus.PUBLIC)
+    videoThumbnailImageObject: Optional[str] = None
+    videoThumbnailGroupUuid: Optional[str] = None
+
+
+class TikTokSettings(DeferredModel):
+    title: str = ""
+    privacyLevel: TikTokPrivacyLevel = Field(default=TikTokPrivacyLevel.PUBLIC_TO_EVERYONE)
+    disableDuet: bool = False
+    disableComment: bool = False
+    disableStitch: bool = False
+    videoCoverTimestampMs: int = 0
+    videoThumbnailGroupUuid: Optional[str] = None
+    autoAddMusic: bool = True
+
+
+class GMBSettings(DeferredModel):
+    postTopicType: GMBPostTopicType = Field(default=GMBPostTopicType.STANDARD)
+    offerTitle: str = ""
+    offerCouponCode: str = ""
+    offerRedeemOnlineUrl: str = ""
+    offerTermsConditions: str = ""
+    offerStartDt: Optional[datetime] = None
+    offerEndDt: Optional[datetime] = None
+    eventTitle: str = ""
+    eventStartDt: Optional[datetime] = None
+    eventEndDt: Optional[datetime] = None
+    ctaButtonActionType: GMBCTAButtonActionType = Field(default=GMBCTAButtonActionType.ACTION_TYPE_UNSPECIFIED)
+    ctaUrl: str = ""
+
+
+# ---------------------------------------------------------
+# Models for Scheduled Posts
+# ---------------------------------------------------------
+class PublicAPIScheduledPostCreateHTTPPayload(DeferredModel):
+    """
+    Represents the payload for creating a scheduled post via the Public API.
+    Includes optional lists of URLs (image_urls, video_url, gif_url) which the
+    server can handle (uploading to UploadCare, etc.) before assigning final
+    object_ids.
+    """
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()), alias="_id")
+    text: str = Field("")
+    channel_ids: List[str] = Field(default_factory=list)
+    image_object_ids: List[str] = Field(default_factory=list)
+    video_object_id: Optional[str] = Field(None)
+    gif_object_id: Optional[str] = Field(None)
+    image_urls: List[str] = Field(default_factory=list)
+    video_url: Optional[str] = Field(None)
+    gif_url: Optional[str] = Field(None)
+    facebook_settings: FacebookSettings = Field(default_factory=FacebookSettings)
+    instagram_settings: InstagramSettings = Field(default_factory=InstagramSettings)
+    pinterest_settings: PinterestSettings = Field(default_factory=PinterestSettings)
+    wordpress_settings: WordpressSettings = Field(default_factory=WordpressSettings)
+    youtube_settings: YoutubeSettings = Field(default_factory=YoutubeSettings)
+    tiktok_settings: TikTokSettings = Field(default_factory=TikTokSettings)
+    gmb_settings: GMBSettings = Field(default_factory=GMBSettings)
+    is_draft: bool = Field(False)
+    post_collection_id: Optional[str] = Field(None)
+    schedule_at: datetime = Field(default_factory=datetime.now)
+    is_recur: bool = Field(False)
+    recur_interval: Optional[AutomationRecurInterval] = Field(default=AutomationRecurInterval.DAILY)
+    recur_generate_new_ai_image: bool = Field(False)
+    recur_generate_new_ai_image_model: AIImageModel = Field(default=AIImageModel.DALLE)
+    recur_until_dt: Optional[datetime] = Field(None)
+    recur_until_dt_enabled: bool = Field(False)
+    recur_rephrase_text_with_ai: bool = Field(False)
+    recur_rephrase_text_with_ai_tone: PostAIGenerateVoiceTone = Field(default=PostAIGenerateVoiceTone.FRIENDLY)
+    daily_recur_interval_time_slots: List[str] = Field(default_factory=list)
+    weekly_recur_interval_time_slots: List[str] = Field(default_factory=list)
+    first_comment: str = Field("", description="First comment to add after posting to social media")
+
+
+class PublicAPIScheduledPostRead(DeferredModel):
+    id: str = Field(...)
+    text: str = Field("")
+    channel_ids: List[str] = Field(default_factory=list)
+    image_object_ids: List[str] = Field(default_factory=list)
+    video_object_id: Optional[str] = Field(None)
+    gif_object_id: Optional[str] = Field(None)
+
+    facebook_settings: FacebookSettings = Field(default_factory=FacebookSettings)
+    instagram_settings: InstagramSettings = Field(default_factory=InstagramSettings)
+    pinterest_settings: PinterestSettings = Field(default_factory=PinterestSettings)
+    wordpress_settings: WordpressSettings = Field(default_factory=WordpressSettings)
+    youtube_settings: YoutubeSettings = Field(default_factory=YoutubeSettings)
+    tiktok_settings: TikTokSettings = Field(default_factory=TikTokSettings)
+    gmb_settings: GMBSettings = Field(default_factory=GMBSettings)
+
+    is_draft: bool = Field(False)
+    post_collection_id: Optional[str] = Field(None)
+    schedule_at: datetime = Field(...)
+    is_recur: bool = Field(False)
+    recur_interval: AutomationRecurInterval = Field(default=AutomationRecurInterval.DAILY)
+    recur_generate_new_ai_image: bool = Field(False)
+    recur_generate_new_ai_image_model: AIImageModel = Field(default=AIImageModel.DALLE)
+    recur_until_dt: Optional[datetime] = Field(None)
+    recur_until_dt_enabled: bool = Field(False)
+    recur_rephrase_text_with_ai: bool = Field(False)
+    recur_rephrase_text_with_ai_tone: PostAIGenerateVoiceTone = Field(default=PostAIGenerateVoiceTone.FRIENDLY)
+    recur_interval_time_slots: List[str] = Field(default_factory=list)
+    first_comment: str = Field("", description="First comment to add after posting to social media")
+
+
+# ---------------------------------------------------------
+# Video Series Models
+# ---------------------------------------------------------
+class PublicAPIGeneratedFacelessVideoSeriesCreate(DeferredModel):
+    """Model for creating a new video series"""
+    name: str = Field(..., description="Name of the video series", max_length=200)
+    content_type: GeneratedFacelessVideoSeriesContentType = Field(
+        default=GeneratedFacelessVideoSeriesContentType.ELI5,
+        description="Type of content to generate"
+    )
+    style: GeneratedFacelessVideoStyle = Field(
+        default=GeneratedFacelessVideoStyle.DEFAULT,
+        description="Visual style of the videos"
+    )
+    ai_image_model: AIImageModel = Field(
+        default=AIImageModel.Z_IMAGE,
+        description="Image generation model for story visuals"
+    )
+    voice: str = Field(
+        default=AIVoice.ALICE.value,
+        description="Voice to use for narration (AI voice name or ElevenLabs voice ID)"
+    )
+    text_prefix: str = Field(
+        default="",
+        description="Text to add before the main content",
+        max_length=5000
+    )
+    text_suffix: str = Field(
+        default="",
+        description="Text to add after the main content",
+        max_length=5000
+    )
+    lang: str = Field(
+        default="en",
+        description="Language code for the content",
+        max_length=10
+    )
+    stick_to_script: bool = Field(
+        default=False,
+        description="Whether to strictly follow the script or allow AI improvisation"
+    )
+    content_custom: str = Field(
+        default="",
+        description="Custom content instructions",
+        max_length=10000
+    )
+    format: GeneratedVideoFormat = Field(
+        default=GeneratedVideoFormat.PORTRAIT,
+        description="Video format/aspect ratio"
+    )
+    max_duration: int = Field(
+        default=60,
+        ge=5,
+        le=600,
+        description="Maximum video duration in seconds"
+    )
+    prevent_text_in_video: bool = Field(
+        default=False,
+        description="Whether to prevent text overlays in the video"
+    )
+    use_knowledge_base: bool = Field(
+        default=False,
+        description="Whether to use a knowledge base for content generation"
+    )
+    knowledge_base_id: Optional[str] = Field(
+        default=None,
+        description="ID of the knowledge base to use (if use_knowledge_base is True)"
+    )
+    bgm_bucket_id: Optional[str] = Field(
+        default=None,
+        description="ID of the background music bucket to use"
+    )
+    splash_screen_object: Optional[dict] = Field(
+        default=None,
+        description="Splash screen configuration object"
+    )
+    create_scheduled_post: bool = Field(
+        default=False,
+        description="Whether to create scheduled posts when videos are generated"
+    )
+    post_to: AutomationPostTo = Field(
+        default=AutomationPostTo.DIRECT,
+        description="Where to post generated videos"
+    )
+    post_collection_ids: List[str] = Field(
+        default_factory=list,
+        description="IDs of post collections to add videos to"
+    )
+    channel_ids: List[str] = Field(
+        default_factory=list,
+        description="IDs of channels to post videos to"
+    )
+
+    # Audio settings
+    narration_volume: float = Field(
+        default=1.2,
+        ge=0.6,
+        le=1.8,
+        description="Narration audio volume multiplier"
+    )
+    bgm_volume: float = Field(
+        default=0.2,
+        ge=0.05,
+        le=0.4,
+        description="Background music volume multiplier"
+    )
+
+    # Caption settings
+    font_size: int = Field(
+        default=110,
+        ge=10,
+        le=300,
+        description="Caption font size"
+    )
+    font_color: VideoColor = Field(
+        default=VideoColor.YELLOW,
+        description="Caption text color"
+    )
+    stroke_width: int = Field(
+        default=3,
+        ge=0,
+        le=20,
+        description="Caption text stroke width"
+    )
+    stroke_color: VideoColor = Field(
+        default=VideoColor.BLACK,
+        description="Caption text stroke color"
+    )
+    shadow_strength: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=5.0,
+        description="Caption shadow strength"
+    )
+    shadow_blur: float = Field(
+        default=0.1,
+        ge=0.0,
+        le=10.0,
+        description="Caption shadow blur amount"
+    )
+    highlight_current_word: bool = Field(
+        default=True,
+        description="Whether to highlight the currently spoken word"
+    )
+    word_highlight_color: VideoColor = Field(
+        default=VideoColor.RED,
+        description="Color for highlighting current word"
+    )
+    line_count: int = Field(
+        default=1,
+        ge=1,
+        le=10,
+        description="Maximum lines of caption text on screen"
+    )
+    padding: int = Field(
+        default=50,
+        ge=0,
+        le=500,
+        description="Caption padding from screen edges in pixels"
+    )
+    position: VideoCaptionPosition = Field(
+        default=VideoCaptionPosition.CENTER_CENTER,
+        description="Caption position on screen"
+    )
+
+    # Recurrence settings
+    is_recur: bool = Field(
+        default=False,
+        description="Whether this series should generate videos on a schedule"
+    )
+    timezone: Optional[str] = Field(
+        default=None,
+        description="Timezone for scheduled generation"
+    )
+    recur_dt: Optional[datetime] = Field(
+        default=None,
+        description="Next scheduled generation time"
+    )
+    recur_interval: Optional[AutomationRecurInterval] = Field(
+        default=None,
+        description="Interval for recurring generation"
+    )
+    recur_interval_time_slots: List[str] = Field(
+        default_factory=list,
+        description="Time slots for daily recurring generation"
+    )
+    recur_interval_weekly_time_slots: List[str] = Field(
+        default_factory=list,
+        description="Time slots for weekly recurring generation"
+    )
+    recur_until_dt: Optional[datetime] = Field(
+        default=None,
+        description="When to stop recurring generation"
+    )
+    recur_until_dt_enabled: bool = Field(
+        default=False,
+        description="Whether the recur_until_dt is enabled"
+    )
+
+
+class PublicAPIGeneratedFacelessVideoSeriesUpdate(DeferredModel):
+    """Model for updating an existing video series"""
+    name: Optional[str] = Field(None, max_length=200)
+    content_type: Optional[GeneratedFacelessVideoSeriesContentType] = None
+    style: Optional[GeneratedFacelessVideoStyle] = None
+    ai_image_model: Optional[AIImageModel] = None
+    voice: Optional[str] = None
+    text_prefix: Optional[str] = Field(None, max_length=5000)
+    text_suffix: Optional[str] = Field(None, max_length=5000)
+    lang: Optional[str] = Field(None, max_length=10)
+    stick_to_script: Optional[bool] = None
+    content_custom: Optional[str] = Field(None, max_length=10000)
+    bgm_bucket_id: Optional[str] = None
+    splash_screen_object: Optional[dict] = None
+    format: Optional[GeneratedVideoFormat] = None
+    max_duration: Optional[int] = Field(None, ge=5, le=600)
+    prevent_text_in_video: Optional[bool] = None
+
+    # Audio settings
+    narration_volume: Optional[float] = Field(None, ge=0.6, le=1.8)
+    bgm_volume: Optional[float] = Field(None, ge=0.05, le=0.4)
+
+    # Caption settings
+    font_size: Optional[int] = Field(None, ge=10, le=300)
+    font_color: Optional[VideoColor] = None
+    stroke_width: Optional[int] = Field(None, ge=0, le=20)
+    stroke_color: Optional[VideoColor] = None
+    shadow_strength: Optional[float] = Field(None, ge=0.0, le=5.0)
+    shadow_blur: Optional[float] = Field(None, ge=0.0, le=10.0)
+    highlight_current_word: Optional[bool] = None
+    word_highlight_color: Optional[VideoColor] = None
+    line_count: Optional[int] = Field(None, ge=1, le=10)
+    padding: Optional[int] = Field(None, ge=0, le=500)
+    position: Optional[VideoCaptionPosition] = None
+
+    # Posting settings
+    create_scheduled_post: Optional[bool] = None
+    post_to: Optional[AutomationPostTo] = None
+    post_collection_ids: Optional[List[str]] = None
+    channel_ids: Optional[List[str]] = None
+
+    # Recurrence settings
+    is_recur: Optional[bool] = None
+    timezone: Optional[str] = None
+    recur_dt: Optional[datetime] = None
+    recur_interval: Optional[AutomationRecurInterval] = None
+    recur_interval_time_slots: Optional[List[str]] = None
+    recur_interval_weekly_time_slots: Optional[List[str]] = None
+    recur_until_dt: Optional[datetime] = None
+    recur_until_dt_enabled: Optional[bool] = None
+
+
+class PublicAPIGeneratedFacelessVideoSeriesRead(DeferredModel):
+    """Model for reading video series data"""
+    id: str = Field(..., description="Unique identifier of the video series")
+    name: str = Field(..., description="Name of the video series")
+    content_type: GeneratedFacelessVideoSeriesContentType = Field(description="Content type")
+    style: GeneratedFacelessVideoStyle = Field(description="Video style")
+    ai_image_model: AIImageModel = Field(description="Image generation model")
+    voice: str = Field(description="Voice used for narration")
+    text_prefix: str = Field(description="Text prefix")
+    text_suffix: str = Field(description="Text suffix")
+    lang: str = Field(description="Language code")
+    stick_to_script: bool = Field(description="Whether to stick to script")
+    content_custom: str = Field(description="Custom content instructions")
+    format: GeneratedVideoFormat = Field(description="Video format")
+    max_duration: int = Field(description="Maximum duration in seconds")
+    prevent_text_in_video: bool = Field(description="Whether text overlays are prevented")
+    use_knowledge_base: bool = Field(description="Whether knowledge base is used")
+    knowledge_base_id: Optional[str] = Field(description="Knowledge base ID if used")
+    bgm_bucket_id: Optional[str] = Field(description="Background music bucket ID")
+    splash_screen_object: Optional[dict] = Field(description="Splash screen configuration")
+    automation_id: Optional[str] = Field(description="Associated automation ID for recurring generation")
+    create_scheduled_post: bool = Field(description="Whether scheduled posts are created")
+    post_to: AutomationPostTo = Field(description="Where videos are posted")
+    post_collection_ids: List[str] = Field(description="Post collection IDs")
+    channel_ids: List[str] = Field(description="Channel IDs for posting")
+
+    # Audio settings
+    narration_volume: float = Field(description="Narration volume")
+    bgm_volume: float = Field(description="Background music volume")
+
+    # Caption settings
+    font_size: int = Field(description="Caption font size")
+    font_color: VideoColor = Field(description="Caption text color")
+    stroke_width: int = Field(description="Caption stroke width")
+    stroke_color: VideoColor = Field(description="Caption stroke color")
+    shadow_strength: float = Field(description="Caption shadow strength")
+    shadow_blur: float = Field(description="Caption shadow blur")
+    highlight_current_word: bool = Field(description="Whether current word is highlighted")
+    word_highlight_color: VideoColor = Field(description="Current word highlight color")
+    line_count: int = Field(description="Maximum caption lines")
+    padding: int = Field(description="Caption padding")
+    position: VideoCaptionPosition = Field(description="Caption position")
+
+    # Recurrence settings
+    is_recur: bool = Field(description="Whether series has recurring generation")
+    timezone: Optional[str] = Field(description="Timezone for scheduling")
+    recur_dt: Optional[datetime] = Field(description="Next generation time")
+    recur_interval: Optional[AutomationRecurInterval] = Field(description="Recurrence interval")
+    recur_interval_time_slots: List[str] = Field(description="Daily time slots")
+    recur_interval_weekly_time_slots: List[str] = Field(description="Weekly time slots")
+    recur_until_dt: Optional[datetime] = Field(description="End date for recurrence")
+    recur_until_dt_enabled: bool = Field(description="Whether end date is enabled")
+
+    # Metadata
+    is_deleted: bool = Field(description="Whether the series is deleted")
+    created_at: datetime = Field(description="Creation timestamp")
+    updated_at: datetime = Field(description="Last update timestamp")
+
+    @field_serializer("recur_dt", "recur_until_dt", "created_at", "updated_at", when_used="json-unless-none")
+    def _serialize_datetime(self, value: datetime) -> str:
+        return value.isoformat()
+
+
+class PublicAPIVideoTaskResponse(DeferredModel):
+    """Response model for video generation task"""
+    task_id: str = Field(..., description="Unique identifier for the video generation task")
+    video_series_id: str = Field(..., description="ID of the video series this task belongs to")
+    status: str = Field(..., description="Current status of the task")
+    created_at: datetime = Field(..., description="Task creation timestamp")
+
+    @field_serializer("created_at", when_used="json-unless-none")
+    def _serialize_datetime(self, value: datetime) -> str:
+        return value.isoformat()
+
+
+# ---------------------------------------------------------
+# Media Model
+# ---------------------------------------------------------
+class PublicAPIMediaRead(DeferredModel):
+    id: str
+    name: str
+    extension: str
+    storage_object_id: str
@@ -0,0 +1,405 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional
+
+import requests
+from requests.adapters import BaseAdapter
+from pydantic import Field
+
+from . import _forksafe
+from ._base import DeferredModel
+from .client import RobopostClient
+from .instrumentation import InstrumentedAdapter
+from .metrics import pool_samples
+
+
+class TenantStats(DeferredModel):
+    """Counters of a single tenant of a RobopostClientPool"""
+    weight: int = 1
+    rate: Optional[float] = Field(None, description="Requests per second allowed, None for unlimited")
+    queued: int = 0
+    in_flight: int = 0
+    completed: int = 0
+    failed: int = 0
+    queue_wait: float = Field(0.0, description="Total seconds calls spent queued before dispatch")
+
+
+class PoolStats(DeferredModel):
+    """Snapshot of a RobopostClientPool"""
+    tenants: int = Field(0, description="Registered tenants")
+    active_clients: int = Field(0, description="Tenants currently holding a RobopostClient")
+    queued: int = 0
+    in_flight: int = 0
+    workers: int = 0
+
+
+class _Call:
+    __slots__ = ("method", "args", "kwargs", "future", "queued_at")
+
+    def __init__(self, method: str, args: tuple, kwargs: dict):
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs
+        self.future: Future = Future()
+        self.queued_at = time.monotonic()
+
+
+class _Tenant:
+    # Slots keep idle tenants down to a few hundred bytes; the client and the queue
+    # only exist while the tenant is in use.
+    __slots__ = ("apikey", "weight", "rate", "burst", "tokens", "refilled_at", "queue", "current_weight",
+                 "client", "last_used", "in_flight", "completed", "failed", "queue_wait", "pinned")
+
+    def __init__(self, apikey: str, weight: int, rate: Optional[float], burst: int, pinned: bool):
+        self.apikey = apikey
+        self.weight = weight
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.refilled_at = time.monotonic()
+        self.queue: Optional[deque] = None
+        self.current_weight = 0
+        self.client: Optional[RobopostClient] = None
+        self.last_used = time.monotonic()
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.queue_wait = 0.0
+        self.pinned = pinned
+
+    def refill(self, now: float) -> None:
+        if self.rate is not None:
+            self.tokens = min(self.burst, self.tokens + (now - self.refilled_at) * self.rate)
+            self.refilled_at = now
+
+    def ready_in(self, now: float) -> float:
+        """Seconds until the rate limit allows the next call"""
+        if self.rate is None or self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class RobopostClientPool:
+    """
+    Serves many API keys (tenants) from one process.
+
+    All tenants share a single connection pool. Calls are queued per tenant and
+    dispatched by a fixed set of worker threads in smooth weighted round-robin
+    order, so a tenant with a large backlog cannot starve the others, and each
+    tenant can be held to its own rate limit.
+
+    A tenant's RobopostClient is created on first use and dropped again after
+    `idle_timeout` seconds without calls.
+
+        pool = RobopostClientPool(max_concurrency=32, default_rate=5)
+        pool.add_tenant("KEY_A", weight=3)
+        future = pool.submit("KEY_A", "create_scheduled_posts", payload)
+    """
+
+    def __init__(
+            self,
+            base_url: str = "https://public-api.robopost.app/v1",
+            max_concurrency: int = 16,
+            default_weight: int = 1,
+            default_rate: Optional[float] = None,
+            default_burst: int = 10,
+            idle_timeout: float = 300.0,
+            pool_maxsize: Optional[int] = None,
+            transport: Optional[BaseAdapter] = None,
+            **client_kwargs
+    ):
+        """
+        :param base_url: Base URL of the public API
+        :param max_concurrency: Calls in flight at once across all tenants
+        :param default_weight: Round-robin weight of tenants not added with add_tenant()
+        :param default_rate: Requests per second per tenant, None for unlimited
+        :param default_burst: Calls a tenant may make at once before its rate applies
+        :param idle_timeout: Seconds without calls after which a tenant's client is released
+        :param pool_maxsize: Keep-alive connections kept per host (default: max_concurrency)
+        :param transport: Optional requests transport adapter used by all tenants instead of the
+            shared connection pool, e.g. a RecordingTransport or ReplayTransport
+        :param client_kwargs: Passed to every RobopostClient (cache, hedging, metrics, ...); a dns_cache
+            is used by the shared connection pool
+        """
+        if "session" in client_kwargs:
+            raise ValueError("The pool manages the session; pass a transport= adapter to customise it")
+
+        self.base_url = base_url
+        self.max_concurrency = max(1, max_concurrency)
+        self.default_weight = default_weight
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.idle_timeout = idle_timeout
+        self.client_kwargs = client_kwargs
+
+        self.session = requests.Session()
+        dns_cache = client_kwargs.pop("dns_cache", None)
+        self._adapter = transport or InstrumentedAdapter(
+            pool_connections=4, pool_maxsize=pool_maxsize or self.max_concurrency, dns_cache=dns_cache
+        )
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+        metrics = client_kwargs.get("metrics")
+        if metrics is not None:
+            metrics.add_collector(lambda: pool_samples(self._adapter))
+
+        self._lock = threading.Lock()
+        self._work = threading.Condition(self._lock)
+        self._tenants: Dict[str, _Tenant] = {}
+        # Tenants with queued calls; the scheduler only ever looks at these
+        self._ready: Dict[str, _Tenant] = {}
+        self._workers: List[threading.Thread] = []
+        self._closed = False
+        self._in_flight = 0
+        self._last_sweep = time.monotonic()
+        _forksafe.register(self)
+
+    def _reset_after_fork(self) -> None:
+        # Queued and running calls belong to the parent, which completes them; running
+        # them here too would repeat them. Workers are started again by the next submit().
+        self._lock = threading.Lock()
+        self._work = threading.Condition(self._lock)
+        self._workers = []
+        self._ready = {}
+        self._in_flight = 0
+        for tenant in self._tenants.values():
+            tenant.queue = None
+            tenant.in_flight = 0
+            tenant.current_weight = 0
+
+    # ---------------------------------------------------------
+    # Tenants
+    # ---------------------------------------------------------
+    def add_tenant(self, apikey: str, weight: Optional[int] = None, rate: Optional[float] = None,
+                   burst: Optional[int] = None) -> None:
+        """
+        Register a tenant or change its settings. Tenants added here are kept when
+        idle; unknown keys passed to submit() are registered with the defaults and
+        forgotten again when idle.
+
+        :param apikey: Tenant API key
+        :param weight: Share of dispatch slots relative to other tenants with queued calls
+        :param rate: Requests per second allowed, None for the pool default
+        :param burst: Calls allowed at once before the rate applies
+        """
+        with self._lock:
+            tenant = self._tenants.get(apikey)
+            weight = weight or self.default_weight
+            rate = rate if rate is not None else self.default_rate
+            burst = burst or self.default_burst
+            if tenant is None:
+                self._tenants[apikey] = _Tenant(apikey, weight, rate, burst, pinned=True)
+            else:
+                tenant.weight, tenant.rate, tenant.burst, tenant.pinned = weight, rate, burst, True
+
+    def remove_tenant(self, apikey: str) -> None:
+        """Forget a tenant; its queued calls are cancelled"""
+        with self._lock:
+            tenant = self._tenants.pop(apikey, None)
+            self._ready.pop(apikey, None)
+            calls = list(tenant.queue or ()) if tenant is not None else []
+        for call in calls:
+            call.future.cancel()
+
+    def client(self, apikey: str) -> RobopostClient:
+        """
+        The tenant's RobopostClient, sharing the pool's connections. Calls made on
+        it directly bypass the pool's scheduling and rate limits.
+        """
+        with self._lock:
+            return self._client_for(self._tenant(apikey))
+
+    def _tenant(self, apikey: str) -> _Tenant:
+        # Must be called with the lock held
+        tenant = self._tenants.get(apikey)
+        if tenant is None:
+            tenant = self._tenants[apikey] = _Tenant(
+                apikey, self.default_weight, self.default_rate, self.default_burst, pinned=False
+            )
+        tenant.last_used = time.monotonic()
+        return tenant
+
+    def _client_for(self, tenant: _Tenant) -> RobopostClient:
+        # Must be called with the lock held
+        if tenant.client is None:
+            tenant.client = RobopostClient(
+                apikey=tenant.apikey, base_url=self.base_url, session=self.session, **self.client_kwargs
+            )
+        return tenant.client
+
+    def evict_idle(self) -> int:
+        """
+        Release clients of tenants idle for longer than idle_timeout, and forget
+        idle tenants that were not added with add_tenant().
+
+        :return: Number of released clients
+        """
+        now = time.monotonic()
+        released = 0
+        with self._lock:
+            self._last_sweep = now
+            for apikey, tenant in list(self._tenants.items()):
+                if tenant.queue or tenant.in_flight or now - tenant.last_used < self.idle_timeout:
+                    continue
+                if tenant.client is not None:
+                    tenant.client = None
+                    released += 1
+                if not tenant.pinned:
+                    del self._tenants[apikey]
+        return released
+
+    # ---------------------------------------------------------
+    # Calls
+    # ---------------------------------------------------------
+    def submit(self, apikey: str, method: str, *args, **kwargs) -> Future:
+        """
+        Queue a RobopostClient call for a tenant.
+
+        :param apikey: Tenant API key
+        :param method: Name of the RobopostClient method, e.g. "create_scheduled_posts"
+        :return: Future resolving to the method's result
+        """
+        if not callable(getattr(RobopostClient, method, None)) or method.startswith("_"):
+            raise AttributeError(f"RobopostClient has no public method {method!r}")
+
+        call = _Call(method, args, kwargs)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("RobopostClientPool is closed")
+            tenant = self._tenant(apikey)
+            if tenant.queue is None:
+                tenant.queue = deque()
+            tenant.queue.append(call)
+            self._ready[apikey] = tenant
+            self._start_workers()
+            self._work.notify()
+            sweep_due = time.monotonic() - self._last_sweep > self.idle_timeout / 2
+
+        if sweep_due:
+            self.evict_idle()
+        return call.future
+
+    def call(self, apikey: str, method: str, *args, **kwargs) -> Any:
+        """Like submit(), but wait for and return the result"""
+        return self.submit(apikey, method, *args, **kwargs).result()
+
+    def _start_workers(self) -> None:
+        # Must be called with the lock held
+        while len(self._workers) < self.max_concurrency:
+            worker = threading.Thread(target=self._run_worker, name=f"robopost-pool-{len(self._workers)}",
+                                      daemon=True)
+            self._workers.append(worker)
+            worker.start()
+
+    def _next_call(self) -> tuple:
+        # Must be called with the lock held. Smooth weighted round-robin over the tenants
+        # whose rate limit currently allows a call.
+        now = time.monotonic()
+        total = 0
+        chosen = None
+        wait = None
+        for tenant in self._ready.values():
+            tenant.refill(now)
+            delay = tenant.ready_in(now)
+            if delay > 0:
+                wait = delay if wait is None else min(wait, delay)
+                continue
+            tenant.current_weight += tenant.weight
+            total += tenant.weight
+            if chosen is None or tenant.current_weight > chosen.current_weight:
+                chosen = tenant
+
+        if chosen is None:
+            return None, wait
+
+        chosen.current_weight -= total
+        if chosen.rate is not None:
+            chosen.tokens -= 1
+        call = chosen.queue.popleft()
+        if not chosen.queue:
+            chosen.queue = None
+            chosen.current_weight = 0
+            del self._ready[chosen.apikey]
+        chosen.in_flight += 1
+        chosen.last_used = now
+        chosen.queue_wait += now - call.queued_at
+        self._in_flight += 1
+        return (chosen, call, self._client_for(chosen)), None
+
+    def _run_worker(self) -> None:
+        while True:
+            with self._lock:
+                while True:
+                    if self._closed:
+                        return
+                    item, wait = self._next_call() if self._ready else (None, None)
+                    if item is not None:
+                        break
+                    self._work.wait(wait)
+
+            tenant, call, client = item
+            error = None
+            if call.future.set_running_or_notify_cancel():
+                try:
+                    result = getattr(client, call.method)(*call.args, **call.kwargs)
+                except BaseException as e:
+                    error = e
+                    call.future.set_exception(e)
+                else:
+                    call.future.set_result(result)
+
+            with self._lock:
+                tenant.in_flight -= 1
+                self._in_flight -= 1
+                if error is None:
+                    tenant.completed += 1
+                else:
+                    tenant.failed += 1
+
+    # ---------------------------------------------------------
+    # Stats and Lifecycle
+    # ---------------------------------------------------------
+    def tenant_stats(self, apikey: str) -> Optional[TenantStats]:
+        with self._lock:
+            tenant = self._tenants.get(apikey)
+            if tenant is None:
+                return None
+            return TenantStats(weight=tenant.weight, rate=tenant.rate, queued=len(tenant.queue or ()),
+                               in_flight=tenant.in_flight, completed=tenant.completed, failed=tenant.failed,
+                               queue_wait=tenant.queue_wait)
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(
+                tenants=len(self._tenants),
+                active_clients=sum(1 for t in self._tenants.values() if t.client is not None),
+                queued=sum(len(t.queue) for t in self._ready.values()),
+                in_flight=self._in_flight,
+                workers=len(self._workers),
+            )
+
+    def close(self) -> None:
+        """Cancel queued calls, wait for in-flight calls and close the shared connections"""
+        with self._lock:
+            self._closed = True
+            pending = [call for tenant in self._ready.values() for call in tenant.queue]
+            for tenant in self._ready.values():
+                tenant.queue = None
+            self._ready.clear()
+            self._work.notify_all()
+            workers = list(self._workers)
+
+        for call in pending:
+            call.future.cancel()
+        for worker in workers:
+            if worker is not threading.current_thread():
+                worker.join()
+        self.session.close()
+
+    def __enter__(self) -> "RobopostClientPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
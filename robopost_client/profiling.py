@@ -0,0 +1,336 @@
+import functools
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from pydantic import Field
+
+from . import _forksafe
+from ._base import DeferredModel
+from .instrumentation import RequestInfo
+
+logger = logging.getLogger(__name__)
+
+# Sample rate of calls, e.g. "0.01"; "on" selects the default rate
+ENV_SAMPLE_RATE = "ROBOPOST_PROFILE"
+# Set to "1" to also trace allocations of model construction
+ENV_ALLOCATIONS = "ROBOPOST_PROFILE_ALLOCATIONS"
+
+DEFAULT_SAMPLE_RATE = 0.01
+
+# Phases of a request, as recorded in RequestTiming
+PHASES = ("encode", "connect", "ttfb", "transfer", "decode", "validate")
+
+
+class AllocationSite(DeferredModel):
+    """A source line allocating memory while models were built"""
+    location: str = Field(description="file:line of the allocation")
+    size: int = Field(0, description="Bytes allocated and still alive once the models were built")
+    count: int = Field(0, description="Number of allocated blocks")
+
+
+class MethodProfile(DeferredModel):
+    """Aggregated profile of one client method"""
+    calls: int = Field(0, description="Calls made, sampled or not")
+    sampled: int = Field(0, description="Calls that were timed")
+    wall_mean: float = Field(0.0, description="Mean wall time of a sampled call, in seconds")
+    wall_max: float = 0.0
+    cpu_mean: float = Field(0.0, description="Mean CPU time of the calling thread during a sampled call")
+    phases: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Mean seconds per sampled call spent encoding, connecting (TCP + TLS), waiting for the "
+                    "first byte, transferring, decoding JSON and validating models"
+    )
+    allocation_samples: int = Field(0, description="Sampled calls whose model construction was traced")
+    allocated_mean: float = Field(0.0, description="Mean bytes allocated by model construction per traced call")
+    top_allocations: List[AllocationSite] = Field(default_factory=list)
+
+    @property
+    def wall_total(self) -> float:
+        """Estimated wall time of all calls, extrapolated from the samples"""
+        return self.wall_mean * self.calls
+
+
+class _Sample:
+    __slots__ = ("name", "phases", "trace_allocations")
+
+    def __init__(self, name: str, trace_allocations: bool):
+        self.name = name
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.trace_allocations = trace_allocations
+
+
+class _Method:
+    __slots__ = ("calls", "sampled", "wall", "wall_max", "cpu", "phases", "allocation_samples", "allocated",
+                 "sites")
+
+    def __init__(self):
+        self.calls = 0
+        self.sampled = 0
+        self.wall = 0.0
+        self.wall_max = 0.0
+        self.cpu = 0.0
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.allocation_samples = 0
+        self.allocated = 0
+        self.sites: Dict[str, List[int]] = {}
+
+
+class Profiler:
+    """
+    Sampling profiler of RobopostClient methods.
+
+    A share of calls (`sample_rate`) is timed: wall time, CPU time of the
+    calling thread and the request phases of RequestTiming, i.e. encoding,
+    connecting (TCP + TLS), waiting for the first byte, transfer, JSON decoding
+    and model validation. Wall time not spent on CPU is time spent waiting for
+    the network, locks or other threads. With `trace_allocations`, a share of
+    the sampled calls also traces the memory allocated while models are built
+    with tracemalloc.
+
+    Calls that are not sampled cost a counter update and a random draw, so a
+    low rate can stay enabled in production. Pass a Profiler as `profiler=` to
+    RobopostClient, or set ROBOPOST_PROFILE to a sample rate, e.g. "0.01", and
+    ROBOPOST_PROFILE_ALLOCATIONS=1. One Profiler may be shared by several clients.
+    """
+
+    def __init__(self, sample_rate: float = DEFAULT_SAMPLE_RATE, trace_allocations: bool = False,
+                 allocation_rate: float = 0.1, top_allocations: int = 10, seed: Optional[int] = None):
+        """
+        :param sample_rate: Share of calls timed, between 0 and 1
+        :param trace_allocations: Trace memory allocated by model construction with tracemalloc
+        :param allocation_rate: Share of sampled calls whose allocations are traced
+        :param top_allocations: Allocation sites kept per method in reports
+        :param seed: Seed of the random generator choosing the samples
+        """
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.sample_rate = sample_rate
+        self.trace_allocations = trace_allocations
+        self.allocation_rate = allocation_rate
+        self.top_allocations = top_allocations
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        # tracemalloc is process-wide, so only one call is traced at a time
+        self._tracing = threading.Lock()
+        self._local = threading.local()
+        self._methods: Dict[str, _Method] = {}
+        self._started_at = time.time()
+        _forksafe.register(self)
+
+    def _reset_after_fork(self) -> None:
+        self._lock = threading.Lock()
+        self._tracing = threading.Lock()
+        self._local = threading.local()
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> Optional["Profiler"]:
+        """
+        Profiler configured by ROBOPOST_PROFILE and ROBOPOST_PROFILE_ALLOCATIONS.
+
+        :return: Profiler, or None if ROBOPOST_PROFILE is unset, empty or "0"
+        """
+        value = environ.get(ENV_SAMPLE_RATE, "").strip().lower()
+        if value in ("", "0", "off", "false", "no"):
+            return None
+        if value in ("on", "true", "yes"):
+            rate = DEFAULT_SAMPLE_RATE
+        else:
+            try:
+                rate = float(value)
+            except ValueError:
+                logger.warning("Ignoring %s=%r, expected a sample rate such as 0.01", ENV_SAMPLE_RATE, value)
+                return None
+        allocations = environ.get(ENV_ALLOCATIONS, "").strip().lower() in ("1", "on", "true", "yes")
+        return cls(sample_rate=min(1.0, max(0.0, rate)), trace_allocations=allocations)
+
+    # ---------------------------------------------------------
+    # Sampling
+    # ---------------------------------------------------------
+    def wrap(self, name: str, func: Callable) -> Callable:
+        """Wrap a client method so its calls are counted and sampled under `name`"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self._lock:
+                method = self._methods.get(name)
+                if method is None:
+                    method = self._methods[name] = _Method()
+                method.calls += 1
+                sampled = self._random.random() < self.sample_rate
+                traced = sampled and self.trace_allocations and self._random.random() < self.allocation_rate
+            if not sampled:
+                return func(*args, **kwargs)
+            return self._run_sampled(name, traced, func, args, kwargs)
+
+        return wrapper
+
+    def _run_sampled(self, name: str, traced: bool, func: Callable, args, kwargs) -> Any:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        sample = _Sample(name, traced)
+        stack.append(sample)
+        wall_start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            wall, cpu = time.perf_counter() - wall_start, time.thread_time() - cpu_start
+            stack.pop()
+            with self._lock:
+                method = self._methods[name]
+                method.sampled += 1
+                method.wall += wall
+                method.wall_max = max(method.wall_max, wall)
+                method.cpu += cpu
+                for phase, seconds in sample.phases.items():
+                    method.phases[phase] += seconds
+
+    def current(self) -> Optional[_Sample]:
+        """The sampled call running on this thread, if any"""
+        stack = getattr(self._local, "stack", None)
+        return stack[-1] if stack else None
+
+    def record_request(self, info: RequestInfo) -> None:
+        """Add the timing of a request to the sampled call running on this thread"""
+        sample = self.current()
+        if sample is None:
+            return
+        timing = info.timing
+        for phase in PHASES:
+            sample.phases[phase] += getattr(timing, phase)
+
+    def build(self, parse: Callable[[Any], Any], data: Any) -> Any:
+        """
+        Run parse(data), tracing its allocations if the current sampled call is
+        selected for it and no other call is being traced.
+        """
+        sample = self.current()
+        if sample is None or not sample.trace_allocations or not self._tracing.acquire(blocking=False):
+            return parse(data)
+        try:
+            started = not tracemalloc.is_tracing()
+            if started:
+                tracemalloc.start()
+                before = None
+            else:
+                before = tracemalloc.take_snapshot()
+            try:
+                result = parse(data)
+                snapshot = tracemalloc.take_snapshot()
+            finally:
+                if started:
+                    tracemalloc.stop()
+        finally:
+            self._tracing.release()
+
+        snapshot = snapshot.filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+        if before is not None:
+            sites = [(stat.traceback[0], stat.size_diff, stat.count_diff)
+                     for stat in snapshot.compare_to(before, "lineno") if stat.size_diff > 0]
+        else:
+            sites = [(stat.traceback[0], stat.size, stat.count) for stat in snapshot.statistics("lineno")]
+        with self._lock:
+            method = self._methods[sample.name]
+            method.allocation_samples += 1
+            for frame, size, count in sites:
+                method.allocated += size
+                site = method.sites.setdefault(f"{frame.filename}:{frame.lineno}", [0, 0])
+                site[0] += size
+                site[1] += count
+        return result
+
+    # ---------------------------------------------------------
+    # Reports
+    # ---------------------------------------------------------
+    def report(self) -> Dict[str, MethodProfile]:
+        """Aggregated profile of every method called so far, by method name"""
+        with self._lock:
+            result = {}
+            for name, method in self._methods.items():
+                sampled = method.sampled or 1
+                traced = method.allocation_samples or 1
+                sites = sorted(method.sites.items(), key=lambda item: item[1][0], reverse=True)
+                result[name] = MethodProfile(
+                    calls=method.calls,
+                    sampled=method.sampled,
+                    wall_mean=method.wall / sampled,
+                    wall_max=method.wall_max,
+                    cpu_mean=method.cpu / sampled,
+                    phases={phase: seconds / sampled for phase, seconds in method.phases.items()},
+                    allocation_samples=method.allocation_samples,
+                    allocated_mean=method.allocated / traced,
+                    top_allocations=[
+                        AllocationSite(location=location, size=size // traced, count=count // traced)
+                        for location, (size, count) in sites[:self.top_allocations]
+                    ],
+                )
+            return result
+
+    def format_report(self) -> str:
+        """The report as a text table, methods with the most estimated wall time first"""
+        profiles = sorted(self.report().items(), key=lambda item: item[1].wall_total, reverse=True)
+        lines = [
+            f"Robopost client profile: {time.time() - self._started_at:.0f}s, sample rate {self.sample_rate:g}",
+            f"{'method':<32}{'calls':>9}{'sampled':>9}{'wall ms':>10}{'cpu ms':>9}{'max ms':>9}  "
+            + " ".join(f"{phase:>8}" for phase in PHASES),
+        ]
+        for name, profile in profiles:
+            lines.append(
+                f"{name:<32}{profile.calls:>9}{profile.sampled:>9}{profile.wall_mean * 1000:>10.2f}"
+                f"{profile.cpu_mean * 1000:>9.2f}{profile.wall_max * 1000:>9.2f}  "
+                + " ".join(f"{profile.phases.get(phase, 0.0) * 1000:>8.2f}" for phase in PHASES)
+            )
+        for name, profile in profiles:
+            if not profile.top_allocations:
+                continue
+            lines.append(f"\n{name}: {profile.allocated_mean / 1024:.1f} KiB allocated per call building models "
+                         f"({profile.allocation_samples} traced)")
+            for site in profile.top_allocations:
+                lines.append(f"  {site.size / 1024:>10.1f} KiB {site.count:>7} blocks  {site.location}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: Optional[str] = None) -> None:
+        """
+        Write the report to a file, as JSON if the path ends with ".json" and as
+        text otherwise, or as text to stderr without a path.
+        """
+        if path is None:
+            sys.stderr.write(self.format_report())
+            return
+        if path.endswith(".json"):
+            text = json.dumps({name: profile.model_dump(mode="json") for name, profile in self.report().items()},
+                              indent=2)
+        else:
+            text = self.format_report()
+        with open(os.path.expanduser(path), "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def dump_on_signal(self, signum: Optional[int] = None, path: Optional[str] = None) -> None:
+        """
+        Dump the report whenever the process receives a signal, e.g. `kill -USR2 <pid>`.
+        Must be called from the main thread.
+
+        The handler may interrupt the main thread while it holds the profiler's
+        lock, so the report is written by a separate thread.
+
+        :param signum: Signal number; SIGUSR2 by default
+        :param path: File the report is written to; stderr if None
+        """
+        import signal
+
+        def handler(*_):
+            threading.Thread(target=self.dump, args=(path,), name="robopost-profile-dump", daemon=True).start()
+
+        signal.signal(signal.SIGUSR2 if signum is None else signum, handler)
+
+    def reset(self) -> None:
+        """Forget everything recorded so far"""
+        with self._lock:
+            self._methods.clear()
+            self._started_at = time.time()
@@ -0,0 +1,473 @@
+"""
+Transport-agnostic description of the Robopost public API.
+
+Every endpoint is described once, as a function returning a RequestSpec: the
+HTTP method, path, query parameters, how to encode the body and how to turn the
+decoded JSON into models. Nothing here performs I/O, so the same specs drive the
+synchronous RobopostClient, the AsyncRobopostClient and any custom transport,
+and encoding and decoding can be measured without a network:
+
+    spec = protocol.list_media(skip=0, limit=50)
+    url, params = spec.url(base_url), spec.query(apikey)
+    ...                                   # send it with any HTTP library
+    media = protocol.parse_response(spec, status, body)
+"""
+import json
+import os
+import stat
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .enums import GeneratedFacelessVideoProcessState
+from .exceptions import RobopostAPIError, RobopostPlanLimitError
+from .models import (
+    PublicAPIGeneratedFacelessVideoSeriesCreate,
+    PublicAPIGeneratedFacelessVideoSeriesRead,
+    PublicAPIGeneratedFacelessVideoSeriesUpdate,
+    PublicAPIMediaRead,
+    PublicAPIScheduledPostCreateHTTPPayload,
+    PublicAPIScheduledPostRead,
+    PublicAPIVideoTaskResponse,
+)
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Compression level of gzipped request bodies: most of the size reduction of level 9
+# on JSON, at a fraction of its CPU time
+GZIP_LEVEL = 6
+
+Body = Union[str, bytes, "MultipartBody"]
+
+# Media content accepted for uploads: a buffer, a binary file object or byte chunks
+MediaContent = Union[bytes, bytearray, memoryview, BinaryIO, Iterable[bytes]]
+
+# Block size in which file objects are read while an upload is sent
+CHUNK_SIZE = 1024 * 1024
+
+
+class RequestSpec:
+    """
+    One API call: what to send and how to read the answer.
+
+    `encode` produces the request body on demand, so its cost can be attributed
+    (and skipped by transports that never send). `parse` receives the decoded
+    JSON of a successful response and returns the result of the call.
+    """
+    __slots__ = ("method", "path", "params", "headers", "encode", "parse")
+
+    def __init__(
+            self,
+            method: str,
+            path: str,
+            parse: Callable[[Any], Any],
+            params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None,
+            encode: Optional[Callable[[], Body]] = None
+    ):
+        self.method = method
+        self.path = path
+        self.parse = parse
+        self.params = params
+        self.headers = headers
+        self.encode = encode
+
+    def url(self, base_url: str) -> str:
+        return f"{base_url}/{self.path.lstrip('/')}"
+
+    def query(self, apikey: str) -> Dict[str, Any]:
+        """Query parameters including the API key, as a new dict"""
+        return dict(self.params or (), apikey=apikey)
+
+    def body(self) -> Optional[Body]:
+        return self.encode() if self.encode is not None else None
+
+    def __repr__(self) -> str:
+        return f"RequestSpec({self.method} {self.path})"
+
+
+# ---------------------------------------------------------
+# Responses
+# ---------------------------------------------------------
+def api_error(status: int, data: Any) -> RobopostAPIError:
+    """
+    Map the decoded JSON body of a failed response to the matching exception.
+
+    :param status: HTTP status code
+    :param data: Decoded JSON error body
+    :return: RobopostPlanLimitError for plan limits, RobopostAPIError otherwise
+    """
+    if not isinstance(data, dict):
+        return RobopostAPIError(str(data), status_code=status, response_data=None)
+    if status == 409 and "plan limit" in str(data).lower():
+        return RobopostPlanLimitError(
+            data.get('message', 'Plan limit reached'),
+            limit=data.get('limit'),
+            current_usage=data.get('current_usage')
+        )
+    return RobopostAPIError(
+        data.get('detail', data.get('message', 'API request failed')),
+        status_code=status,
+        response_data=data
+    )
+
+
+def error_response(status: int, body: Union[bytes, str]) -> RobopostAPIError:
+    """
+    Exception for an error response, whether or not its body is JSON.
+
+    :param status: HTTP status code
+    :param body: Response body
+    :return: RobopostPlanLimitError for plan limits, RobopostAPIError otherwise
+    """
+    try:
+        data = json.loads(body)
+    except ValueError:
+        text = body.decode("utf-8", "replace") if isinstance(body, bytes) else body
+        return RobopostAPIError(text or f"HTTP {status}", status_code=status)
+    return api_error(status, data)
+
+
+def decode_body(parse: Callable[[Any], Any], status: int, body: Union[bytes, str]) -> Any:
+    """
+    Decode the JSON body of a successful response, before it is parsed.
+
+    :param parse: Parser of the spec the request was sent from
+    :param status: HTTP status code
+    :param body: Response body
+    :return: Decoded JSON; None for an empty body of an endpoint returning raw JSON
+    :raises: RobopostAPIError for an empty body where a model is expected
+    """
+    if body:
+        return json.loads(body)
+    if parse is _raw:
+        return None
+    raise RobopostAPIError(f"Empty response body where a result was expected (HTTP {status})", status_code=status)
+
+
+def parse_response(spec: RequestSpec, status: int, body: Union[bytes, str]) -> Any:
+    """
+    Turn a raw response into the result of a call.
+
+    :param spec: Spec the request was sent from
+    :param status: HTTP status code
+    :param body: Response body
+    :return: Parsed result, e.g. a PublicAPIMediaRead
+    :raises: RobopostAPIError or RobopostPlanLimitError for error responses
+    """
+    if status >= 400:
+        raise error_response(status, body)
+    return spec.parse(decode_body(spec.parse, status, body))
+
+
+# ---------------------------------------------------------
+# Parsers
+# ---------------------------------------------------------
+def _raw(data: Any) -> Any:
+    return data
+
+
+def _media(data: dict) -> PublicAPIMediaRead:
+    return PublicAPIMediaRead(**data)
+
+
+def _media_list(data: list) -> List[PublicAPIMediaRead]:
+    return [PublicAPIMediaRead(**item) for item in data]
+
+
+def _scheduled_posts(data: dict) -> List[PublicAPIScheduledPostRead]:
+    return [PublicAPIScheduledPostRead(**item) for item in data["scheduled_posts"]]
+
+
+def _video_series(data: dict) -> PublicAPIGeneratedFacelessVideoSeriesRead:
+    return PublicAPIGeneratedFacelessVideoSeriesRead(**data)
+
+
+def _video_series_list(data: list) -> List[PublicAPIGeneratedFacelessVideoSeriesRead]:
+    return [PublicAPIGeneratedFacelessVideoSeriesRead(**item) for item in data]
+
+
+def _video_task(data: dict) -> PublicAPIVideoTaskResponse:
+    return PublicAPIVideoTaskResponse(**data)
+
+
+def _video_task_list(data: list) -> List[PublicAPIVideoTaskResponse]:
+    return [PublicAPIVideoTaskResponse(**item) for item in data]
+
+
+# ---------------------------------------------------------
+# Multipart Encoding
+# ---------------------------------------------------------
+class MultipartBody:
+    """
+    A multipart/form-data body holding a single file, produced chunk by chunk.
+
+    The content is never copied into the body. Buffers are sent as they are,
+    file objects are read in CHUNK_SIZE blocks and iterables are passed through.
+    `len` is the body size when the content size is known, so the request gets
+    a Content-Length; otherwise it is None and requests falls back to chunked
+    transfer encoding. File objects and iterators can only be sent once.
+    """
+
+    def __init__(self, field: str, filename: str, content: MediaContent, boundary: str,
+                 content_type: Optional[str] = None, size: Optional[int] = None):
+        """
+        :param field: Form field name
+        :param filename: File name reported in the part headers
+        :param content: Buffer, binary file object or iterable of byte chunks
+        :param boundary: Multipart boundary, also to be sent in the Content-Type header
+        :param content_type: Optional MIME type of the file
+        :param size: Content size in bytes, for iterables whose size cannot be determined
+        """
+        if isinstance(content, str):
+            raise TypeError("Media content must be bytes-like, a binary file or an iterable of bytes, not str")
+        disposition = f'Content-Disposition: form-data; name="{field}"; filename="{_quote(filename)}"\r\n'
+        if content_type:
+            disposition += f"Content-Type: {content_type}\r\n"
+        self.head = f"--{boundary}\r\n{disposition}\r\n".encode("utf-8")
+        self.tail = f"\r\n--{boundary}--\r\n".encode("ascii")
+        self.content = content
+        if size is None:
+            size = _content_size(content)
+        self.len: Optional[int] = len(self.head) + size + len(self.tail) if size is not None else None
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.head
+        yield from _chunks(self.content)
+        yield self.tail
+
+    def __bytes__(self) -> bytes:
+        """The whole body in one buffer, for transports that cannot stream"""
+        return b"".join(self)
+
+    def __repr__(self) -> str:
+        return f"MultipartBody(len={self.len})"
+
+
+def encode_multipart(field: str, filename: str, content: bytes, boundary: str,
+                     content_type: Optional[str] = None) -> bytes:
+    """Encode a single file as a multipart/form-data body"""
+    return bytes(MultipartBody(field, filename, content, boundary, content_type))
+
+
+def media_filename(content: MediaContent, filename: Optional[str] = None) -> str:
+    """
+    File name reported for uploaded content: the given one, or the base name of a file object.
+
+    :raises: ValueError if content without a name is given no filename
+    """
+    if filename:
+        return filename
+    name = getattr(content, "name", None)
+    if isinstance(name, str) and name:
+        return os.path.basename(name)
+    raise ValueError("A filename is required to upload content that is not a named file")
+
+
+def _quote(filename: str) -> str:
+    return filename.replace("\r", "%0D").replace("\n", "%0A").replace('"', "%22")
+
+
+def _buffer(content: Any) -> Optional[memoryview]:
+    if isinstance(content, memoryview):
+        return content
+    if hasattr(content, "read"):
+        return None
+    try:
+        return memoryview(content)
+    except TypeError:
+        return None
+
+
+def _content_size(content: MediaContent) -> Optional[int]:
+    buffer = _buffer(content)
+    if buffer is not None:
+        return buffer.nbytes
+    if not hasattr(content, "read"):
+        return None
+    try:
+        position = content.tell()
+        try:
+            status = os.fstat(content.fileno())
+        except (OSError, AttributeError, ValueError):
+            status = None
+        if status is not None and stat.S_ISREG(status.st_mode):
+            return status.st_size - position
+        content.seek(0, os.SEEK_END)
+        end = content.tell()
+        content.seek(position)
+        return end - position
+    except (OSError, AttributeError, ValueError):
+        # Pipes, sockets and other unseekable streams
+        return None
+
+
+def _chunks(content: MediaContent) -> Iterator[bytes]:
+    buffer = _buffer(content)
+    if buffer is not None:
+        if buffer.nbytes:
+            yield buffer.cast("B") if buffer.c_contiguous else buffer.tobytes()
+    elif hasattr(content, "read"):
+        while True:
+            block = content.read(CHUNK_SIZE)
+            if not block:
+                break
+            yield block
+    else:
+        for chunk in content:
+            if isinstance(chunk, str):
+                raise TypeError("Media chunks must be bytes-like, not str")
+            # An empty chunk would end a chunked body early
+            if chunk:
+                yield chunk
+
+
+# ---------------------------------------------------------
+# Compression
+# ---------------------------------------------------------
+def gzip_body(body: Optional[Body], headers: Optional[Dict[str, str]], min_size: int,
+              level: int = GZIP_LEVEL) -> Tuple[Optional[Body], Optional[Dict[str, str]]]:
+    """
+    Gzip a JSON request body of at least `min_size` bytes.
+
+    Other bodies are returned unchanged: multipart uploads carry media files,
+    which are compressed already.
+
+    :param body: Encoded request body
+    :param headers: Request headers of the spec; never modified
+    :param min_size: Smallest body in bytes worth compressing
+    :param level: gzip compression level, 1 (fastest) to 9 (smallest)
+    :return: Tuple of (body, headers) to send, with Content-Encoding set if compressed
+    """
+    if body is None or headers is None or headers.get("Content-Type") != JSON_HEADERS["Content-Type"]:
+        return body, headers
+    data = body.encode("utf-8") if isinstance(body, str) else body
+    if len(data) < min_size:
+        return body, headers
+    import gzip
+
+    return gzip.compress(data, compresslevel=level, mtime=0), dict(headers, **{"Content-Encoding": "gzip"})
+
+
+# ---------------------------------------------------------
+# Endpoints
+# ---------------------------------------------------------
+def upload_media(filename: str, file: MediaContent, content_type: Optional[str] = None,
+                 size: Optional[int] = None) -> RequestSpec:
+    """
+    POST /medias/upload
+
+    :param filename: File name reported to the API
+    :param file: File contents as bytes or another buffer, a binary file object or an iterable of
+        byte chunks; streamed when the body is sent
+    :param content_type: Optional MIME type of the file
+    :param size: Content size in bytes, for iterables whose size cannot be determined
+    """
+    boundary = os.urandom(16).hex()
+    return RequestSpec(
+        "POST", "/medias/upload", _media,
+        headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+        encode=lambda: MultipartBody("file", filename, file, boundary, content_type, size),
+    )
+
+
+def list_media(skip: int = 0, limit: int = 50) -> RequestSpec:
+    return RequestSpec("GET", "/medias/", _media_list, params={"skip": skip, "limit": limit})
+
+
+def get_media(media_id: str) -> RequestSpec:
+    return RequestSpec("GET", f"/medias/{media_id}", _media)
+
+
+def delete_media(media_id: str) -> RequestSpec:
+    return RequestSpec("DELETE", f"/medias/{media_id}", _raw)
+
+
+def create_scheduled_posts(payload: PublicAPIScheduledPostCreateHTTPPayload) -> RequestSpec:
+    return RequestSpec("POST", "/scheduled_posts/", _scheduled_posts, headers=JSON_HEADERS,
+                       encode=payload.model_dump_json)
+
+
+def create_video_series(payload: PublicAPIGeneratedFacelessVideoSeriesCreate) -> RequestSpec:
+    return RequestSpec("POST", "/video-series/", _video_series, headers=JSON_HEADERS,
+                       encode=payload.model_dump_json)
+
+
+def list_video_series(
+        search_text: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 10,
+        sort_by_field: str = "created_at",
+        sort_order: str = "desc"
+) -> RequestSpec:
+    params = {
+        "skip": skip,
+        "limit": limit,
+        "sort_by_field": sort_by_field,
+        "sort_order": sort_order
+    }
+
+    if search_text:
+        params["search_text"] = search_text
+
+    return RequestSpec("GET", "/video-series/", _video_series_list, params=params)
+
+
+def get_video_series(series_id: str) -> RequestSpec:
+    return RequestSpec("GET", f"/video-series/{series_id}", _video_series)
+
+
+def update_video_series(series_id: str, payload: PublicAPIGeneratedFacelessVideoSeriesUpdate) -> RequestSpec:
+    return RequestSpec("PUT", f"/video-series/{series_id}", _video_series, headers=JSON_HEADERS,
+                       encode=lambda: payload.model_dump_json(exclude_unset=True))
+
+
+def delete_video_series(series_id: str) -> RequestSpec:
+    return RequestSpec("DELETE", f"/video-series/{series_id}", _raw)
+
+
+def generate_video(series_id: str) -> RequestSpec:
+    return RequestSpec("POST", f"/video-tasks/{series_id}/generate", _video_task)
+
+
+def get_video_task(task_id: str) -> RequestSpec:
+    return RequestSpec("GET", f"/video-tasks/{task_id}", _video_task)
+
+
+def list_video_tasks(
+        series_id: Optional[str] = None,
+        status: Optional[GeneratedFacelessVideoProcessState] = None,
+        skip: int = 0,
+        limit: int = 10,
+        sort_order: str = "desc"
+) -> RequestSpec:
+    params = {
+        "skip": skip,
+        "limit": limit,
+        "sort_order": sort_order
+    }
+
+    if series_id:
+        params["series_id"] = series_id
+
+    if status:
+        params["status"] = status.value
+
+    return RequestSpec("GET", "/video-tasks/", _video_task_list, params=params)
+
+
+def get_video_task_details(task_id: str) -> RequestSpec:
+    return RequestSpec("GET", f"/video-tasks/{task_id}/details", _raw)
+
+
+def cancel_video_task(task_id: str) -> RequestSpec:
+    return RequestSpec("DELETE", f"/video-tasks/{task_id}", _raw)
+
+
+# Endpoint name -> spec builder, matching the RobopostClient method names
+ENDPOINTS: Dict[str, Callable[..., RequestSpec]] = {
+    func.__name__: func for func in (
+        upload_media, list_media, get_media, delete_media,
+        create_scheduled_posts,
+        create_video_series, list_video_series, get_video_series, update_video_series, delete_video_series,
+        generate_video, get_video_task, list_video_tasks, get_video_task_details, cancel_video_task,
+    )
+}
@@ -0,0 +1,237 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from pydantic import Field
+
+from . import _forksafe
+from ._base import DeferredModel
+from .exceptions import RobopostPlanLimitError, RobopostQuotaExhaustedError
+from .metrics import endpoint_template
+
+# Calls that consume plan quota, by method and endpoint template
+QUOTA_GROUPS: Dict[Tuple[str, str], str] = {
+    ("POST", "/scheduled_posts/"): "scheduled_posts",
+    ("POST", "/video-series/"): "video_series",
+    ("POST", "/video-tasks/{id}/generate"): "video_generation",
+}
+
+# Calls that give quota back
+QUOTA_RELEASES: Dict[Tuple[str, str], str] = {
+    ("DELETE", "/video-series/{id}"): "video_series",
+}
+
+
+def _created(result: Any) -> int:
+    return len(result) if isinstance(result, list) else 1
+
+
+class QuotaStats(DeferredModel):
+    """What is known about one quota of one API key"""
+    limit: Optional[int] = Field(None, description="Plan limit, once learned from a plan limit error")
+    usage: Optional[int] = Field(None, description="Estimated usage: the server's last figure plus calls since")
+    remaining: Optional[int] = Field(None, description="Estimated calls left, None while the limit is unknown")
+    exhausted: bool = False
+    paused_for: float = Field(0.0, description="Seconds until calls are sent to the server again")
+    rejected_locally: int = Field(0, description="Calls failed without a request while exhausted")
+
+
+class _Quota:
+    __slots__ = ("limit", "usage", "exhausted_until", "probing", "rejected", "learned_at")
+
+    def __init__(self):
+        self.limit: Optional[int] = None
+        self.usage: Optional[int] = None
+        self.exhausted_until: Optional[float] = None
+        # A call sent after the pause is in flight; others are held back until it returns
+        self.probing = False
+        self.rejected = 0
+        self.learned_at = 0.0
+
+
+class QuotaTracker:
+    """
+    Remembers plan limits per API key and endpoint group, so calls that are
+    bound to fail with RobopostPlanLimitError fail locally instead.
+
+    A limit is learned from the `limit` and `current_usage` of a plan limit
+    error; successful creates and deletes then keep the usage estimate current.
+    Once a group is known to be exhausted, its calls raise
+    RobopostQuotaExhaustedError (or wait, with `wait=True`) for `pause` seconds.
+    After the pause one call goes to the server again, in case the plan was
+    upgraded or the quota reset; other calls are held back until it returns.
+    Learned limits are forgotten after `ttl`.
+
+    Groups are "scheduled_posts", "video_series" and "video_generation". One
+    tracker may be shared by several clients and a RobopostClientPool.
+    """
+
+    def __init__(self, pause: float = 300.0, ttl: float = 24 * 3600.0, wait: bool = False,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        :param pause: Seconds calls to an exhausted group are held back before the server is asked again
+        :param ttl: Seconds a learned limit is trusted
+        :param wait: Block calls until the pause ends instead of raising
+        :param clock: Monotonic time source
+        """
+        self.pause = pause
+        self.ttl = ttl
+        self.wait = wait
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Notified when a probe returns or quota is released
+        self._changed = threading.Condition(self._lock)
+        self._quotas: Dict[Tuple[str, str], _Quota] = {}
+        _forksafe.register(self)
+
+    def _reset_after_fork(self) -> None:
+        # Learned limits still hold in the child; probes in flight belong to the parent
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        for quota in self._quotas.values():
+            if quota.probing:
+                quota.probing = False
+                quota.exhausted_until = 0.0
+
+    @staticmethod
+    def group_for(method: str, endpoint: str) -> Optional[str]:
+        """Quota group consumed by a call, or None"""
+        return QUOTA_GROUPS.get((method, endpoint_template(endpoint)))
+
+    @staticmethod
+    def release_group_for(method: str, endpoint: str) -> Optional[str]:
+        """Quota group freed by a call, or None"""
+        return QUOTA_RELEASES.get((method, endpoint_template(endpoint)))
+
+    def _expired(self, quota: _Quota, now: float) -> bool:
+        return quota.limit is not None and now - quota.learned_at > self.ttl
+
+    def _quota(self, apikey: str, group: str) -> _Quota:
+        # Must be called with the lock held
+        quota = self._quotas.get((apikey, group))
+        if quota is None or self._expired(quota, self._clock()):
+            quota = self._quotas[(apikey, group)] = _Quota()
+        return quota
+
+    # ---------------------------------------------------------
+    # Admission and Learning
+    # ---------------------------------------------------------
+    def check(self, apikey: str, group: str) -> None:
+        """
+        Called before a call consuming quota is sent.
+
+        After the pause, the first caller probes the server and must report the
+        outcome with record_success(), record_limit() or record_error().
+
+        :raises: RobopostQuotaExhaustedError while the group is paused or probed and `wait` is off
+        """
+        with self._changed:
+            while True:
+                quota = self._quota(apikey, group)
+                if quota.probing:
+                    delay = None
+                elif quota.exhausted_until is None:
+                    return
+                else:
+                    delay = quota.exhausted_until - self._clock()
+                    if delay <= 0:
+                        # The pause is over: let this call probe the server
+                        quota.exhausted_until = None
+                        quota.probing = True
+                        return
+                if not self.wait:
+                    quota.rejected += 1
+                    if delay is None:
+                        message = f"Plan limit for {group} reached; another call is checking whether it still applies"
+                    else:
+                        message = f"Plan limit for {group} reached; not retrying for {delay:.0f}s"
+                    raise RobopostQuotaExhaustedError(
+                        message, limit=quota.limit, current_usage=quota.usage, group=group,
+                        retry_after=delay or 0.0
+                    )
+                self._changed.wait(delay)
+
+    def record_limit(self, apikey: str, group: str, error: RobopostPlanLimitError) -> None:
+        """Learn from a plan limit error returned by the server"""
+        with self._lock:
+            quota = self._quota(apikey, group)
+            if error.limit is not None:
+                quota.limit = error.limit
+            quota.usage = error.current_usage if error.current_usage is not None else quota.limit
+            quota.learned_at = self._clock()
+            quota.exhausted_until = quota.learned_at + self.pause
+            quota.probing = False
+            self._changed.notify_all()
+
+    def record_success(self, apikey: str, group: str, result: Any) -> None:
+        """Count the quota used by a successful create"""
+        with self._lock:
+            quota = self._quota(apikey, group)
+            if quota.probing:
+                # The limit no longer applies, so the usage learned with it is stale
+                quota.probing = False
+                quota.usage = None
+                self._changed.notify_all()
+            if quota.usage is not None:
+                quota.usage += _created(result)
+            if quota.limit is not None and quota.usage is not None and quota.usage >= quota.limit:
+                quota.exhausted_until = self._clock() + self.pause
+
+    def record_error(self, apikey: str, group: str) -> None:
+        """A call failed for another reason than its plan limit; a probe is left to the next caller"""
+        with self._lock:
+            quota = self._quota(apikey, group)
+            if quota.probing:
+                quota.probing = False
+                quota.exhausted_until = self._clock()
+                self._changed.notify_all()
+
+    def record_release(self, apikey: str, group: str) -> None:
+        """Give back the quota of a deleted resource"""
+        with self._lock:
+            quota = self._quota(apikey, group)
+            if quota.usage is not None:
+                quota.usage = max(0, quota.usage - 1)
+            if quota.limit is None or quota.usage is None or quota.usage < quota.limit:
+                quota.exhausted_until = None
+                self._changed.notify_all()
+
+    def reset(self, apikey: Optional[str] = None) -> None:
+        """Forget what was learned, for one API key or all of them"""
+        with self._lock:
+            for key in list(self._quotas):
+                if apikey is None or key[0] == apikey:
+                    del self._quotas[key]
+
+    # ---------------------------------------------------------
+    # Estimates
+    # ---------------------------------------------------------
+    def remaining(self, apikey: str, group: str) -> Optional[int]:
+        """
+        Estimated calls left in a group before its plan limit.
+
+        :return: Remaining count, or None while the limit is unknown
+        """
+        return self.stats(apikey).get(group, QuotaStats()).remaining
+
+    def stats(self, apikey: str) -> Dict[str, QuotaStats]:
+        """What is known about each quota group of an API key"""
+        now = self._clock()
+        with self._lock:
+            result = {}
+            for (key, group), quota in self._quotas.items():
+                if key != apikey or self._expired(quota, now):
+                    continue
+                remaining = None
+                if quota.limit is not None and quota.usage is not None:
+                    remaining = max(0, quota.limit - quota.usage)
+                paused_for = max(0.0, quota.exhausted_until - now) if quota.exhausted_until is not None else 0.0
+                result[group] = QuotaStats(
+                    limit=quota.limit,
+                    usage=quota.usage,
+                    remaining=remaining,
+                    exhausted=paused_for > 0,
+                    paused_for=paused_for,
+                    rejected_locally=quota.rejected,
+                )
+            return result
@@ -0,0 +1,257 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pydantic import Field
+
+from ._base import DeferredModel
+from .models import (
+    PublicAPIGeneratedFacelessVideoSeriesCreate,
+    PublicAPIGeneratedFacelessVideoSeriesRead,
+    PublicAPIGeneratedFacelessVideoSeriesUpdate,
+)
+
+
+# Fields that can be both declared on create and changed with a PUT. Fields that
+# only exist on create (e.g. use_knowledge_base) cannot be reconciled in place.
+RECONCILABLE_FIELDS = tuple(
+    name for name in PublicAPIGeneratedFacelessVideoSeriesUpdate.model_fields
+    if name in PublicAPIGeneratedFacelessVideoSeriesCreate.model_fields
+)
+
+
+# ---------------------------------------------------------
+# Plan Models
+# ---------------------------------------------------------
+class VideoSeriesUpdateOp(DeferredModel):
+    """A single minimal update for an existing video series"""
+    series_id: str = Field(..., description="ID of the live video series")
+    name: str = Field(..., description="Name of the live video series")
+    payload: PublicAPIGeneratedFacelessVideoSeriesUpdate = Field(..., description="Only the changed fields")
+
+    @property
+    def changed_fields(self) -> List[str]:
+        return sorted(self.payload.model_fields_set)
+
+
+class ReconcilePlan(DeferredModel):
+    """The set of operations needed to bring live video series in line with the desired ones"""
+    creates: List[PublicAPIGeneratedFacelessVideoSeriesCreate] = Field(default_factory=list)
+    updates: List[VideoSeriesUpdateOp] = Field(default_factory=list)
+    deletes: List[PublicAPIGeneratedFacelessVideoSeriesRead] = Field(default_factory=list)
+    unchanged: List[PublicAPIGeneratedFacelessVideoSeriesRead] = Field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.creates or self.updates or self.deletes)
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            "create": len(self.creates),
+            "update": len(self.updates),
+            "delete": len(self.deletes),
+            "unchanged": len(self.unchanged),
+        }
+
+
+class ReconcileResult(DeferredModel):
+    """Outcome of applying a ReconcilePlan"""
+    created: List[PublicAPIGeneratedFacelessVideoSeriesRead] = Field(default_factory=list)
+    updated: List[PublicAPIGeneratedFacelessVideoSeriesRead] = Field(default_factory=list)
+    deleted: List[str] = Field(default_factory=list)
+    errors: List[Tuple[str, str, str]] = Field(
+        default_factory=list,
+        description="(operation, series name, error message) for each failed operation"
+    )
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+# ---------------------------------------------------------
+# Reconciler
+# ---------------------------------------------------------
+def diff_video_series(
+        desired: PublicAPIGeneratedFacelessVideoSeriesCreate,
+        live: PublicAPIGeneratedFacelessVideoSeriesRead
+) -> Optional[PublicAPIGeneratedFacelessVideoSeriesUpdate]:
+    """
+    Compute the minimal update turning a live video series into the desired one.
+
+    Only fields explicitly set on the desired series are compared, so a live value
+    of a field the config leaves out is kept rather than reset to its default.
+    Values are compared in their JSON form, so enums and their raw string values
+    are treated as equal.
+
+    :param desired: Desired video series configuration
+    :param live: Current video series as returned by the API
+    :return: An update containing only the changed fields, or None if nothing changed
+    """
+    desired_data = desired.model_dump(mode="json", include=set(RECONCILABLE_FIELDS), exclude_unset=True)
+    live_data = live.model_dump(mode="json", include=set(desired_data))
+
+    changes = {
+        field: getattr(desired, field)
+        for field in RECONCILABLE_FIELDS
+        if field in desired_data and desired_data[field] != live_data.get(field)
+    }
+
+    if not changes:
+        return None
+
+    return PublicAPIGeneratedFacelessVideoSeriesUpdate(**changes)
+
+
+class VideoSeriesReconciler:
+    """
+    Declaratively keeps the account's faceless video series in sync with a list
+    of desired PublicAPIGeneratedFacelessVideoSeriesCreate definitions.
+
+    Desired and live series are matched by key (the series name by default).
+    Work is split into plan() and apply() so the plan can be reviewed before
+    anything is changed; no-op updates are never sent.
+    """
+
+    def __init__(
+            self,
+            client,
+            key: Callable[[Any], str] = lambda series: series.name,
+            prune: bool = False,
+            concurrency: int = 8,
+            page_size: int = 100
+    ):
+        """
+        :param client: RobopostClient used to read and write video series
+        :param key: Function mapping a create or read model to its matching key
+        :param prune: Whether live series without a desired counterpart are deleted
+        :param concurrency: Maximum number of API calls made in parallel by apply()
+        :param page_size: Page size used when listing live video series
+        """
+        self.client = client
+        self.key = key
+        self.prune = prune
+        self.concurrency = concurrency
+        self.page_size = page_size
+
+    def fetch_live(self) -> List[PublicAPIGeneratedFacelessVideoSeriesRead]:
+        """
+        List every live (non-deleted) video series, following pagination.
+
+        :return: List of video series
+        """
+        live = []
+        skip = 0
+
+        while True:
+            page = self.client.list_video_series(skip=skip, limit=self.page_size, sort_order="asc")
+            live.extend(series for series in page if not series.is_deleted)
+
+            if len(page) < self.page_size:
+                return live
+
+            skip += len(page)
+
+    def plan(
+            self,
+            desired: List[PublicAPIGeneratedFacelessVideoSeriesCreate],
+            live: Optional[List[PublicAPIGeneratedFacelessVideoSeriesRead]] = None
+    ) -> ReconcilePlan:
+        """
+        Compute the operations needed to reach the desired state. Nothing is written.
+
+        :param desired: Desired video series definitions
+        :param live: Current video series; fetched from the API when omitted
+        :return: ReconcilePlan
+        :raises: ValueError if two desired series share the same key
+        """
+        if live is None:
+            live = self.fetch_live()
+
+        desired_by_key = {}
+        for series in desired:
+            key = self.key(series)
+            if key in desired_by_key:
+                raise ValueError(f"Duplicate desired video series key: {key!r}")
+            desired_by_key[key] = series
+
+        plan = ReconcilePlan()
+        matched = set()
+
+        for series in live:
+            key = self.key(series)
+            target = desired_by_key.get(key)
+
+            if target is None or key in matched:
+                if self.prune:
+                    plan.deletes.append(series)
+                continue
+
+            matched.add(key)
+            update = diff_video_series(target, series)
+
+            if update is None:
+                plan.unchanged.append(series)
+            else:
+                plan.updates.append(VideoSeriesUpdateOp(series_id=series.id, name=series.name, payload=update))
+
+        plan.creates.extend(series for key, series in desired_by_key.items() if key not in matched)
+        return plan
+
+    def apply(self, plan: ReconcilePlan) -> ReconcileResult:
+        """
+        Execute a plan, running creates and updates concurrently, then deletes.
+
+        Failed operations do not stop the others; they are reported in the result.
+        Deletes only run once every create has succeeded, so a pruned series is
+        never removed while the series meant to replace it could not be created;
+        otherwise they are reported as skipped.
+
+        :param plan: Plan returned by plan()
+        :return: ReconcileResult
+        """
+        result = ReconcileResult()
+        self._run(
+            [("create", series.name, self.client.create_video_series, (series,)) for series in plan.creates]
+            + [("update", op.name, self.client.update_video_series, (op.series_id, op.payload)) for op in plan.updates],
+            result
+        )
+
+        deletes = [("delete", series.name, self.client.delete_video_series, (series.id,)) for series in plan.deletes]
+        if any(kind == "create" for kind, _, _ in result.errors):
+            result.errors.extend(("delete", name, "skipped: a create failed") for _, name, _, _ in deletes)
+        else:
+            self._run(deletes, result)
+
+        return result
+
+    def _run(self, operations: List[Tuple[str, str, Callable[..., Any], tuple]], result: ReconcileResult) -> None:
+        """Run operations concurrently, adding their outcomes to `result`"""
+        if not operations:
+            return
+
+        def run(operation):
+            kind, name, func, args = operation
+            try:
+                return kind, name, args, func(*args), None
+            except Exception as e:
+                return kind, name, args, None, e
+
+        with ThreadPoolExecutor(max_workers=max(1, self.concurrency)) as executor:
+            for kind, name, args, value, error in executor.map(run, operations):
+                if error is not None:
+                    result.errors.append((kind, name, str(error)))
+                elif kind == "create":
+                    result.created.append(value)
+                elif kind == "update":
+                    result.updated.append(value)
+                else:
+                    result.deleted.append(args[0])
+
+    def sync(self, desired: List[PublicAPIGeneratedFacelessVideoSeriesCreate]) -> ReconcileResult:
+        """
+        Plan and apply in one step.
+
+        :param desired: Desired video series definitions
+        :return: ReconcileResult
+        """
+        return self.apply(self.plan(desired))
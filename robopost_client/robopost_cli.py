@@ -0,0 +1,532 @@
+"""
+Command line interface for the Robopost public API.
+
+Results are written to stdout as JSON Lines, one object per line, so they can be
+piped into other tools. Failed items of bulk commands are written as
+{"error": ..., "input": ...} lines and make the command exit with status 1.
+
+Heavy dependencies (requests, pydantic models) are only imported once a command
+actually runs, so `robopost --help` starts instantly.
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+from collections import deque
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+DEFAULT_BASE_URL = "https://public-api.robopost.app/v1"
+
+
+# ---------------------------------------------------------
+# Output Helpers
+# ---------------------------------------------------------
+def to_jsonable(value: Any) -> Any:
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json", by_alias=True)
+    return value
+
+
+def emit(value: Any, out=None) -> None:
+    out = out or sys.stdout
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            emit(item, out)
+        return
+    out.write(json.dumps(to_jsonable(value), ensure_ascii=False, default=str))
+    out.write("\n")
+    out.flush()
+
+
+def run_bulk(
+        func: Callable[[Any], Any],
+        items: Iterable[Any],
+        concurrency: int,
+        describe: Callable[[Any], Any] = lambda item: item
+) -> int:
+    """
+    Apply func to every item with up to `concurrency` calls in flight and stream
+    the results to stdout in input order.
+
+    :return: Number of failed items
+    """
+    failures = 0
+    for item, result, error in ordered_map(func, items, concurrency):
+        if error is not None:
+            failures += 1
+            emit({"error": str(error), "error_type": type(error).__name__, "input": describe(item)})
+        else:
+            emit(result)
+    return failures
+
+
+def ordered_map(func: Callable[[Any], Any], items: Iterable[Any], concurrency: int) -> Iterator[tuple]:
+    """
+    Like ThreadPoolExecutor.map, but consumes the input lazily with a bounded
+    window and yields (item, result, error) instead of raising.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def call(item):
+        try:
+            return item, func(item), None
+        except Exception as e:
+            return item, None, e
+
+    concurrency = max(1, concurrency)
+    window = deque()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        try:
+            for item in items:
+                window.append(executor.submit(call, item))
+                if len(window) >= concurrency * 2:
+                    yield window.popleft().result()
+        except Exception:
+            # Reading the input failed; report the items already sent before the error
+            while window:
+                yield window.popleft().result()
+            raise
+        while window:
+            yield window.popleft().result()
+
+
+def _invalid_json(name: str, start: int, buffer: str, error: json.JSONDecodeError) -> ValueError:
+    # An error at the end of the input is reported on its last non-blank line
+    line = start + min(error.lineno, buffer.rstrip().count("\n") + 1) - 1
+    where = f" (in the object starting at line {start})" if line != start else ""
+    return ValueError(f"{name}: line {line}: invalid JSON: {error.msg}{where}")
+
+
+def read_json_items(path: str) -> Iterator[dict]:
+    """
+    Read objects from a JSON Lines file, a JSON array or a (possibly pretty-printed)
+    JSON object. A path of '-' reads from stdin. JSON Lines input is read lazily.
+
+    :raises: ValueError naming the line of the first malformed object
+    """
+    name = "<stdin>" if path == "-" else path
+    stream = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        first = stream.read(1)
+        skipped = 0
+        while first and first.isspace():
+            skipped += first == "\n"
+            first = stream.read(1)
+
+        if first == "[":
+            yield from json.loads(first + stream.read())
+            return
+
+        buffer = first
+        # Line of the input where the buffered object starts
+        start = skipped + 1
+        for number, line in enumerate(stream, start):
+            if not buffer:
+                start = number
+            buffer += line
+            if not buffer.strip():
+                buffer = ""
+                continue
+            try:
+                item = json.loads(buffer)
+            except json.JSONDecodeError as e:
+                # A multi-line object only fails at the end of the buffer until its last
+                # line is read; an error before that is malformed input
+                if e.pos < len(buffer.rstrip()):
+                    raise _invalid_json(name, start, buffer, e) from None
+                continue
+            buffer = ""
+            yield item
+
+        if buffer.strip():
+            try:
+                yield json.loads(buffer)
+            except json.JSONDecodeError as e:
+                raise _invalid_json(name, start, buffer, e) from None
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def iter_upload_paths(paths: List[str], recursive: bool) -> Iterator[str]:
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                if not name.startswith("."):
+                    yield os.path.join(root, name)
+            if not recursive:
+                break
+
+
+# ---------------------------------------------------------
+# Commands
+# ---------------------------------------------------------
+def _make_client(args):
+    from .client import RobopostClient
+
+    if not args.apikey:
+        raise SystemExit("robopost: an API key is required (--apikey or ROBOPOST_APIKEY)")
+    return RobopostClient(apikey=args.apikey, base_url=args.base_url)
+
+
+def cmd_media_upload(client, args) -> int:
+    paths = iter_upload_paths(args.paths, args.recursive)
+    return run_bulk(client.upload_media, paths, args.concurrency)
+
+
+def cmd_media_list(client, args) -> int:
+    emit(client.list_media(skip=args.skip, limit=args.limit))
+    return 0
+
+
+def cmd_media_get(client, args) -> int:
+    return run_bulk(client.get_media, args.ids, args.concurrency)
+
+
+def cmd_media_delete(client, args) -> int:
+    return run_bulk(client.delete_media, args.ids, args.concurrency)
+
+
+def cmd_posts_create(client, args) -> int:
+    from .models import PublicAPIScheduledPostCreateHTTPPayload
+
+    data = {"text": args.text, "channel_ids": args.channel_ids, "is_draft": args.draft}
+    if args.schedule_at:
+        data["schedule_at"] = args.schedule_at
+    if args.image_object_ids:
+        data["image_object_ids"] = args.image_object_ids
+    if args.video_object_id:
+        data["video_object_id"] = args.video_object_id
+    if args.first_comment:
+        data["first_comment"] = args.first_comment
+
+    emit(client.create_scheduled_posts(PublicAPIScheduledPostCreateHTTPPayload(**data)))
+    return 0
+
+
+def cmd_posts_schedule(client, args) -> int:
+    from .models import PublicAPIScheduledPostCreateHTTPPayload
+
+    def schedule(data):
+        return client.create_scheduled_posts(PublicAPIScheduledPostCreateHTTPPayload(**data))
+
+    return run_bulk(schedule, read_json_items(args.file), args.concurrency)
+
+
+def cmd_series_list(client, args) -> int:
+    if not args.all:
+        emit(client.list_video_series(search_text=args.search, skip=args.skip, limit=args.limit))
+        return 0
+
+    skip = args.skip
+    while True:
+        page = client.list_video_series(search_text=args.search, skip=skip, limit=args.limit, sort_order="asc")
+        emit(page)
+        if len(page) < args.limit:
+            return 0
+        skip += len(page)
+
+
+def cmd_series_get(client, args) -> int:
+    return run_bulk(client.get_video_series, args.ids, args.concurrency)
+
+
+def cmd_series_create(client, args) -> int:
+    from .models import PublicAPIGeneratedFacelessVideoSeriesCreate
+
+    def create(data):
+        return client.create_video_series(PublicAPIGeneratedFacelessVideoSeriesCreate(**data))
+
+    return run_bulk(create, read_json_items(args.file), args.concurrency)
+
+
+def cmd_series_update(client, args) -> int:
+    from .models import PublicAPIGeneratedFacelessVideoSeriesUpdate
+
+    with contextlib.closing(read_json_items(args.file)) as items:
+        data = next(items, None)
+    if data is None:
+        raise ValueError(f"{'<stdin>' if args.file == '-' else args.file}: no JSON object found")
+    emit(client.update_video_series(args.id, PublicAPIGeneratedFacelessVideoSeriesUpdate(**data)))
+    return 0
+
+
+def cmd_series_delete(client, args) -> int:
+    return run_bulk(client.delete_video_series, args.ids, args.concurrency)
+
+
+def cmd_series_generate(client, args) -> int:
+    return run_bulk(client.generate_video, args.ids, args.concurrency)
+
+
+def cmd_tasks_list(client, args) -> int:
+    from .enums import GeneratedFacelessVideoProcessState
+
+    status = GeneratedFacelessVideoProcessState(args.status) if args.status else None
+    emit(client.list_video_tasks(series_id=args.series_id, status=status, skip=args.skip, limit=args.limit))
+    return 0
+
+
+def cmd_tasks_get(client, args) -> int:
+    return run_bulk(client.get_video_task, args.ids, args.concurrency)
+
+
+def cmd_tasks_details(client, args) -> int:
+    return run_bulk(client.get_video_task_details, args.ids, args.concurrency)
+
+
+def cmd_tasks_cancel(client, args) -> int:
+    return run_bulk(client.cancel_video_task, args.ids, args.concurrency)
+
+
+def cmd_tasks_wait(client, args) -> int:
+    def wait(task_id):
+        return client.wait_for_video_completion(task_id, poll_interval=args.poll_interval, timeout=args.timeout)
+
+    return run_bulk(wait, args.ids, args.concurrency)
+
+
+def cmd_worker_run(client, args) -> int:
+    from .worker import JobQueue, Worker
+
+    worker = Worker(client, JobQueue(args.queue), concurrency=args.concurrency, poll_interval=args.poll_interval)
+
+    def report(stats):
+        emit(dict(stats.model_dump(), event="stats"))
+
+    if args.until_empty:
+        stats = worker.run(until_empty=True)
+    else:
+        stats = worker.run_forever(stats_callback=report, stats_interval=args.stats_interval)
+
+    emit(dict(stats.model_dump(), event="stopped"))
+    return 0
+
+
+def cmd_worker_enqueue(client, args) -> int:
+    from .worker import JobQueue
+
+    queue = JobQueue(args.queue)
+    for payload in read_json_items(args.file):
+        emit({"id": queue.enqueue(args.kind, payload, priority=args.priority), "kind": args.kind})
+    return 0
+
+
+def cmd_worker_stats(client, args) -> int:
+    from .worker import JobQueue
+
+    emit(JobQueue(args.queue).counts())
+    return 0
+
+
+def _load_client(args):
+    """Client for load tests: against an in-process stub server with --stub, otherwise --base-url"""
+    from .client import RobopostClient
+
+    stub = None
+    base_url = args.base_url
+    if args.stub:
+        from .stub_server import StubConfig, StubServer
+
+        stub = StubServer(StubConfig(latency=args.stub_latency)).start()
+        stub.seed_media(100)
+        stub.seed_video_series(100)
+        base_url = stub.base_url
+    elif not args.apikey:
+        raise SystemExit("robopost: an API key is required (--apikey or ROBOPOST_APIKEY), or pass --stub")
+
+    client = RobopostClient(apikey=args.apikey or "loadtest", base_url=base_url, pool_maxsize=args.pool_maxsize)
+    return client, stub
+
+
+def cmd_loadtest_run(client, args) -> int:
+    from .loadgen import LoadGenerator, parse_mix
+
+    client, stub = _load_client(args)
+    try:
+        generator = LoadGenerator(client, parse_mix(args.mix), seed=args.seed)
+        emit(generator.run(duration=args.duration, concurrency=args.concurrency, rps=args.rps))
+    finally:
+        client.close()
+        if stub is not None:
+            stub.stop()
+    return 0
+
+
+def cmd_loadtest_sweep(client, args) -> int:
+    from .loadgen import LoadGenerator, parse_mix
+
+    client, stub = _load_client(args)
+    try:
+        generator = LoadGenerator(client, parse_mix(args.mix), seed=args.seed)
+        levels = [int(level) for level in args.levels.split(",")]
+        result = generator.sweep(levels, duration=args.duration, threshold=args.threshold, callback=emit)
+        emit({"event": "knee", "knee": result.knee, "peak_throughput": result.peak_throughput})
+    finally:
+        client.close()
+        if stub is not None:
+            stub.stop()
+    return 0
+
+
+# ---------------------------------------------------------
+# Argument Parsing
+# ---------------------------------------------------------
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="robopost",
+        description="Robopost public API client. Results are printed as JSON Lines.",
+    )
+    parser.add_argument("--apikey", default=os.environ.get("ROBOPOST_APIKEY"),
+                        help="API key (default: $ROBOPOST_APIKEY)")
+    parser.add_argument("--base-url", default=os.environ.get("ROBOPOST_BASE_URL", DEFAULT_BASE_URL),
+                        help="API base URL (default: $ROBOPOST_BASE_URL or the public API)")
+
+    resources = parser.add_subparsers(dest="resource", metavar="RESOURCE")
+    resources.required = True
+
+    def command(group, name, func, help_text, bulk=False):
+        sub = group.add_parser(name, help=help_text, description=help_text)
+        sub.set_defaults(func=func)
+        if bulk:
+            sub.add_argument("--concurrency", type=int, default=4, help="Requests in flight at once (default: 4)")
+        return sub
+
+    def paging(sub, limit):
+        sub.add_argument("--skip", type=int, default=0)
+        sub.add_argument("--limit", type=int, default=limit)
+
+    # media
+    media = resources.add_parser("media", help="Upload and manage media").add_subparsers(dest="command", metavar="COMMAND")
+    media.required = True
+    sub = command(media, "upload", cmd_media_upload, "Upload files, or every file in the given directories", bulk=True)
+    sub.add_argument("paths", nargs="+")
+    sub.add_argument("-r", "--recursive", action="store_true", help="Descend into subdirectories")
+    paging(command(media, "list", cmd_media_list, "List media"), 50)
+    command(media, "get", cmd_media_get, "Get media by ID", bulk=True).add_argument("ids", nargs="+")
+    command(media, "delete", cmd_media_delete, "Delete media by ID", bulk=True).add_argument("ids", nargs="+")
+
+    # scheduled posts
+    posts = resources.add_parser("posts", help="Create scheduled posts").add_subparsers(dest="command", metavar="COMMAND")
+    posts.required = True
+    sub = command(posts, "create", cmd_posts_create, "Create a single scheduled post")
+    sub.add_argument("--text", required=True)
+    sub.add_argument("--channel-id", dest="channel_ids", action="append", required=True)
+    sub.add_argument("--schedule-at", help="UTC ISO 8601 datetime (default: now)")
+    sub.add_argument("--image-object-id", dest="image_object_ids", action="append")
+    sub.add_argument("--video-object-id")
+    sub.add_argument("--first-comment")
+    sub.add_argument("--draft", action="store_true")
+    sub = command(posts, "schedule", cmd_posts_schedule,
+                  "Create scheduled posts from a JSON Lines file of payloads ('-' for stdin)", bulk=True)
+    sub.add_argument("file")
+
+    # video series
+    series = resources.add_parser("series", help="Manage faceless video series").add_subparsers(dest="command", metavar="COMMAND")
+    series.required = True
+    sub = command(series, "list", cmd_series_list, "List video series")
+    paging(sub, 10)
+    sub.add_argument("--search")
+    sub.add_argument("--all", action="store_true", help="Follow pagination until every series is listed")
+    command(series, "get", cmd_series_get, "Get video series by ID", bulk=True).add_argument("ids", nargs="+")
+    command(series, "create", cmd_series_create,
+            "Create video series from a JSON Lines file of configs ('-' for stdin)", bulk=True).add_argument("file")
+    sub = command(series, "update", cmd_series_update, "Update a video series from a JSON object file ('-' for stdin)")
+    sub.add_argument("id")
+    sub.add_argument("file")
+    command(series, "delete", cmd_series_delete, "Delete video series by ID", bulk=True).add_argument("ids", nargs="+")
+    command(series, "generate", cmd_series_generate, "Generate a video for each series ID", bulk=True).add_argument("ids", nargs="+")
+
+    # video tasks
+    tasks = resources.add_parser("tasks", help="Inspect video generation tasks").add_subparsers(dest="command", metavar="COMMAND")
+    tasks.required = True
+    sub = command(tasks, "list", cmd_tasks_list, "List video tasks")
+    paging(sub, 10)
+    sub.add_argument("--series-id")
+    sub.add_argument("--status", choices=["IN_PROGRESS", "COMPLETE", "ERROR", "NO_CREDITS"])
+    command(tasks, "get", cmd_tasks_get, "Get task status by ID", bulk=True).add_argument("ids", nargs="+")
+    command(tasks, "details", cmd_tasks_details, "Get task details by ID", bulk=True).add_argument("ids", nargs="+")
+    command(tasks, "cancel", cmd_tasks_cancel, "Cancel tasks by ID", bulk=True).add_argument("ids", nargs="+")
+    sub = command(tasks, "wait", cmd_tasks_wait, "Wait for tasks to finish", bulk=True)
+    sub.add_argument("ids", nargs="+")
+    sub.add_argument("--poll-interval", type=int, default=10)
+    sub.add_argument("--timeout", type=int, default=300)
+
+    # worker
+    worker = resources.add_parser("worker", help="Process jobs from a local queue").add_subparsers(dest="command", metavar="COMMAND")
+    worker.required = True
+    sub = command(worker, "run", cmd_worker_run,
+                  "Consume jobs until interrupted; SIGINT/SIGTERM drain in-flight jobs before exiting", bulk=True)
+    sub.add_argument("--queue", required=True, help="SQLite queue file")
+    sub.add_argument("--poll-interval", type=float, default=1.0, help="Seconds between polls of an empty queue")
+    sub.add_argument("--stats-interval", type=float, default=10.0, help="Seconds between stats lines")
+    sub.add_argument("--until-empty", action="store_true", help="Exit once the queue is drained")
+    sub = command(worker, "enqueue", cmd_worker_enqueue, "Add jobs from a JSON Lines file of payloads ('-' for stdin)")
+    sub.set_defaults(needs_client=False)
+    sub.add_argument("--queue", required=True, help="SQLite queue file")
+    sub.add_argument("--kind", required=True,
+                     choices=["create_scheduled_post", "upload_media", "generate_video", "wait_for_video"])
+    sub.add_argument("--priority", type=int, default=0, help="Higher priorities run first")
+    sub.add_argument("file")
+    sub = command(worker, "stats", cmd_worker_stats, "Show the number of jobs per state")
+    sub.set_defaults(needs_client=False)
+    sub.add_argument("--queue", required=True, help="SQLite queue file")
+
+    # load testing
+    loadtest = resources.add_parser("loadtest", help="Measure client throughput and scaling").add_subparsers(
+        dest="command", metavar="COMMAND")
+    loadtest.required = True
+
+    def load_options(sub):
+        sub.set_defaults(needs_client=False)
+        sub.add_argument("--mix", default="create_scheduled_posts=3,list_media=1,get_media=2,get_video_series=1",
+                         help="Weighted workloads, e.g. create_scheduled_posts=3,list_media=1")
+        sub.add_argument("--duration", type=float, default=10.0, help="Seconds per run (default: 10)")
+        sub.add_argument("--stub", action="store_true", help="Run against an in-process stub server")
+        sub.add_argument("--stub-latency", type=float, default=0.0, help="Latency of the stub server in seconds")
+        sub.add_argument("--pool-maxsize", type=int, default=64, help="Keep-alive connections per host")
+        sub.add_argument("--seed", type=int)
+
+    sub = command(loadtest, "run", cmd_loadtest_run, "Run the workload mix at a concurrency level or request rate")
+    load_options(sub)
+    target = sub.add_mutually_exclusive_group(required=True)
+    target.add_argument("--concurrency", type=int, help="Callers issuing calls back to back")
+    target.add_argument("--rps", type=float, help="Target calls per second")
+    sub = command(loadtest, "sweep", cmd_loadtest_sweep, "Run increasing concurrency levels and report the knee")
+    load_options(sub)
+    sub.add_argument("--levels", default="1,2,4,8,16,32,64", help="Comma-separated concurrency levels")
+    sub.add_argument("--threshold", type=float, default=0.9, help="Share of peak throughput defining the knee")
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    client = _make_client(args) if getattr(args, "needs_client", True) else None
+
+    try:
+        failures = args.func(client, args)
+    except KeyboardInterrupt:
+        return 130
+    except BrokenPipeError:
+        # The consumer (e.g. `head`) went away; nothing left to report
+        sys.stderr.close()
+        return 0
+    except Exception as e:
+        emit({"error": str(e), "error_type": type(e).__name__})
+        return 1
+    finally:
+        if client is not None:
+            client.close()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+import contextlib
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Hashable, Optional, Type
+
+from pydantic import BaseModel
+
+from . import _forksafe
+from .cache import CacheStats
+from .models import PublicAPIGeneratedFacelessVideoSeriesRead, PublicAPIMediaRead
+
+# Seconds invalidation records are kept; a load running longer than this may
+# store a value that predates a delete
+GENERATION_RETENTION = 3600.0
+# Key of the invalidation record bumped by clear(), which covers a whole namespace
+_ALL_KEYS = ""
+
+# Model of each cacheable resource; others are stored as plain JSON
+RESOURCE_MODELS = {
+    "video_series": PublicAPIGeneratedFacelessVideoSeriesRead,
+    "media": PublicAPIMediaRead,
+}
+
+
+class SharedCache:
+    """
+    Read cache stored in a SQLite database in WAL mode, shared by all processes
+    on a host that open the same file, e.g. the workers of a prefork server.
+
+    Each process keeps no copy of the cached values: a hit reads the row and
+    rebuilds the model, so the data is held once, in the OS page cache, however
+    many workers there are, and an entry fetched by one worker serves them all.
+    Entries expire after the TTL of their resource, and the entries closest to
+    expiry are evicted once a resource exceeds its maxsize.
+
+    Pass it as `shared_cache=` to RobopostClient; it then backs every resource
+    enabled with `cache=`. Entries are scoped to the client's base URL and API key.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: SQLite database file; parent directories are created if needed
+        """
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        _forksafe.register(self)
+
+    def _reset_after_fork(self) -> None:
+        # SQLite connections must not be used across fork(); the child opens its own
+        self._lock = threading.Lock()
+        if self._conn is not None:
+            _forksafe.abandon(self._conn)
+        self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # Must be called with the lock held
+        if self._conn is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, expires_at REAL NOT NULL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (namespace, expires_at)")
+            # Bumped by every delete and clear, so a load that raced one is not stored
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS generations ("
+                " namespace TEXT NOT NULL, key TEXT NOT NULL, generation INTEGER NOT NULL, changed_at REAL NOT NULL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _execute(self, sql: str, parameters: tuple = ()) -> list:
+        with self._lock:
+            return self._connection().execute(sql, parameters).fetchall()
+
+    def view(self, resource: str, scope: str, maxsize: int = 1024, ttl: float = 60.0) -> "SharedCacheView":
+        """
+        A TTLCache-compatible view of one resource type.
+
+        :param resource: Resource type, e.g. "video_series"
+        :param scope: Entries are only shared between views with the same scope
+        :param maxsize: Maximum number of entries kept for this resource and scope
+        :param ttl: Seconds an entry stays valid
+        """
+        digest = hashlib.sha256(scope.encode("utf-8")).hexdigest()[:16]
+        return SharedCacheView(self, f"{resource}:{digest}", RESOURCE_MODELS.get(resource), maxsize, ttl)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = None
+
+
+class SharedCacheView:
+    """One resource type of a SharedCache, with the interface of TTLCache"""
+
+    def __init__(self, cache: SharedCache, namespace: str, model: Optional[Type[BaseModel]], maxsize: int,
+                 ttl: float, clock: Callable[[], float] = time.time):
+        self.cache = cache
+        self.namespace = namespace
+        self.model = model
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        _forksafe.register(self)
+
+    def _reset_after_fork(self) -> None:
+        self._lock = threading.Lock()
+
+    def _encode(self, value: Any) -> str:
+        return value.model_dump_json() if isinstance(value, BaseModel) else json.dumps(value)
+
+    def _decode(self, text: str) -> Any:
+        return self.model.model_validate_json(text) if self.model is not None else json.loads(text)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _lookup(self, key: Hashable) -> Optional[str]:
+        rows = self.cache._execute(
+            "SELECT value FROM entries WHERE namespace = ? AND key = ? AND expires_at > ?",
+            (self.namespace, str(key), self._clock())
+        )
+        return rows[0][0] if rows else None
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        text = self._lookup(key)
+        if text is None:
+            self._count("_misses")
+            return default
+        self._count("_hits")
+        return self._decode(text)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._store(key, value)
+
+    def delete(self, key: Hashable) -> bool:
+        with self.cache._lock:
+            with self._transaction() as conn:
+                deleted = conn.execute(
+                    "DELETE FROM entries WHERE namespace = ? AND key = ?", (self.namespace, str(key))
+                ).rowcount
+                self._bump(conn, str(key))
+        if deleted:
+            self._count("_invalidations")
+        return bool(deleted)
+
+    def clear(self) -> None:
+        with self.cache._lock:
+            with self._transaction() as conn:
+                conn.execute("DELETE FROM entries WHERE namespace = ?", (self.namespace,))
+                self._bump(conn, _ALL_KEYS)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, calling loader on a miss and storing its result.
+
+        If the key is deleted or the resource cleared while loader runs, in this
+        process or another one, the loaded value is returned without being stored.
+        """
+        text = self._lookup(key)
+        if text is not None:
+            self._count("_hits")
+            return self._decode(text)
+
+        self._count("_misses")
+        with self.cache._lock:
+            generation = self._generation(self.cache._connection(), str(key))
+        value = loader()
+        self._store(key, value, generation)
+        return value
+
+    def stats(self) -> CacheStats:
+        """Counters of this process, and the number of live entries shared by all processes"""
+        size = self.cache._execute(
+            "SELECT COUNT(*) FROM entries WHERE namespace = ? AND expires_at > ?", (self.namespace, self._clock())
+        )[0][0]
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses, evictions=self._evictions,
+                              invalidations=self._invalidations, size=size, maxsize=self.maxsize)
+
+    def __len__(self) -> int:
+        return self.stats().size
+
+    # ---------------------------------------------------------
+    # Storage
+    # ---------------------------------------------------------
+    @contextlib.contextmanager
+    def _transaction(self):
+        # Must be called with the cache lock held
+        conn = self.cache._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _generation(self, conn: sqlite3.Connection, key: str) -> int:
+        return conn.execute(
+            "SELECT COALESCE(SUM(generation), 0) FROM generations WHERE namespace = ? AND key IN (?, ?)",
+            (self.namespace, key, _ALL_KEYS)
+        ).fetchone()[0]
+
+    def _bump(self, conn: sqlite3.Connection, key: str) -> None:
+        now = self._clock()
+        conn.execute(
+            "INSERT INTO generations (namespace, key, generation, changed_at) VALUES (?, ?, 1, ?)"
+            " ON CONFLICT (namespace, key) DO UPDATE SET generation = generation + 1, changed_at = excluded.changed_at",
+            (self.namespace, key, now)
+        )
+        conn.execute(
+            "DELETE FROM generations WHERE namespace = ? AND changed_at <= ?",
+            (self.namespace, now - GENERATION_RETENTION)
+        )
+
+    def _store(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """Insert an entry, unless `generation` is given and the key was invalidated since"""
+        now = self._clock()
+        text = self._encode(value)
+        with self.cache._lock:
+            with self._transaction() as conn:
+                if generation is not None and self._generation(conn, str(key)) != generation:
+                    return
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                    (self.namespace, str(key), text, now + self.ttl)
+                )
+                conn.execute("DELETE FROM entries WHERE namespace = ? AND expires_at <= ?", (self.namespace, now))
+                size = conn.execute(
+                    "SELECT COUNT(*) FROM entries WHERE namespace = ?", (self.namespace,)
+                ).fetchone()[0]
+                if size > self.maxsize:
+                    # Entries closest to expiry go first
+                    conn.execute(
+                        "DELETE FROM entries WHERE rowid IN (SELECT rowid FROM entries WHERE namespace = ?"
+                        " ORDER BY expires_at LIMIT ?)", (self.namespace, size - self.maxsize)
+                    )
+                    with self._lock:
+                        self._evictions += size - self.maxsize
@@ -0,0 +1,85 @@
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+from pydantic import Field
+
+from . import _forksafe
+from ._base import DeferredModel
+
+
+class SingleFlightStats(DeferredModel):
+    """Counters of a SingleFlight group"""
+    calls: int = Field(0, description="Total calls made through the group")
+    executions: int = Field(0, description="Calls that actually ran the function")
+    coalesced: int = Field(0, description="Calls that waited for and shared an in-flight result")
+    in_flight: int = 0
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key: while a call for a key is running,
+    other callers with the same key wait for it and receive its result (or exception)
+    instead of running the function again.
+
+    Results are shared between callers and should be treated as read-only.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._total = 0
+        self._executions = 0
+        self._coalesced = 0
+        _forksafe.register(self)
+
+    def _reset_after_fork(self) -> None:
+        # Calls in flight belong to threads of the parent
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        with self._lock:
+            self._total += 1
+            call = self._calls.get(key)
+            if call is not None:
+                self._coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self._executions += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(
+                calls=self._total,
+                executions=self._executions,
+                coalesced=self._coalesced,
+                in_flight=len(self._calls),
+            )
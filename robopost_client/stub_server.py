@@ -0,0 +1,526 @@
+import argparse
+import gzip
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from pydantic import Field
+
+from ._base import DeferredModel
+
+
+# ---------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------
+class StubConfig(DeferredModel):
+    """
+    Behaviour of a StubServer. Fields can be changed while the server is running.
+    """
+    latency: float = Field(0.0, ge=0, description="Seconds added before every response")
+    jitter: float = Field(0.0, ge=0, description="Random extra latency, uniform in [0, jitter] seconds")
+    error_rate: float = Field(0.0, ge=0, le=1, description="Share of requests answered with a 500 error")
+    throttle_rps: Optional[float] = Field(None, gt=0, description="Requests per second before answering 429")
+    throttle_burst: int = Field(10, ge=1, description="Requests allowed in a burst when throttling")
+    polls_to_complete: int = Field(3, ge=0, description="Status polls before a video task completes")
+    series_limit: Optional[int] = Field(None, ge=0, description="Video series allowed before a plan limit error")
+    apikey: Optional[str] = Field(None, description="API key required by the server; any key if unset")
+    seed: Optional[int] = Field(None, description="Seed of the random generator for errors and jitter")
+    compress_min_size: Optional[int] = Field(
+        None, ge=0, description="Responses at least this large are gzipped for clients accepting gzip"
+    )
+    cache_max_age: Optional[int] = Field(
+        None, ge=0, description="Successful GET responses carry Cache-Control: max-age with this many seconds"
+    )
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class _ApiError(Exception):
+    def __init__(self, status: int, payload: dict, headers: Optional[Dict[str, str]] = None):
+        self.status = status
+        self.payload = payload
+        self.headers = headers or {}
+
+
+# ---------------------------------------------------------
+# Request Handler
+# ---------------------------------------------------------
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "RobopostStub/1.0"
+    # Headers and body are written separately; avoid delayed-ACK stalls on keep-alive connections
+    disable_nagle_algorithm = True
+    stub: "StubServer"
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+    def log_message(self, *args):
+        pass
+
+    def _handle(self, method: str) -> None:
+        # Always consume the body so the connection can be kept alive
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            body = self._read_chunked()
+        else:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+
+        parts = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        try:
+            status, payload = self.stub._dispatch(method, parts.path, query, body, self.headers)
+            headers = {}
+            if method == "GET" and self.stub.config.cache_max_age is not None:
+                headers["Cache-Control"] = f"max-age={self.stub.config.cache_max_age}"
+        except _ApiError as e:
+            status, payload, headers = e.status, e.payload, e.headers
+
+        data = json.dumps(payload).encode()
+        min_size = self.stub.config.compress_min_size
+        if min_size is not None and len(data) >= min_size and "gzip" in self.headers.get("Accept-Encoding", ""):
+            data = gzip.compress(data, compresslevel=6, mtime=0)
+            headers["Content-Encoding"] = "gzip"
+        with self.stub._lock:
+            self.stub.bytes_sent += len(data)
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_chunked(self) -> bytes:
+        chunks = []
+        while True:
+            size = int(self.rfile.readline().split(b";", 1)[0], 16)
+            if size == 0:
+                # Skip trailers up to the blank line ending the body
+                while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline()
+
+
+# ---------------------------------------------------------
+# Stub Server
+# ---------------------------------------------------------
+class StubServer:
+    """
+    In-process stand-in for the Robopost public API, for tests and benchmarks.
+
+    Implements the media, scheduled post, video series and video task endpoints
+    on top of in-memory storage. Latency, random server errors, throttling (429)
+    and plan limits (409) are set through a StubConfig.
+
+        with StubServer(StubConfig(latency=0.01)) as stub:
+            client = RobopostClient(apikey="test", base_url=stub.base_url)
+    """
+
+    def __init__(self, config: Optional[StubConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        :param config: Server behaviour; defaults to an instant, error-free server
+        :param host: Interface to listen on
+        :param port: Port to listen on; 0 picks a free port
+        """
+        self.config = config or StubConfig()
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._random = random.Random(self.config.seed)
+        self._tokens = float(self.config.throttle_burst)
+        self._refilled_at = time.monotonic()
+        self._scripted: List[Tuple[Optional[str], int, dict]] = []
+        self._holds: List[Tuple[Optional[str], threading.Event]] = []
+        self._series_defaults: Optional[Dict[str, Any]] = None
+
+        self.media: Dict[str, dict] = {}
+        self.scheduled_posts: Dict[str, dict] = {}
+        self.video_series: Dict[str, dict] = {}
+        self.video_tasks: Dict[str, dict] = {}
+        self._task_polls: Dict[str, int] = {}
+        self.request_counts: Dict[str, int] = {}
+        self.bytes_received = 0
+        self.bytes_sent = 0
+
+        self._routes = [
+            ("POST", re.compile(r"/medias/upload"), self._upload_media),
+            ("GET", re.compile(r"/medias/?"), self._list_media),
+            ("GET", re.compile(r"/medias/(?P<id>[^/]+)"), self._get_media),
+            ("DELETE", re.compile(r"/medias/(?P<id>[^/]+)"), self._delete_media),
+            ("POST", re.compile(r"/scheduled_posts/?"), self._create_scheduled_posts),
+            ("POST", re.compile(r"/video-series/?"), self._create_video_series),
+            ("GET", re.compile(r"/video-series/?"), self._list_video_series),
+            ("GET", re.compile(r"/video-series/(?P<id>[^/]+)"), self._get_video_series),
+            ("PUT", re.compile(r"/video-series/(?P<id>[^/]+)"), self._update_video_series),
+            ("DELETE", re.compile(r"/video-series/(?P<id>[^/]+)"), self._delete_video_series),
+            ("POST", re.compile(r"/video-tasks/(?P<id>[^/]+)/generate"), self._generate_video),
+            ("GET", re.compile(r"/video-tasks/?"), self._list_video_tasks),
+            ("GET", re.compile(r"/video-tasks/(?P<id>[^/]+)/details"), self._get_video_task_details),
+            ("GET", re.compile(r"/video-tasks/(?P<id>[^/]+)"), self._get_video_task),
+            ("DELETE", re.compile(r"/video-tasks/(?P<id>[^/]+)"), self._cancel_video_task),
+        ]
+
+    # ---------------------------------------------------------
+    # Lifecycle
+    # ---------------------------------------------------------
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1"
+
+    def start(self) -> "StubServer":
+        handler = type("StubHandler", (_StubHandler,), {"stub": self})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="robopost-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # ---------------------------------------------------------
+    # Test Helpers
+    # ---------------------------------------------------------
+    def fail_next(self, status: int, payload: Optional[dict] = None, count: int = 1,
+                  path: Optional[str] = None) -> None:
+        """
+        Answer the next `count` requests (optionally only those whose path contains
+        `path`) with the given error status and JSON payload.
+        """
+        with self._lock:
+            for _ in range(count):
+                self._scripted.append((path, status, payload or {"detail": "Stub error"}))
+
+    def hold_next(self, path: Optional[str] = None) -> threading.Event:
+        """
+        Keep the next request (optionally only one whose path contains `path`)
+        from being answered until the returned event is set.
+        """
+        event = threading.Event()
+        with self._lock:
+            self._holds.append((path, event))
+        return event
+
+    def seed_media(self, count: int) -> List[dict]:
+        """Add `count` media items and return them"""
+        with self._lock:
+            return [self._add_media(f"seed-{len(self.media)}.jpg", 0) for _ in range(count)]
+
+    def seed_video_series(self, count: int) -> List[dict]:
+        """Add `count` video series and return them"""
+        with self._lock:
+            return [self._add_series({"name": f"Seed series {len(self.video_series)}"}) for _ in range(count)]
+
+    def reset(self) -> None:
+        """Drop all stored resources and counters"""
+        with self._lock:
+            for store in (self.media, self.scheduled_posts, self.video_series, self.video_tasks,
+                          self._task_polls, self.request_counts):
+                store.clear()
+            self._scripted.clear()
+            self._holds.clear()
+            self.bytes_received = 0
+            self.bytes_sent = 0
+
+    def request_count(self, route: Optional[str] = None) -> int:
+        """Number of requests received, optionally only for a route such as "GET /medias/{id}" """
+        with self._lock:
+            if route is None:
+                return sum(self.request_counts.values())
+            return self.request_counts.get(route, 0)
+
+    # ---------------------------------------------------------
+    # Dispatch
+    # ---------------------------------------------------------
+    def _dispatch(self, method: str, path: str, query: Dict[str, str], body: bytes, headers) -> Tuple[int, Any]:
+        config = self.config
+        if not path.startswith("/v1/"):
+            raise _ApiError(404, {"detail": "Not Found"})
+        path = path[3:]
+
+        for route_method, pattern, handler in self._routes:
+            match = pattern.fullmatch(path)
+            if match is not None and route_method == method:
+                break
+        else:
+            raise _ApiError(404 if method == "GET" else 405, {"detail": "Not Found"})
+
+        route = f"{method} {pattern.pattern.replace('(?P<id>[^/]+)', '{id}').rstrip('?')}"
+        with self._lock:
+            self.request_counts[route] = self.request_counts.get(route, 0) + 1
+            self.bytes_received += len(body)
+            delay = config.latency + (self._random.uniform(0, config.jitter) if config.jitter else 0.0)
+            failure = self._take_scripted(path) or self._random_failure()
+            hold = self._take_hold(path)
+
+        encoding = headers.get("Content-Encoding", "identity").lower()
+        if encoding == "gzip":
+            try:
+                body = gzip.decompress(body)
+            except (OSError, EOFError):
+                raise _ApiError(400, {"detail": "Invalid gzip body"})
+        elif encoding != "identity":
+            raise _ApiError(415, {"detail": f"Unsupported Content-Encoding {encoding}"})
+
+        if hold is not None:
+            hold.wait()
+        if delay:
+            time.sleep(delay)
+        if failure is not None:
+            raise failure
+        if config.apikey is not None and query.get("apikey") != config.apikey:
+            raise _ApiError(401, {"detail": "Invalid API key"})
+
+        with self._lock:
+            return handler(match.groupdict().get("id"), query, body, headers)
+
+    def _take_scripted(self, path: str) -> Optional[_ApiError]:
+        for index, (needle, status, payload) in enumerate(self._scripted):
+            if needle is None or needle in path:
+                del self._scripted[index]
+                return _ApiError(status, payload)
+        return None
+
+    def _take_hold(self, path: str) -> Optional[threading.Event]:
+        for index, (needle, event) in enumerate(self._holds):
+            if needle is None or needle in path:
+                del self._holds[index]
+                return event
+        return None
+
+    def _random_failure(self) -> Optional[_ApiError]:
+        config = self.config
+        if config.throttle_rps is not None:
+            now = time.monotonic()
+            self._tokens = min(config.throttle_burst, self._tokens + (now - self._refilled_at) * config.throttle_rps)
+            self._refilled_at = now
+            if self._tokens < 1:
+                retry_after = (1 - self._tokens) / config.throttle_rps
+                return _ApiError(429, {"detail": "Too many requests"}, {"Retry-After": f"{retry_after:.3f}"})
+            self._tokens -= 1
+
+        if config.error_rate and self._random.random() < config.error_rate:
+            return _ApiError(500, {"detail": "Internal server error"})
+        return None
+
+    @staticmethod
+    def _page(items: List[dict], query: Dict[str, str], default_limit: int) -> List[dict]:
+        skip = int(query.get("skip", 0))
+        limit = int(query.get("limit", default_limit))
+        return items[skip:skip + limit]
+
+    @staticmethod
+    def _json(body: bytes) -> dict:
+        try:
+            return json.loads(body or b"{}")
+        except ValueError:
+            raise _ApiError(422, {"detail": "Invalid JSON body"})
+
+    # ---------------------------------------------------------
+    # Media
+    # ---------------------------------------------------------
+    def _add_media(self, name: str, size: int) -> dict:
+        media_id = str(uuid.uuid4())
+        extension = name.rsplit(".", 1)[-1] if "." in name else ""
+        media = {"id": media_id, "name": name, "extension": extension,
+                 "storage_object_id": f"so-{media_id}", "size": size}
+        self.media[media_id] = media
+        return media
+
+    def _upload_media(self, _, query, body, headers):
+        # Only the part headers are inspected; the payload itself is not stored
+        match = re.search(rb'filename="([^"]*)"', body[:4096])
+        if match is None:
+            raise _ApiError(422, {"detail": "No file uploaded"})
+        boundary = body[:body.index(b"\r\n")] if b"\r\n" in body else b""
+        start = body.find(b"\r\n\r\n", match.end()) + 4
+        end = body.rfind(b"\r\n" + boundary + b"--")
+        size = end - start if start >= 4 and end >= start else len(body)
+        return 200, self._add_media(match.group(1).decode("utf-8", "replace"), size)
+
+    def _list_media(self, _, query, body, headers):
+        return 200, self._page(list(self.media.values()), query, 50)
+
+    def _get_media(self, media_id, query, body, headers):
+        media = self.media.get(media_id)
+        if media is None:
+            raise _ApiError(404, {"detail": "Media not found"})
+        return 200, media
+
+    def _delete_media(self, media_id, query, body, headers):
+        if self.media.pop(media_id, None) is None:
+            raise _ApiError(404, {"detail": "Media not found"})
+        return 200, {"message": "Media deleted successfully"}
+
+    # ---------------------------------------------------------
+    # Scheduled Posts
+    # ---------------------------------------------------------
+    def _create_scheduled_posts(self, _, query, body, headers):
+        payload = self._json(body)
+        if not payload.get("channel_ids"):
+            raise _ApiError(422, {"detail": "channel_ids must not be empty"})
+
+        post = dict(payload, id=str(uuid.uuid4()))
+        if post.get("schedule_at") is None:
+            post["schedule_at"] = _now()
+        self.scheduled_posts[post["id"]] = post
+        return 200, {"scheduled_posts": [post]}
+
+    # ---------------------------------------------------------
+    # Video Series
+    # ---------------------------------------------------------
+    def _add_series(self, payload: dict) -> dict:
+        if self._series_defaults is None:
+            from .models import PublicAPIGeneratedFacelessVideoSeriesCreate
+
+            self._series_defaults = PublicAPIGeneratedFacelessVideoSeriesCreate(name="").model_dump(mode="json")
+
+        now = _now()
+        series = dict(self._series_defaults)
+        series.update(payload)
+        series.update(id=str(uuid.uuid4()), automation_id=None, is_deleted=False, created_at=now, updated_at=now)
+        self.video_series[series["id"]] = series
+        return series
+
+    def _create_video_series(self, _, query, body, headers):
+        limit = self.config.series_limit
+        if limit is not None and len(self.video_series) >= limit:
+            raise _ApiError(409, {"message": "Plan limit reached", "limit": limit,
+                                  "current_usage": len(self.video_series)})
+        return 200, self._add_series(self._json(body))
+
+    def _list_video_series(self, _, query, body, headers):
+        items = list(self.video_series.values())
+        search_text = query.get("search_text")
+        if search_text:
+            items = [s for s in items if search_text.lower() in s["name"].lower()]
+        field = query.get("sort_by_field", "created_at")
+        items.sort(key=lambda s: str(s.get(field, "")), reverse=query.get("sort_order", "desc") == "desc")
+        return 200, self._page(items, query, 10)
+
+    def _series(self, series_id: str) -> dict:
+        series = self.video_series.get(series_id)
+        if series is None:
+            raise _ApiError(404, {"detail": "Video series not found"})
+        return series
+
+    def _get_video_series(self, series_id, query, body, headers):
+        return 200, self._series(series_id)
+
+    def _update_video_series(self, series_id, query, body, headers):
+        series = self._series(series_id)
+        series.update(self._json(body), updated_at=_now())
+        return 200, series
+
+    def _delete_video_series(self, series_id, query, body, headers):
+        self._series(series_id)
+        del self.video_series[series_id]
+        return 200, {"message": "Video series deleted successfully"}
+
+    # ---------------------------------------------------------
+    # Video Tasks
+    # ---------------------------------------------------------
+    def _generate_video(self, series_id, query, body, headers):
+        self._series(series_id)
+        task = {"task_id": str(uuid.uuid4()), "video_series_id": series_id, "status": "IN_PROGRESS",
+                "created_at": _now()}
+        self.video_tasks[task["task_id"]] = task
+        self._task_polls[task["task_id"]] = 0
+        return 200, task
+
+    def _task(self, task_id: str) -> dict:
+        task = self.video_tasks.get(task_id)
+        if task is None:
+            raise _ApiError(404, {"detail": "Video task not found"})
+        return task
+
+    def _get_video_task(self, task_id, query, body, headers):
+        task = self._task(task_id)
+        if task["status"] == "IN_PROGRESS":
+            self._task_polls[task_id] += 1
+            if self._task_polls[task_id] >= self.config.polls_to_complete:
+                task["status"] = "COMPLETE"
+        return 200, task
+
+    def _list_video_tasks(self, _, query, body, headers):
+        items = list(self.video_tasks.values())
+        if "series_id" in query:
+            items = [t for t in items if t["video_series_id"] == query["series_id"]]
+        if "status" in query:
+            items = [t for t in items if t["status"] == query["status"]]
+        items.sort(key=lambda t: t["created_at"], reverse=query.get("sort_order", "desc") == "desc")
+        return 200, self._page(items, query, 10)
+
+    def _get_video_task_details(self, task_id, query, body, headers):
+        task = self._task(task_id)
+        return 200, dict(task, polls=self._task_polls.get(task_id, 0), error=None)
+
+    def _cancel_video_task(self, task_id, query, body, headers):
+        task = self._task(task_id)
+        task["status"] = "ERROR"
+        return 200, {"message": "Video task cancelled successfully"}
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Run a local Robopost API stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8093)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added before every response")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with a 500")
+    parser.add_argument("--throttle-rps", type=float, default=None, help="Answer 429 above this request rate")
+    parser.add_argument("--compress-min-size", type=int, default=None,
+                        help="Gzip responses of at least this many bytes for clients accepting gzip")
+    parser.add_argument("--seed-media", type=int, default=0, help="Number of media items to create at startup")
+    parser.add_argument("--seed-series", type=int, default=0, help="Number of video series to create at startup")
+    args = parser.parse_args(argv)
+
+    config = StubConfig(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                        throttle_rps=args.throttle_rps, compress_min_size=args.compress_min_size)
+    stub = StubServer(config, host=args.host, port=args.port).start()
+    stub.seed_media(args.seed_media)
+    stub.seed_video_series(args.seed_series)
+    print(f"Robopost stub server listening on {stub.base_url}", flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
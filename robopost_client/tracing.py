@@ -0,0 +1,131 @@
+"""
+Optional OpenTelemetry tracing.
+
+Spans are created only when the `opentelemetry-api` package is installed (or a
+tracer was set with set_tracer()); otherwise every helper is a no-op and traced
+methods call straight through.
+"""
+import functools
+import inspect
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+_UNSET = object()
+_tracer: Any = _UNSET
+
+
+def get_tracer():
+    """The tracer used by the client, or None if tracing is unavailable or disabled"""
+    global _tracer
+    if _tracer is _UNSET:
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            _tracer = None
+        else:
+            _tracer = trace.get_tracer("robopost_client")
+    return _tracer
+
+
+def set_tracer(tracer) -> None:
+    """
+    Use a specific tracer (e.g. from your own TracerProvider) for client spans.
+
+    :param tracer: OpenTelemetry Tracer, or None to disable tracing
+    """
+    global _tracer
+    _tracer = tracer
+
+
+def current_context():
+    """Current OpenTelemetry context, to parent spans started on other threads"""
+    if get_tracer() is None:
+        return None
+    try:
+        from opentelemetry import context
+    except ImportError:
+        return None
+    return context.get_current()
+
+
+class _NoopSpan:
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def is_recording(self) -> bool:
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+@contextmanager
+def span(name: str, attributes: Optional[Dict[str, Any]] = None, context=None):
+    """
+    Start a span as the current span. Attributes set to None are dropped.
+
+    :param name: Span name
+    :param attributes: Initial span attributes
+    :param context: Parent context, when the span is started on another thread
+    """
+    tracer = get_tracer()
+    if tracer is None:
+        yield _NOOP_SPAN
+        return
+
+    kwargs = {"attributes": {k: v for k, v in (attributes or {}).items() if v is not None}}
+    if context is not None:
+        kwargs["context"] = context
+    with tracer.start_as_current_span(name, **kwargs) as current:
+        yield current
+
+
+def _result_attributes(result) -> Dict[str, Any]:
+    if isinstance(result, list):
+        return {"robopost.result.count": len(result)}
+    if isinstance(result, tuple):
+        attributes: Dict[str, Any] = {}
+        for item in result:
+            attributes.update(_result_attributes(item))
+        return attributes
+
+    attributes = {}
+    for field in ("id", "task_id", "status"):
+        value = getattr(result, field, None)
+        if isinstance(value, str):
+            attributes["robopost.result.id" if field == "id" else f"robopost.{field}"] = value
+    return attributes
+
+
+def traced(*arg_names: str):
+    """
+    Decorate a client method so each call runs in a "robopost.<method>" span.
+
+    :param arg_names: Arguments recorded as "robopost.<name>" span attributes
+    """
+    def decorator(func):
+        name = f"robopost.{func.__name__}"
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if get_tracer() is None:
+                return func(*args, **kwargs)
+
+            attributes = {}
+            if arg_names:
+                arguments = signature.bind(*args, **kwargs).arguments
+                for arg in arg_names:
+                    value = arguments.get(arg)
+                    if isinstance(value, (str, int, float, bool)):
+                        attributes[f"robopost.{arg}"] = value
+
+            with span(name, attributes) as current:
+                result = func(*args, **kwargs)
+                for key, value in _result_attributes(result).items():
+                    current.set_attribute(key, value)
+                return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,471 @@
+import json
+import logging
+import os
+import signal
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from pydantic import Field
+
+from . import _forksafe
+from ._base import DeferredModel
+
+logger = logging.getLogger(__name__)
+
+
+JOB_KINDS = ("create_scheduled_post", "upload_media", "generate_video", "wait_for_video")
+
+
+# ---------------------------------------------------------
+# Job Queue
+# ---------------------------------------------------------
+class Job(DeferredModel):
+    """A unit of work stored in a JobQueue"""
+    id: int
+    kind: str
+    payload: Dict[str, Any] = Field(default_factory=dict)
+    priority: int = Field(0, description="Jobs with a higher priority are processed first")
+    state: str = "queued"
+    attempts: int = 0
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    lease_token: Optional[str] = Field(None, description="Identifies the claim that leased a running job")
+
+
+class JobQueue:
+    """
+    Durable local job queue stored in a SQLite database (WAL mode), safe to share
+    between a worker and any number of producer processes.
+
+    Jobs are claimed in priority order (highest first), then in insertion order.
+    A claimed job is leased to its worker for `lease` seconds, and the worker
+    renews the lease while the job runs. Only running jobs whose lease expired,
+    i.e. whose worker died, are put back in the queue, so several workers can
+    consume the same queue. A job is completed or failed only by the claim that
+    holds its lease, so a worker that lost the lease cannot overwrite the outcome
+    recorded after the job was claimed again.
+    """
+
+    def __init__(self, path: str, lease: float = 60.0):
+        """
+        :param path: SQLite database file; parent directories are created if needed
+        :param lease: Seconds a claimed job stays with its worker without a renewal
+        """
+        self.path = os.path.expanduser(path)
+        self.lease = lease
+        # Identifies the leases taken through this queue object
+        self.owner = self._new_owner()
+        self._lock = threading.Lock()
+        self._conn = None
+        _forksafe.register(self)
+
+    @staticmethod
+    def _new_owner() -> str:
+        return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+    def _reset_after_fork(self) -> None:
+        # SQLite connections must not be used across fork(); the child opens its own
+        self._lock = threading.Lock()
+        self.owner = self._new_owner()
+        if self._conn is not None:
+            _forksafe.abandon(self._conn)
+        self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # Must be called with the lock held
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " id INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, payload TEXT NOT NULL,"
+                " priority INTEGER NOT NULL DEFAULT 0, state TEXT NOT NULL DEFAULT 'queued',"
+                " attempts INTEGER NOT NULL DEFAULT 0, result TEXT, error TEXT,"
+                " created_at REAL NOT NULL, updated_at REAL NOT NULL,"
+                " lease_until REAL, lease_owner TEXT, lease_token TEXT)"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            # Queues created by a version without leases
+            for column, kind in (("lease_until", "REAL"), ("lease_owner", "TEXT"), ("lease_token", "TEXT")):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_queued ON jobs (state, priority DESC, id)")
+            self._conn = conn
+        return self._conn
+
+    def enqueue(self, kind: str, payload: Dict[str, Any], priority: int = 0) -> int:
+        """
+        Add a job to the queue.
+
+        :param kind: One of JOB_KINDS
+        :param payload: JSON-serializable job arguments
+        :param priority: Jobs with a higher priority are processed first
+        :return: ID of the new job
+        """
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unknown job kind {kind!r}, expected one of {JOB_KINDS}")
+
+        now = time.time()
+        with self._lock:
+            cursor = self._connection().execute(
+                "INSERT INTO jobs (kind, payload, priority, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (kind, json.dumps(payload, default=str), priority, now, now)
+            )
+            return cursor.lastrowid
+
+    def claim(self) -> Optional[Job]:
+        """Atomically mark the next queued job as running and return it"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT id, kind, payload, priority, attempts FROM jobs WHERE state = 'queued'"
+                    " ORDER BY priority DESC, id LIMIT 1"
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                now = time.time()
+                token = uuid.uuid4().hex
+                conn.execute(
+                    "UPDATE jobs SET state = 'running', attempts = attempts + 1, updated_at = ?, lease_until = ?,"
+                    " lease_owner = ?, lease_token = ? WHERE id = ?",
+                    (now, now + self.lease, self.owner, token, row[0])
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+        return Job(id=row[0], kind=row[1], payload=json.loads(row[2]), priority=row[3],
+                   state="running", attempts=row[4] + 1, lease_token=token)
+
+    def complete(self, job: Job, result: Any) -> bool:
+        """
+        Record the result of a claimed job.
+
+        :return: False if the job's lease was lost, in which case nothing is recorded
+        """
+        return self._finish(job, "done", result=json.dumps(result, default=str))
+
+    def fail(self, job: Job, error: str) -> bool:
+        """
+        Record the error of a claimed job.
+
+        :return: False if the job's lease was lost, in which case nothing is recorded
+        """
+        return self._finish(job, "failed", error=error)
+
+    def renew(self, jobs: Iterable[Job]) -> None:
+        """Extend the lease of claimed jobs by `lease` seconds from now, unless it was lost"""
+        now = time.time()
+        with self._lock:
+            self._connection().executemany(
+                "UPDATE jobs SET lease_until = ? WHERE id = ? AND state = 'running'"
+                " AND lease_owner = ? AND lease_token = ?",
+                [(now + self.lease, job.id, self.owner, job.lease_token) for job in jobs]
+            )
+
+    def requeue_running(self) -> int:
+        """
+        Put running jobs whose lease expired (e.g. because their worker crashed)
+        back in the queue. Jobs of live workers keep running.
+
+        :return: Number of requeued jobs
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._connection().execute(
+                "UPDATE jobs SET state = 'queued', updated_at = ?, lease_until = NULL, lease_owner = NULL,"
+                " lease_token = NULL WHERE state = 'running' AND (lease_until IS NULL OR lease_until <= ?)",
+                (now, now)
+            )
+            return cursor.rowcount
+
+    def get(self, job_id: int) -> Optional[Job]:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT id, kind, payload, priority, state, attempts, result, error FROM jobs WHERE id = ?",
+                (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return Job(id=row[0], kind=row[1], payload=json.loads(row[2]), priority=row[3], state=row[4],
+                   attempts=row[5], result=json.loads(row[6]) if row[6] else None, error=row[7])
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per state"""
+        with self._lock:
+            rows = self._connection().execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall()
+        counts = {"queued": 0, "running": 0, "done": 0, "failed": 0}
+        counts.update(dict(rows))
+        return counts
+
+    def depth(self) -> int:
+        """Number of queued jobs"""
+        return self.counts()["queued"]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _finish(self, job: Job, state: str, result: Optional[str] = None, error: Optional[str] = None) -> bool:
+        with self._lock:
+            cursor = self._connection().execute(
+                "UPDATE jobs SET state = ?, result = ?, error = ?, updated_at = ?, lease_until = NULL,"
+                " lease_owner = NULL, lease_token = NULL"
+                " WHERE id = ? AND state = 'running' AND lease_owner = ? AND lease_token = ?",
+                (state, result, error, time.time(), job.id, self.owner, job.lease_token)
+            )
+            return cursor.rowcount == 1
+
+
+# ---------------------------------------------------------
+# Worker
+# ---------------------------------------------------------
+class WorkerStats(DeferredModel):
+    """Throughput and queue figures of a running Worker"""
+    processed: int = Field(0, description="Jobs finished successfully")
+    failed: int = 0
+    lost_leases: int = Field(0, description="Jobs whose lease expired before they finished; their outcome was dropped")
+    in_flight: int = 0
+    queue_depth: int = 0
+    throughput: float = Field(0.0, description="Jobs finished per second over the last minute")
+    uptime: float = Field(0.0, description="Seconds since the worker started")
+
+
+def _to_result(value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+        return [_to_result(item) for item in value]
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json", by_alias=True)
+    return value
+
+
+class Worker:
+    """
+    Long-running worker that keeps a RobopostClient busy with jobs from a JobQueue.
+
+    Up to `concurrency` jobs run at once on a thread pool. stop() (or SIGINT/SIGTERM
+    when running via run_forever with signal handling) stops claiming new jobs and
+    lets the in-flight ones finish before returning.
+
+    While running, the worker renews the leases of its jobs and requeues jobs
+    of workers whose leases expired, so several workers may share a queue.
+    """
+
+    def __init__(self, client, queue: JobQueue, concurrency: int = 4, poll_interval: float = 1.0):
+        """
+        :param client: RobopostClient used to execute jobs
+        :param queue: Queue to consume
+        :param concurrency: Maximum number of jobs processed at the same time
+        :param poll_interval: Seconds to wait before polling an empty queue again
+        """
+        self.client = client
+        self.queue = queue
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+
+        self._stop = threading.Event()
+        self._slots = threading.Semaphore(self.concurrency)
+        self._lock = threading.Lock()
+        self._processed = 0
+        self._failed = 0
+        self._lost_leases = 0
+        self._in_flight = 0
+        self._running: Dict[int, Job] = {}
+        self._finished_at = deque(maxlen=10000)
+        self._started_at = None
+
+        self.handlers: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "create_scheduled_post": self._create_scheduled_post,
+            "upload_media": self._upload_media,
+            "generate_video": self._generate_video,
+            "wait_for_video": self._wait_for_video,
+        }
+        _forksafe.register(self)
+
+    def _reset_after_fork(self) -> None:
+        # A run loop of the parent does not continue in the child; call run() there to start one
+        self._stop = threading.Event()
+        self._slots = threading.Semaphore(self.concurrency)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._running = {}
+
+    # ---------------------------------------------------------
+    # Job Handlers
+    # ---------------------------------------------------------
+    def _create_scheduled_post(self, payload: Dict[str, Any]):
+        from .models import PublicAPIScheduledPostCreateHTTPPayload
+
+        return self.client.create_scheduled_posts(PublicAPIScheduledPostCreateHTTPPayload(**payload))
+
+    def _upload_media(self, payload: Dict[str, Any]):
+        return self.client.upload_media(payload["path"])
+
+    def _generate_video(self, payload: Dict[str, Any]):
+        task = self.client.generate_video(payload["series_id"])
+        if not payload.get("wait", False):
+            return task
+        return self.client.wait_for_video_completion(
+            task.task_id,
+            poll_interval=payload.get("poll_interval", 10),
+            timeout=payload.get("timeout", 300)
+        )
+
+    def _wait_for_video(self, payload: Dict[str, Any]):
+        return self.client.wait_for_video_completion(
+            payload["task_id"],
+            poll_interval=payload.get("poll_interval", 10),
+            timeout=payload.get("timeout", 300)
+        )
+
+    # ---------------------------------------------------------
+    # Running
+    # ---------------------------------------------------------
+    def run(self, until_empty: bool = False) -> WorkerStats:
+        """
+        Process jobs until stop() is called (or the queue is empty, if until_empty).
+        In-flight jobs are always drained before returning.
+
+        :param until_empty: Return once no job is queued or running
+        :return: Final WorkerStats
+        """
+        self._started_at = time.monotonic()
+        self._stop.clear()
+        self._slots = threading.Semaphore(self.concurrency)
+        self.queue.requeue_running()
+        stopped = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(stopped,), name="robopost-worker-lease",
+                                     daemon=True)
+        heartbeat.start()
+        try:
+            self._claim_jobs(until_empty)
+        finally:
+            stopped.set()
+            heartbeat.join()
+        return self.stats()
+
+    def _claim_jobs(self, until_empty: bool) -> None:
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="robopost-worker") as executor:
+            while not self._stop.is_set():
+                self._slots.acquire()
+                if self._stop.is_set():
+                    self._slots.release()
+                    break
+
+                try:
+                    job = self.queue.claim()
+                except BaseException:
+                    self._slots.release()
+                    raise
+                if job is None:
+                    self._slots.release()
+                    if until_empty and self.stats().in_flight == 0:
+                        break
+                    self._stop.wait(self.poll_interval)
+                    continue
+
+                with self._lock:
+                    self._in_flight += 1
+                    self._running[job.id] = job
+                executor.submit(self._process, job)
+
+    def _heartbeat(self, stopped: threading.Event) -> None:
+        # Renew well before the lease runs out; also pick up jobs of dead workers
+        while not stopped.wait(self.queue.lease / 3):
+            with self._lock:
+                running = list(self._running.values())
+            try:
+                if running:
+                    self.queue.renew(running)
+                self.queue.requeue_running()
+            except sqlite3.Error:
+                logger.exception("Renewing job leases failed")
+
+    def run_forever(self, stats_callback: Optional[Callable[[WorkerStats], None]] = None,
+                    stats_interval: float = 10.0) -> WorkerStats:
+        """
+        Run with SIGINT/SIGTERM triggering a graceful shutdown, optionally reporting
+        stats periodically. Must be called from the main thread.
+        """
+        previous = {sig: signal.signal(sig, lambda *_: self.stop()) for sig in (signal.SIGINT, signal.SIGTERM)}
+        reporter = None
+
+        if stats_callback is not None:
+            def report():
+                while not self._stop.wait(stats_interval):
+                    stats_callback(self.stats())
+
+            reporter = threading.Thread(target=report, name="robopost-worker-stats", daemon=True)
+            reporter.start()
+
+        try:
+            return self.run()
+        finally:
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+
+    def stop(self) -> None:
+        """Stop claiming new jobs; run() returns once in-flight jobs are finished"""
+        self._stop.set()
+        # Wake up a run loop that is waiting for a free slot
+        self._slots.release()
+
+    def stats(self) -> WorkerStats:
+        now = time.monotonic()
+        with self._lock:
+            recent = sum(1 for t in self._finished_at if now - t <= 60.0)
+            window = min(60.0, now - self._started_at) if self._started_at else 0.0
+            stats = WorkerStats(
+                processed=self._processed,
+                failed=self._failed,
+                lost_leases=self._lost_leases,
+                in_flight=self._in_flight,
+                throughput=recent / window if window > 0 else 0.0,
+                uptime=now - self._started_at if self._started_at else 0.0,
+            )
+        stats.queue_depth = self.queue.depth()
+        return stats
+
+    def _process(self, job: Job) -> None:
+        error = None
+        try:
+            handler = self.handlers.get(job.kind)
+            if handler is None:
+                raise ValueError(f"No handler for job kind {job.kind!r}")
+            result = handler(job.payload)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+
+        recorded = None
+        try:
+            if error is None:
+                recorded = self.queue.complete(job, _to_result(result))
+            else:
+                recorded = self.queue.fail(job, error)
+            if recorded is False:
+                logger.warning("Lease of job %s expired before it finished; its outcome was dropped", job.id)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._running.pop(job.id, None)
+                self._finished_at.append(time.monotonic())
+                if recorded is False:
+                    self._lost_leases += 1
+                elif error is None:
+                    self._processed += 1
+                else:
+                    self._failed += 1
+            self._slots.release()
@@ -0,0 +1,91 @@
+import threading
+
+from robopost_client import CacheConfig, RobopostClient, TTLCache
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return dict(self._data)
+
+
+def make_client(**kwargs):
+    client = RobopostClient(apikey="test", **kwargs)
+    calls = []
+
+    def fake_request(method, endpoint, **request_kwargs):
+        calls.append((method, endpoint))
+        media_id = endpoint.rstrip("/").rsplit("/", 1)[-1]
+        return FakeResponse({"id": media_id, "name": "a.jpg", "extension": "jpg", "storage_object_id": "so-" + media_id})
+
+    client._make_request = fake_request
+    return client, calls
+
+
+def test_ttl_cache_expires_and_evicts():
+    now = [0.0]
+    cache = TTLCache(maxsize=2, ttl=10, clock=lambda: now[0])
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)  # evicts "b", the least recently used
+
+    assert cache.get("b") is None
+    now[0] = 11
+    assert cache.get("a") is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.expirations) == (1, 2, 1, 1)
+
+
+def test_invalidation_during_a_load_is_not_undone():
+    cache = TTLCache(maxsize=10, ttl=60)
+    loading, invalidated = threading.Event(), threading.Event()
+
+    def stale_loader():
+        loading.set()
+        invalidated.wait(5)
+        return "stale"
+
+    reader = threading.Thread(target=lambda: results.append(cache.get_or_load("s1", stale_loader)))
+    results = []
+    reader.start()
+    loading.wait(5)
+    cache.delete("s1")
+    invalidated.set()
+    reader.join(5)
+
+    # The reader gets the value it loaded, but later readers load again
+    assert results == ["stale"]
+    assert cache.get_or_load("s1", lambda: "fresh") == "fresh"
+    assert cache.get("s1") == "fresh"
+
+    # A load that completes without interference is stored as before
+    assert cache.get_or_load("s2", lambda: 2) == 2
+    assert cache.get("s2") == 2
+
+
+def test_client_caches_and_invalidates_media():
+    client, calls = make_client(cache={"media": CacheConfig(maxsize=10, ttl=60)})
+
+    first = client.get_media("m1")
+    assert client.get_media("m1") is first
+    assert calls == [("GET", "/medias/m1")]
+
+    client.delete_media("m1")
+    client.get_media("m1")
+    assert calls[-1] == ("GET", "/medias/m1")
+
+    stats = client.cache_stats()["media"]
+    assert (stats.hits, stats.misses, stats.invalidations) == (1, 2, 1)
+
+
+def test_client_without_cache_always_fetches():
+    client, calls = make_client()
+    client.get_media("m1")
+    client.get_media("m1")
+    assert len(calls) == 2
+    assert client.cache_stats() == {}
@@ -0,0 +1,110 @@
+import gzip
+import json
+import time
+
+import pytest
+
+from robopost_client import (
+    PublicAPIGeneratedFacelessVideoSeriesCreate,
+    RecordingTransport,
+    ReplayTransport,
+    RobopostAPIError,
+    RobopostClient,
+    StubConfig,
+    StubServer,
+    load_cassette,
+)
+
+
+@pytest.fixture
+def cassette(tmp_path):
+    path = str(tmp_path / "traffic.jsonl.gz")
+    with StubServer(StubConfig(latency=0.05)) as stub:
+        stub.seed_media(3)
+        with RobopostClient(apikey="secret", base_url=stub.base_url, transport=RecordingTransport(path)) as client:
+            client.list_media(limit=2)
+            series = client.create_video_series(PublicAPIGeneratedFacelessVideoSeriesCreate(
+                name="Long", content_custom="x" * 5000
+            ))
+            client.get_video_series(series.id)
+            stub.fail_next(500)
+            with pytest.raises(RobopostAPIError):
+                client.list_media(limit=2, skip=2)
+        base_url = stub.base_url
+    return path, base_url, series
+
+
+def test_recording_is_compressed_and_scrubbed(cassette):
+    path, _, _ = cassette
+
+    interactions = load_cassette(path)
+    with gzip.open(path, "rb") as f:
+        raw = f.read()
+
+    assert [i.method for i in interactions] == ["GET", "POST", "GET", "GET"]
+    assert b"secret" not in raw
+    assert "apikey=%3Cscrubbed%3E" in interactions[0].path
+    assert interactions[0].elapsed >= 0.05
+    assert interactions[3].status == 500
+    # Request bodies are recorded as sent, before compression
+    assert json.loads(interactions[1].request_content())["content_custom"] == "x" * 5000
+    assert interactions[0].request_content() == b""
+
+
+def test_request_bodies_can_be_redacted_and_are_recorded_once_read(tmp_path):
+    path = str(tmp_path / "traffic.jsonl.gz")
+    transport = RecordingTransport(path, redact_body=lambda body: body.replace(b"Secret", b"[redacted]"))
+    with StubServer(StubConfig()) as stub:
+        with RobopostClient(apikey="k", base_url=stub.base_url, transport=transport, compress_min_size=0) as client:
+            client.create_video_series(PublicAPIGeneratedFacelessVideoSeriesCreate(name="Secret plan"))
+
+            # A streamed response is recorded once its body is read, after the caller timed the headers
+            response = client.session.get(f"{stub.base_url}/medias/", params={"apikey": "k"}, stream=True)
+            assert transport.recorded == 1
+            response.content
+            assert transport.recorded == 2
+
+    created = load_cassette(path)[0]
+    assert json.loads(created.request_content())["name"] == "[redacted] plan"
+
+
+def test_replay_without_network_at_speed_multiplier(cassette):
+    path, base_url, series = cassette
+    client = RobopostClient(apikey="other-key", base_url=base_url,
+                            transport=ReplayTransport(path, speed=10.0, loop=False))
+
+    start = time.perf_counter()
+    media = client.list_media(limit=2)
+    elapsed = time.perf_counter() - start
+    replayed = client.get_video_series(series.id)
+    # Unknown IDs fall back to responses recorded for the same endpoint
+    fallback = client.get_video_series("unknown-id")
+
+    assert len(media) == 2
+    assert elapsed < 0.05
+    assert replayed.content_custom == "x" * 5000
+    assert fallback.id == series.id
+    with pytest.raises(RobopostAPIError):
+        client.list_media(limit=2, skip=2)
+
+
+def test_paced_replay_keeps_the_recorded_offsets(cassette):
+    path, base_url, series = cassette
+    interactions = load_cassette(path)
+    client = RobopostClient(apikey="secret", base_url=base_url, transport=ReplayTransport(path, speed=1.0, pace=True))
+
+    start = time.perf_counter()
+    client.list_media(limit=2)
+    client.get_video_series(series.id)
+    elapsed = time.perf_counter() - start
+
+    # The create recorded between both reads is not replayed, but the time it took is
+    assert elapsed >= interactions[2].offset - interactions[0].offset + interactions[2].elapsed
+
+
+def test_strict_replay_rejects_unrecorded_requests(cassette):
+    path, base_url, _ = cassette
+    client = RobopostClient(apikey="secret", base_url=base_url, transport=ReplayTransport(path, strict=True))
+
+    with pytest.raises(LookupError):
+        client.get_media("m1")
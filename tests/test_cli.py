@@ -0,0 +1,118 @@
+import json
+import re
+import subprocess
+import sys
+
+import pytest
+
+from robopost_client import PublicAPIMediaRead, RobopostAPIError, robopost_cli
+
+
+class FakeClient:
+    def __init__(self):
+        self.posts = []
+        self.closed = False
+
+    def upload_media(self, path):
+        if path.endswith("bad.jpg"):
+            raise RobopostAPIError("unsupported file", status_code=400)
+        name = path.rsplit("/", 1)[-1]
+        return PublicAPIMediaRead(id=name, name=name, extension="jpg", storage_object_id="so-" + name)
+
+    def create_scheduled_posts(self, payload):
+        self.posts.append(payload)
+        return {"text": payload.text}
+
+    def close(self):
+        self.closed = True
+
+
+def run_cli(monkeypatch, capsys, argv, client=None):
+    client = client or FakeClient()
+    monkeypatch.setattr(robopost_cli, "_make_client", lambda args: client)
+    code = robopost_cli.main(["--apikey", "test"] + argv)
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    return code, lines
+
+
+def test_help_does_not_import_heavy_dependencies():
+    code = (
+        "import sys\n"
+        "from robopost_client import robopost_cli\n"
+        "try:\n"
+        "    robopost_cli.main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "sys.stderr.write(str(sorted(m for m in ('requests', 'pydantic') if m in sys.modules)))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.stderr == "[]"
+
+
+def test_upload_directory_streams_jsonl_in_order(monkeypatch, capsys, tmp_path):
+    for name in ("a.jpg", "bad.jpg", "c.jpg", ".hidden"):
+        (tmp_path / name).write_bytes(b"x")
+
+    code, lines = run_cli(monkeypatch, capsys, ["media", "upload", str(tmp_path), "--concurrency", "3"])
+
+    assert code == 1
+    assert [line.get("id") for line in lines] == ["a.jpg", None, "c.jpg"]
+    assert lines[1]["error_type"] == "RobopostAPIError"
+    assert lines[1]["input"].endswith("bad.jpg")
+
+
+def test_schedule_reads_jsonl_payloads(monkeypatch, capsys, tmp_path):
+    payloads = tmp_path / "posts.jsonl"
+    payloads.write_text(
+        json.dumps({"text": "one", "channel_ids": ["c1"]}) + "\n\n"
+        + json.dumps({"text": "two", "channel_ids": ["c2"]}, indent=2) + "\n"
+    )
+    client = FakeClient()
+
+    code, lines = run_cli(monkeypatch, capsys, ["posts", "schedule", str(payloads)], client)
+
+    assert code == 0
+    assert sorted(post.text for post in client.posts) == ["one", "two"]
+
+
+def test_malformed_json_is_reported_with_its_line(monkeypatch, capsys, tmp_path):
+    payloads = tmp_path / "posts.jsonl"
+    lines = [json.dumps({"text": f"post {i}", "channel_ids": ["c1"]}) for i in range(5)]
+    lines[2] = '{"text": "broken", "channel_ids": ["c1"]'
+    payloads.write_text("\n".join(lines) + "\n")
+
+    items = robopost_cli.read_json_items(str(payloads))
+    assert [item["text"] for item in (next(items), next(items))] == ["post 0", "post 1"]
+    with pytest.raises(ValueError, match=f"^{re.escape(str(payloads))}: line 4: invalid JSON"):
+        next(items)
+
+    pretty = tmp_path / "series.json"
+    pretty.write_text('\n{\n  "name": "Facts",\n  "prompt" "x"\n}\n')
+    code, out = run_cli(monkeypatch, capsys, ["series", "update", "s1", str(pretty)])
+    assert code == 1
+    assert out[-1]["error"] == (f"{pretty}: line 4: invalid JSON: Expecting ':' delimiter "
+                                "(in the object starting at line 2)")
+
+
+def test_results_sent_before_malformed_input_are_still_reported(monkeypatch, capsys, tmp_path):
+    payloads = tmp_path / "posts.jsonl"
+    lines = [json.dumps({"text": f"post {i}", "channel_ids": ["c1"]}) for i in range(3)] + ['{"text": ']
+    payloads.write_text("\n".join(lines) + "\nnot json\n")
+    client = FakeClient()
+
+    code, out = run_cli(monkeypatch, capsys, ["posts", "schedule", str(payloads), "--concurrency", "4"], client)
+
+    assert code == 1
+    assert out[:3] == [{"text": "post 0"}, {"text": "post 1"}, {"text": "post 2"}]
+    assert out[3]["error_type"] == "ValueError"
+    assert client.closed
+
+
+def test_update_from_an_empty_file_is_reported(monkeypatch, capsys, tmp_path):
+    empty = tmp_path / "series.json"
+    empty.write_text("\n")
+
+    code, out = run_cli(monkeypatch, capsys, ["series", "update", "s1", str(empty)])
+
+    assert code == 1
+    assert out == [{"error": f"{empty}: no JSON object found", "error_type": "ValueError"}]
@@ -0,0 +1,85 @@
+import asyncio
+import gzip
+import json
+
+from robopost_client import (
+    AsyncRobopostClient,
+    PublicAPIScheduledPostCreateHTTPPayload,
+    RobopostClient,
+    StubConfig,
+    StubServer,
+    protocol,
+)
+
+LONG_TEXT = "Long post text with #hashtags and a first comment. " * 200
+
+
+def payload(text: str) -> PublicAPIScheduledPostCreateHTTPPayload:
+    return PublicAPIScheduledPostCreateHTTPPayload(text=text, first_comment=text, channel_ids=["c1"])
+
+
+def test_large_json_bodies_are_sent_gzipped():
+    with StubServer() as stub:
+        client = RobopostClient(apikey="test", base_url=stub.base_url, compress_min_size=4096)
+        sent = []
+        client.add_after_response_hook(lambda info: sent.append(info.bytes_sent))
+
+        posts = client.create_scheduled_posts(payload(LONG_TEXT))
+        assert posts[0].text == LONG_TEXT
+        raw_size = len(protocol.create_scheduled_posts(payload(LONG_TEXT)).body().encode())
+        assert stub.bytes_received == sent[0] < raw_size / 10
+
+        stub.reset()
+        client.create_scheduled_posts(payload("short"))
+        assert stub.bytes_received == len(protocol.create_scheduled_posts(payload("short")).body().encode())
+
+
+def test_bodies_are_sent_as_they_are_by_default(tmp_path):
+    path = tmp_path / "clip.txt"
+    path.write_bytes(b"a" * 4096)
+    with StubServer() as stub:
+        client = RobopostClient(apikey="test", base_url=stub.base_url)
+        client.create_scheduled_posts(payload(LONG_TEXT))
+        assert stub.bytes_received == len(protocol.create_scheduled_posts(payload(LONG_TEXT)).body().encode())
+
+        # Uploads are never compressed, even above the threshold
+        stub.reset()
+        RobopostClient(apikey="test", base_url=stub.base_url, compress_min_size=0).upload_media(str(path))
+        assert stub.bytes_received > 4096
+
+
+def test_compressed_responses_are_negotiated_and_reported():
+    with StubServer(StubConfig(compress_min_size=512)) as stub:
+        stub.seed_media(100)
+        client = RobopostClient(apikey="test", base_url=stub.base_url)
+        infos = []
+        client.add_after_response_hook(infos.append)
+
+        media = client.list_media(limit=100)
+        assert len(media) == 100
+        info = infos[-1]
+        assert info.bytes_received == len(json.dumps([m for m in stub.media.values()]).encode())
+        assert info.bytes_received_wire == stub.bytes_sent < info.bytes_received / 3
+
+
+def test_async_client_compresses_bodies():
+    async def create(base_url):
+        async with AsyncRobopostClient(apikey="test", base_url=base_url, compress_min_size=4096) as client:
+            return await client.create_scheduled_posts(payload(LONG_TEXT))
+
+    with StubServer() as stub:
+        posts = asyncio.run(create(stub.base_url))
+        assert posts[0].first_comment == LONG_TEXT
+        assert stub.bytes_received < len(LONG_TEXT)
+
+
+def test_gzip_body_only_compresses_json():
+    headers = dict(protocol.JSON_HEADERS)
+    body, sent_headers = protocol.gzip_body("x" * 100, headers, min_size=10)
+    assert gzip.decompress(body) == b"x" * 100
+    assert sent_headers == {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+    assert headers == protocol.JSON_HEADERS
+
+    assert protocol.gzip_body("x" * 5, headers, min_size=10) == ("x" * 5, headers)
+    multipart = {"Content-Type": "multipart/form-data; boundary=b"}
+    assert protocol.gzip_body(b"x" * 100, multipart, min_size=10) == (b"x" * 100, multipart)
@@ -0,0 +1,135 @@
+"""Stress tests: one RobopostClient shared by many threads against the stub server"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from robopost_client import (
+    CacheConfig,
+    MetricsRegistry,
+    PublicAPIGeneratedFacelessVideoSeriesCreate,
+    PublicAPIGeneratedFacelessVideoSeriesUpdate,
+    PublicAPIMediaRead,
+    PublicAPIScheduledPostCreateHTTPPayload,
+    RobopostClient,
+    StubConfig,
+    StubServer,
+)
+
+THREADS = 16
+ROUNDS = 5
+
+
+@pytest.fixture
+def stub():
+    # The server rejects requests without the key, so a lost apikey parameter fails loudly
+    with StubServer(StubConfig(apikey="shared", polls_to_complete=2, seed=3)) as server:
+        server.seed_media(10)
+        yield server
+
+
+@pytest.fixture
+def client(stub):
+    cache = {name: CacheConfig(ttl=60) for name in ("video_series", "media", "video_task_details")}
+    with RobopostClient(apikey="shared", base_url=stub.base_url, cache=cache, coalesce_gets=True,
+                        metrics=MetricsRegistry(), pool_maxsize=THREADS) as shared:
+        yield shared
+
+
+def scenario(client: RobopostClient, worker: int, upload_path: str) -> None:
+    """Touch every endpoint, checking that each thread sees its own results"""
+    for round_ in range(ROUNDS):
+        name = f"series-{worker}-{round_}"
+        media = client.upload_media(upload_path)
+        assert client.get_media(media.id) == media
+        assert len(client.list_media(limit=5)) == 5
+
+        posts = client.create_scheduled_posts(PublicAPIScheduledPostCreateHTTPPayload(
+            text=f"post {worker}/{round_}", channel_ids=[f"c{worker}"], image_object_ids=[media.storage_object_id]
+        ))
+        assert posts[0].text == f"post {worker}/{round_}"
+
+        series = client.create_video_series(PublicAPIGeneratedFacelessVideoSeriesCreate(name=name))
+        assert client.get_video_series(series.id).name == name
+        updated = client.update_video_series(series.id, PublicAPIGeneratedFacelessVideoSeriesUpdate(
+            max_duration=30 + worker
+        ))
+        assert updated.max_duration == 30 + worker
+        assert client.get_video_series(series.id).max_duration == 30 + worker
+        assert client.list_video_series(limit=1000, search_text=name)[0].id == series.id
+
+        task = client.generate_video(series.id)
+        assert client.get_video_task(task.task_id).task_id == task.task_id
+        assert client.wait_for_video_completion(task.task_id, poll_interval=0, timeout=10).status == "COMPLETE"
+        client.get_video_task_details(task.task_id)
+        assert any(t.task_id == task.task_id for t in client.list_video_tasks(series_id=series.id))
+
+        second = client.generate_video(series.id)
+        client.cancel_video_task(second.task_id)
+        client.delete_video_series(series.id)
+        client.delete_media(media.id)
+
+
+def test_shared_client_survives_all_endpoints_from_many_threads(stub, client, tmp_path):
+    upload_path = tmp_path / "frame.png"
+    upload_path.write_bytes(b"\x89PNG" + b"\x00" * 4096)
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        futures = [executor.submit(scenario, client, i, str(upload_path)) for i in range(THREADS)]
+        for future in futures:
+            future.result()
+
+    calls = THREADS * ROUNDS
+    assert stub.request_count("POST /medias/upload") == calls
+    assert stub.request_count("POST /scheduled_posts/") == calls
+    assert stub.request_count("DELETE /video-series/{id}") == calls
+    assert len(stub.scheduled_posts) == calls
+    assert len(stub.media) == 10
+    # Every request reached the server with the key and was counted exactly once
+    assert client.metrics.request_count() == stub.request_count()
+
+
+def test_caller_arguments_are_not_modified(stub, client):
+    series = client.create_video_series(PublicAPIGeneratedFacelessVideoSeriesCreate(name="Shared"))
+    payload = PublicAPIGeneratedFacelessVideoSeriesUpdate(name="Renamed", max_duration=30)
+    snapshot = payload.model_dump()
+    fields_set = set(payload.model_fields_set)
+
+    def update_and_list(_):
+        client.update_video_series(series.id, payload)
+        return client.list_media(skip=0, limit=3)
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        pages = list(executor.map(update_and_list, range(THREADS * 4)))
+
+    assert payload.model_dump() == snapshot
+    assert payload.model_fields_set == fields_set
+    assert all(len(page) == 3 and isinstance(page[0], PublicAPIMediaRead) for page in pages)
+
+
+def test_hooks_can_change_while_requests_are_in_flight(stub, client):
+    seen = []
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def hook(info):
+        with lock:
+            seen.append(info.status)
+
+    def churn():
+        while not stop.is_set():
+            client.add_after_response_hook(hook)
+            client.remove_hook(hook)
+
+    churner = threading.Thread(target=churn)
+    churner.start()
+    try:
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            results = list(executor.map(lambda i: client.list_media(skip=i % 5, limit=2), range(400)))
+    finally:
+        stop.set()
+        churner.join()
+
+    assert all(len(page) == 2 for page in results)
+    assert all(status == 200 for status in seen)
+    assert client.after_response_hooks == [client.metrics.request_finished]
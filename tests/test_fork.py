@@ -0,0 +1,117 @@
+import multiprocessing
+
+import pytest
+
+from robopost_client import (
+    CacheConfig,
+    HedgingPolicy,
+    MetricsRegistry,
+    PriorityLanes,
+    QuotaTracker,
+    RobopostClient,
+    RobopostClientPool,
+    SharedCache,
+    StubConfig,
+    StubServer,
+)
+
+fork = multiprocessing.get_context("fork")
+
+
+@pytest.fixture
+def stub():
+    with StubServer(StubConfig()) as server:
+        server.seed_media(3)
+        server.seed_video_series(2)
+        yield server
+
+
+def run_in_child(func, timeout=30):
+    """Run func in a forked child and return its result; a hang fails the test"""
+    results = fork.Queue()
+
+    def target():
+        try:
+            results.put(("ok", func()))
+        except BaseException as e:
+            results.put(("error", repr(e)))
+
+    child = fork.Process(target=target)
+    child.start()
+    child.join(timeout)
+    if child.is_alive():
+        child.kill()
+        child.join()
+        pytest.fail("Forked child hung")
+    status, value = results.get(timeout=5)
+    assert status == "ok", value
+    return value
+
+
+def test_child_gets_its_own_connections(stub):
+    client = RobopostClient(apikey="test", base_url=stub.base_url)
+    client.list_media()
+    adapter = client.session.get_adapter(stub.base_url)
+    assert adapter.poolmanager.pools
+
+    def child():
+        inherited = len(adapter.poolmanager.pools)
+        media = client.list_media()
+        return inherited, len(media), adapter._pool_maxsize
+
+    assert run_in_child(child) == (0, 3, 32)
+    # The parent's pooled connection is still usable
+    assert len(client.list_media()) == 3
+
+
+def test_locks_held_at_fork_do_not_deadlock_the_child(stub, tmp_path):
+    media_id = next(iter(stub.media))
+    client = RobopostClient(
+        apikey="test",
+        base_url=stub.base_url,
+        cache={"media": CacheConfig(ttl=60)},
+        coalesce_gets=True,
+        hedging=HedgingPolicy(),
+        metrics=MetricsRegistry(),
+        priority_lanes=PriorityLanes(capacity=4),
+        quota=QuotaTracker(),
+        shared_cache=SharedCache(str(tmp_path / "shared.db")),
+    )
+    client.get_media(media_id)
+    client.list_media()
+
+    locks = [client._hooks_lock, client._singleflight._lock, client.hedging._lock, client.metrics._lock,
+             client.priority_lanes._lock, client.quota._lock, client._caches["media"]._lock,
+             client._caches["media"].cache._lock]
+    for lock in locks:
+        lock.acquire()
+    try:
+        def child():
+            media = client.get_media(media_id)
+            series = client.list_video_series()
+            return media.id, len(series), client.cache_stats()["media"].hits
+
+        assert run_in_child(child) == (media_id, 2, 1)
+    finally:
+        for lock in locks:
+            lock.release()
+
+    assert stub.request_count("GET /medias/{id}") == 1
+
+
+def test_pool_restarts_workers_in_the_child():
+    with StubServer(StubConfig(latency=0.3)) as stub, RobopostClientPool(base_url=stub.base_url,
+                                                                         max_concurrency=1) as pool:
+        stub.seed_media(3)
+        running = pool.submit("KEY_A", "list_media")
+        queued = pool.submit("KEY_A", "list_video_series")
+
+        def child():
+            stats = pool.tenant_stats("KEY_A")
+            return stats.queued, stats.in_flight, len(pool.call("KEY_A", "list_media"))
+
+        assert run_in_child(child) == (0, 0, 3)
+        assert len(running.result(timeout=10)) == 3
+        assert queued.result(timeout=10) == []
+        # The call queued at the time of the fork was sent by the parent only
+        assert stub.request_count("GET /video-series/") == 1
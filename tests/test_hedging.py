@@ -0,0 +1,70 @@
+import threading
+import time
+
+from robopost_client import HedgingPolicy, RobopostClient, StubConfig, StubServer
+
+
+def test_hedge_answers_a_stalled_request():
+    policy = HedgingPolicy(max_hedge_ratio=1.0, initial_delay=0.01)
+    infos = []
+
+    with StubServer(StubConfig()) as stub:
+        series_id = stub.seed_video_series(1)[0]["id"]
+        client = RobopostClient(apikey="test", base_url=stub.base_url, hedging=policy)
+        client.add_after_response_hook(infos.append)
+        # The primary attempt is held by the server until the hedge has answered
+        release = stub.hold_next()
+        try:
+            series = client.get_video_series(series_id)
+        finally:
+            release.set()
+            policy.shutdown()
+
+    stats = policy.stats()
+    assert series.id == series_id
+    assert infos[0].retries == 1
+    assert (stats.requests, stats.hedges_sent, stats.hedge_wins) == (1, 1, 1)
+
+
+def test_losing_attempt_is_closed_and_not_sampled():
+    class Response:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    release = threading.Event()
+    responses = []
+
+    def send():
+        response = Response()
+        responses.append(response)
+        if len(responses) == 1:
+            release.wait()
+        return response
+
+    policy = HedgingPolicy(max_hedge_ratio=1.0, initial_delay=0.01, min_delay=0.0, min_samples=1)
+    try:
+        assert policy.run(send) is responses[1]
+        time.sleep(0.2)
+        release.set()
+        deadline = time.monotonic() + 5
+        while not responses[0].closed and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        policy.shutdown()
+
+    assert responses[0].closed and not responses[1].closed
+    # Only the winner's latency was sampled, not the 0.2s of the loser
+    assert policy.stats().hedge_delay < 0.2
+
+
+def test_hedge_budget_is_capped():
+    policy = HedgingPolicy(max_hedge_ratio=0.0, initial_delay=0.001)
+    try:
+        assert policy.run(lambda: time.sleep(0.01) or "slow") == "slow"
+    finally:
+        policy.shutdown()
+
+    stats = policy.stats()
+    assert (stats.requests, stats.hedges_sent, stats.budget_denied) == (1, 0, 1)
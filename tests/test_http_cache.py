@@ -0,0 +1,129 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from robopost_client import (
+    DiskResponseCache,
+    PublicAPIGeneratedFacelessVideoSeriesUpdate,
+    RobopostAPIError,
+    RobopostClient,
+    StubConfig,
+    StubServer,
+)
+
+
+class ETagHandler(BaseHTTPRequestHandler):
+    statuses = []
+
+    def do_GET(self):
+        body = json.dumps({"id": "m1", "name": "a.jpg", "extension": "jpg", "storage_object_id": "so-1"}).encode()
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.statuses.append(304)
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            return
+
+        self.statuses.append(200)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ETagHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_disk_cache_revalidates_with_etag(tmp_path):
+    ETagHandler.statuses = []
+    server = serve()
+    base_url = f"http://127.0.0.1:{server.server_port}/v1"
+
+    infos = []
+    try:
+        cache = DiskResponseCache(str(tmp_path / "http.sqlite"))
+        first_client = RobopostClient(apikey="secret", base_url=base_url, http_cache=cache)
+        first_client.add_before_request_hook(infos.append)
+        first = first_client.get_media("m1")
+
+        # A new client (e.g. after a restart) revalidates instead of refetching
+        second_client = RobopostClient(apikey="secret", base_url=base_url, http_cache=DiskResponseCache(cache.path))
+        second_client.add_before_request_hook(infos.append)
+        second = second_client.get_media("m1")
+        third = second_client.get_media("m1")
+    finally:
+        server.shutdown()
+
+    assert ETagHandler.statuses == [200, 304, 304]
+    # Only the revalidated bodies came from the cache, even without after-response hooks timing the requests
+    assert [info.from_cache for info in infos] == [False, True, True]
+    assert first == second
+    # Repeated 304s reuse the already parsed model
+    assert third is second
+    assert all(b"secret" not in path.read_bytes() for path in tmp_path.iterdir())
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    from robopost_client.http_cache import CachedResponse
+
+    cache = DiskResponseCache(str(tmp_path / "http.sqlite"), max_bytes=10)
+    cache.set("a", CachedResponse(url="u", body=b"12345", etag="a"))
+    cache.set("b", CachedResponse(url="u", body=b"12345", etag="b"))
+    cache.get("a")
+    cache.set("c", CachedResponse(url="u", body=b"12345", etag="c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.total_bytes() == 10
+
+
+def test_disk_cache_counters_are_exact_under_concurrency(tmp_path):
+    from robopost_client.http_cache import CachedResponse, resolve_cached
+
+    cache = DiskResponseCache(str(tmp_path / "http.sqlite"))
+    cache.set("k", CachedResponse(url="u", body=b"{}", expires_at=time.time() + 60))
+
+    def read():
+        for _ in range(200):
+            resolve_cached(cache, "k", send=None)
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert cache.stats()["hits"] == 1600
+
+
+def test_mutations_drop_fresh_disk_cache_entries(tmp_path):
+    with StubServer(StubConfig(cache_max_age=60)) as stub:
+        series_id = stub.seed_video_series(1)[0]["id"]
+        media_id = stub.seed_media(1)[0]["id"]
+        client = RobopostClient(apikey="test", base_url=stub.base_url,
+                                http_cache=DiskResponseCache(str(tmp_path / "http.sqlite")))
+
+        assert client.get_video_series(series_id).name != "Renamed"
+        client.update_video_series(series_id, PublicAPIGeneratedFacelessVideoSeriesUpdate(name="Renamed"))
+        assert client.get_video_series(series_id).name == "Renamed"
+
+        client.get_media(media_id)
+        client.get_media(media_id)
+        client.delete_media(media_id)
+        with pytest.raises(RobopostAPIError):
+            client.get_media(media_id)
+
+        assert stub.request_count("GET /video-series/{id}") == 2
+        assert stub.request_count("GET /medias/{id}") == 2
+
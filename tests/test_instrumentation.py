@@ -0,0 +1,78 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from robopost_client import RobopostAPIError, RobopostClient
+
+
+class MediaHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path.startswith("/v1/medias/missing"):
+            body = json.dumps({"detail": "Not found"}).encode()
+            self.send_response(404)
+        else:
+            body = json.dumps({"id": "m1", "name": "a.jpg", "extension": "jpg", "storage_object_id": "so-1"}).encode()
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MediaHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/v1"
+    server.shutdown()
+
+
+def test_hooks_receive_status_sizes_and_timing(base_url):
+    client = RobopostClient(apikey="secret", base_url=base_url)
+    before, after = [], []
+    client.add_before_request_hook(before.append)
+    client.add_after_response_hook(after.append)
+
+    media = client.get_media("m1")
+    client.get_media("m2")
+
+    assert media.id == "m1"
+    assert [info.endpoint for info in before] == ["/medias/m1", "/medias/m2"]
+    info = after[0]
+    assert info.status == 200
+    assert info.bytes_sent == 0
+    assert info.bytes_received > 0
+    assert "secret" not in info.url
+    assert info.error is None
+    timing = info.timing
+    assert timing.connect > 0
+    assert timing.validate > 0
+    assert 0 < timing.serialization_cpu
+    parts = timing.connect + timing.ttfb + timing.transfer + timing.decode + timing.validate
+    assert parts <= timing.total
+    # The second call reuses the pooled keep-alive connection
+    assert after[1].timing.connect == 0
+
+
+def test_hooks_see_errors_and_hook_failures_are_isolated(base_url):
+    client = RobopostClient(apikey="secret", base_url=base_url)
+    after = []
+
+    def broken(info):
+        raise RuntimeError("hook bug")
+
+    client.add_after_response_hook(broken)
+    client.add_after_response_hook(after.append)
+
+    with pytest.raises(RobopostAPIError):
+        client.get_media("missing")
+
+    assert after[0].status == 404
+    assert isinstance(after[0].error, RobopostAPIError)
@@ -0,0 +1,103 @@
+import threading
+import time
+
+import pytest
+
+from robopost_client import (
+    Priority,
+    PriorityLanes,
+    PublicAPIScheduledPostCreateHTTPPayload,
+    RobopostClient,
+    StubConfig,
+    StubServer,
+    use_priority,
+)
+from robopost_client.lanes import current_priority
+
+
+def test_reserved_capacity_sets_lane_limits():
+    lanes = PriorityLanes(capacity=8, reserved={"interactive": 2, Priority.NORMAL: 1})
+    assert lanes.limits == {Priority.INTERACTIVE: 8, Priority.NORMAL: 6, Priority.BULK: 5}
+
+    with pytest.raises(ValueError):
+        PriorityLanes(capacity=2, reserved={Priority.INTERACTIVE: 2})
+
+
+def test_use_priority_is_scoped():
+    assert current_priority() is Priority.NORMAL
+    with use_priority("bulk"):
+        assert current_priority() is Priority.BULK
+        with use_priority(Priority.INTERACTIVE):
+            assert current_priority() is Priority.INTERACTIVE
+        assert current_priority() is Priority.BULK
+    assert current_priority() is Priority.NORMAL
+
+    with pytest.raises(ValueError):
+        with use_priority("urgent"):
+            pass
+
+
+def test_freed_slots_go_to_the_highest_priority_waiter():
+    lanes = PriorityLanes(capacity=2, reserved={Priority.INTERACTIVE: 1})
+    lanes.acquire(Priority.INTERACTIVE)
+    lanes.acquire(Priority.INTERACTIVE)
+    order = []
+
+    def call(lane):
+        with lanes.slot(lane):
+            order.append(lane)
+
+    threads = []
+    for lane in (Priority.BULK, Priority.BULK, Priority.NORMAL, Priority.INTERACTIVE):
+        thread = threading.Thread(target=call, args=(lane,))
+        thread.start()
+        threads.append(thread)
+        while lanes.stats()[lane.value].waiting == 0:
+            time.sleep(0.001)
+
+    lanes.release(Priority.INTERACTIVE)
+    lanes.release(Priority.INTERACTIVE)
+    for thread in threads:
+        thread.join()
+
+    assert order == [Priority.INTERACTIVE, Priority.NORMAL, Priority.BULK, Priority.BULK]
+    stats = lanes.stats()
+    assert stats["bulk"].completed == 2 and stats["bulk"].max_wait > 0
+    assert stats["interactive"].in_flight == 0
+
+
+def test_interactive_calls_bypass_bulk_backlog():
+    latency = 0.05
+    with StubServer(StubConfig(latency=latency)) as stub:
+        stub.seed_media(1)
+        media_id = next(iter(stub.media))
+        lanes = PriorityLanes(capacity=4, reserved={Priority.INTERACTIVE: 1})
+        client = RobopostClient(apikey="test", base_url=stub.base_url, pool_maxsize=4, priority_lanes=lanes)
+        payload = PublicAPIScheduledPostCreateHTTPPayload(text="bulk", channel_ids=["c1"])
+        stop = threading.Event()
+
+        def bulk():
+            with use_priority(Priority.BULK):
+                while not stop.is_set():
+                    client.create_scheduled_posts(payload)
+
+        workers = [threading.Thread(target=bulk) for _ in range(12)]
+        for worker in workers:
+            worker.start()
+        try:
+            while client.priority_stats()["bulk"].waiting == 0:
+                time.sleep(0.005)
+            with use_priority(Priority.INTERACTIVE):
+                start = time.perf_counter()
+                client.get_media(media_id)
+                elapsed = time.perf_counter() - start
+            stats = client.priority_stats()
+        finally:
+            stop.set()
+            for worker in workers:
+                worker.join()
+
+    # One round trip, not a wait behind the twelve queued bulk calls
+    assert elapsed < latency * 3
+    assert stats["bulk"].in_flight <= 3
+    assert stats["interactive"].completed == 1
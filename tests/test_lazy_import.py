@@ -0,0 +1,39 @@
+import subprocess
+import sys
+
+import robopost_client
+
+
+def run_python(code: str) -> str:
+    return subprocess.check_output([sys.executable, "-c", code]).decode().strip()
+
+
+def test_package_import_loads_nothing_heavy():
+    loaded = run_python(
+        "import sys, robopost_client;"
+        "print(sorted(m for m in ('requests', 'urllib3', 'pydantic', 'robopost_client.models') if m in sys.modules))"
+    )
+    assert loaded == "[]"
+
+
+def test_enums_do_not_load_pydantic_or_requests():
+    loaded = run_python(
+        "import sys; from robopost_client import AIVoice;"
+        "print(sorted(m for m in ('requests', 'pydantic') if m in sys.modules))"
+    )
+    assert loaded == "[]"
+
+
+def test_plain_client_loads_no_optional_features():
+    loaded = run_python(
+        "import sys; from robopost_client import RobopostClient; RobopostClient(apikey='k');"
+        "print(sorted(m for m in ('sqlite3', 'tracemalloc', 'gzip', 'robopost_client.hedging',"
+        " 'robopost_client.metrics', 'robopost_client.quota') if m in sys.modules))"
+    )
+    assert loaded == "[]"
+
+
+def test_all_public_names_resolve():
+    for name in robopost_client.__all__:
+        assert getattr(robopost_client, name) is not None
+    assert set(robopost_client.__all__) <= set(dir(robopost_client))
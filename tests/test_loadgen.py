@@ -0,0 +1,60 @@
+import pytest
+
+from robopost_client import LoadGenerator, RobopostClient, StubConfig, StubServer
+from robopost_client.loadgen import parse_mix
+
+
+@pytest.fixture
+def generator():
+    with StubServer(StubConfig(latency=0.002)) as stub:
+        stub.seed_media(20)
+        stub.seed_video_series(5)
+        client = RobopostClient(apikey="test", base_url=stub.base_url)
+        yield LoadGenerator(client, parse_mix("create_scheduled_posts=2,get_media=1,get_video_series=1"), seed=7)
+
+
+def test_concurrency_run_reports_throughput_latency_and_cpu(generator):
+    session = generator.client.session
+    send, streamed = session.request, []
+
+    def request(method, url, **kwargs):
+        streamed.append(kwargs.get("stream", False))
+        return send(method, url, **kwargs)
+
+    session.request = request
+    report = generator.run(duration=0.5, concurrency=2)
+
+    assert report.requests > 10
+    assert report.errors == 0
+    assert report.throughput > 0
+    assert 0 < report.latency_p50 <= report.latency_p99 <= report.latency_max
+    # Measured on the threads' CPU clocks, so waiting for the GIL is not counted
+    assert 0 < report.cpu_serialization < report.cpu_total
+    assert report.cpu_total == pytest.approx(report.cpu_serialization + report.cpu_network)
+    # The CPU split does not switch the client onto the timed, streamed path
+    assert streamed and not any(streamed)
+    # The hook used for the CPU split is removed after the run
+    assert generator.client.before_request_hooks == generator.client.after_response_hooks == []
+
+
+def test_rate_run_tracks_target(generator):
+    report = generator.run(duration=1.0, rps=50)
+
+    assert report.mode == "rps"
+    assert 40 <= report.requests <= 51
+
+
+def test_sweep_finds_knee(generator):
+    seen = []
+    result = generator.sweep(levels=(1, 2, 4), duration=0.3, callback=seen.append)
+
+    assert [int(r.target) for r in result.runs] == [1, 2, 4]
+    assert seen == result.runs
+    assert result.knee in (1, 2, 4)
+    assert result.peak_throughput == max(r.throughput for r in result.runs)
+
+
+def test_parse_mix_rejects_unknown_workloads():
+    assert parse_mix("list_media,get_media=3") == {"list_media": 1.0, "get_media": 3.0}
+    with pytest.raises(ValueError):
+        parse_mix("delete_everything=1")
@@ -0,0 +1,85 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from robopost_client import MetricsRegistry, RobopostAPIError, RobopostClient, RobopostPlanLimitError
+from robopost_client.metrics import endpoint_template
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def respond(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if "/medias/missing" in self.path:
+            self.respond(404, {"detail": "Not found"})
+        else:
+            self.respond(200, {"id": "m1", "name": "a.jpg", "extension": "jpg", "storage_object_id": "so-1"})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.respond(409, {"message": "Plan limit reached", "limit": 10, "current_usage": 10})
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/v1"
+    server.shutdown()
+
+
+def test_endpoint_template_replaces_ids():
+    assert endpoint_template("/medias/upload") == "/medias/upload"
+    assert endpoint_template("/video-tasks/abc123/details") == "/video-tasks/{id}/details"
+    assert endpoint_template("/video-series/") == "/video-series/"
+
+
+def test_prometheus_export(base_url):
+    metrics = MetricsRegistry(buckets=(0.1, 1.0))
+    client = RobopostClient(apikey="secret", base_url=base_url, metrics=metrics)
+
+    client.get_media("m1")
+    client.get_media("m2")
+    with pytest.raises(RobopostAPIError):
+        client.get_media("missing")
+    with pytest.raises(RobopostPlanLimitError):
+        client.generate_video("s1")
+
+    text = client.metrics_text()
+    lines = text.splitlines()
+
+    assert 'robopost_client_requests_total{method="GET",endpoint="/medias/{id}",status="200"} 2' in lines
+    assert 'robopost_client_requests_total{method="GET",endpoint="/medias/{id}",status="404"} 1' in lines
+    assert 'robopost_client_errors_total{method="GET",endpoint="/medias/{id}",exception="RobopostAPIError"} 1' in lines
+    assert ('robopost_client_errors_total{method="POST",endpoint="/video-tasks/{id}/generate",'
+            'exception="RobopostPlanLimitError"} 1') in lines
+    assert 'robopost_client_request_duration_seconds_bucket{method="GET",endpoint="/medias/{id}",le="+Inf"} 3' in lines
+    assert 'robopost_client_request_duration_seconds_count{method="GET",endpoint="/medias/{id}"} 3' in lines
+    assert 'robopost_client_requests_in_flight{method="GET",endpoint="/medias/{id}"} 0' in lines
+    assert any(line.startswith('robopost_client_pool_connections{host="127.0.0.1:') for line in lines)
+    assert "# TYPE robopost_client_request_duration_seconds histogram" in lines
+    assert "secret" not in text
+    assert metrics.request_count(method="GET") == 3
+
+
+def test_in_flight_gauge_counts_running_requests():
+    from robopost_client import RequestInfo
+
+    metrics = MetricsRegistry()
+    info = RequestInfo("GET", "/video-tasks/t1", "http://x/v1/video-tasks/t1")
+    metrics.request_started(info)
+
+    assert 'robopost_client_requests_in_flight{method="GET",endpoint="/video-tasks/{id}"} 1' in metrics.render()
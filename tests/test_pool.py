@@ -0,0 +1,139 @@
+import threading
+import time
+
+import pytest
+
+from robopost_client import (
+    MetricsRegistry,
+    RecordingTransport,
+    RobopostClientPool,
+    StubConfig,
+    StubServer,
+    load_cassette,
+)
+
+
+@pytest.fixture
+def stub():
+    with StubServer(StubConfig(latency=0.002)) as server:
+        server.seed_media(3)
+        yield server
+
+
+def test_tenants_share_one_session(stub):
+    with RobopostClientPool(base_url=stub.base_url, max_concurrency=4) as pool:
+        assert len(pool.call("KEY_A", "list_media")) == 3
+        assert len(pool.call("KEY_B", "list_media")) == 3
+
+        assert pool.client("KEY_A").session is pool.session
+        assert pool.client("KEY_B").session is pool.session
+        assert pool.client("KEY_A").apikey == "KEY_A"
+        assert pool.stats().tenants == 2
+
+
+def test_custom_transport_serves_every_tenant(stub, tmp_path):
+    path = str(tmp_path / "traffic.jsonl")
+    with RobopostClientPool(base_url=stub.base_url, transport=RecordingTransport(path)) as pool:
+        pool.call("KEY_A", "list_media")
+        pool.call("KEY_B", "list_media")
+        assert pool.client("KEY_A").session.get_adapter(stub.base_url) is pool._adapter
+
+    assert len(load_cassette(path)) == 2
+    with pytest.raises(ValueError, match="transport="):
+        RobopostClientPool(session=pool.session)
+
+
+def test_weighted_round_robin_keeps_small_tenants_moving(stub):
+    order = []
+    lock = threading.Lock()
+
+    with RobopostClientPool(base_url=stub.base_url, max_concurrency=1) as pool:
+        pool.add_tenant("NOISY", weight=1)
+        pool.add_tenant("QUIET", weight=2)
+
+        def record(name):
+            def done(_):
+                with lock:
+                    order.append(name)
+            return done
+
+        futures = []
+        for _ in range(30):
+            futures.append(pool.submit("NOISY", "list_media"))
+            futures[-1].add_done_callback(record("NOISY"))
+        for _ in range(6):
+            futures.append(pool.submit("QUIET", "list_media"))
+            futures[-1].add_done_callback(record("QUIET"))
+        for future in futures:
+            future.result()
+
+    # QUIET gets two of every three slots once it has queued work, instead of
+    # waiting behind NOISY's whole backlog
+    last_quiet = max(i for i, name in enumerate(order) if name == "QUIET")
+    assert last_quiet < 20
+    assert pool.tenant_stats("NOISY").completed == 30
+
+
+def test_per_tenant_rate_limit(stub):
+    with RobopostClientPool(base_url=stub.base_url, max_concurrency=8) as pool:
+        pool.add_tenant("SLOW", rate=20, burst=1)
+
+        start = time.monotonic()
+        futures = [pool.submit("SLOW", "list_media") for _ in range(6)]
+        fast = [pool.submit("FAST", "list_media") for _ in range(6)]
+        for future in fast:
+            future.result()
+        fast_elapsed = time.monotonic() - start
+        for future in futures:
+            future.result()
+        slow_elapsed = time.monotonic() - start
+
+    # One call right away, then one every 50ms
+    assert slow_elapsed >= 0.2
+    assert fast_elapsed < slow_elapsed
+
+
+def test_errors_are_returned_through_the_future(stub):
+    with RobopostClientPool(base_url=stub.base_url) as pool:
+        stub.fail_next(500, {"detail": "boom"})
+        future = pool.submit("KEY_A", "list_media")
+        with pytest.raises(Exception):
+            future.result()
+        assert pool.tenant_stats("KEY_A").failed == 1
+
+        with pytest.raises(AttributeError):
+            pool.submit("KEY_A", "_make_request")
+
+
+def test_idle_tenants_are_released(stub):
+    with RobopostClientPool(base_url=stub.base_url, idle_timeout=0.05) as pool:
+        pool.add_tenant("PINNED")
+        pool.call("PINNED", "list_media")
+        pool.call("ONE_OFF", "list_media")
+        assert pool.stats().active_clients == 2
+
+        time.sleep(0.1)
+        assert pool.evict_idle() == 2
+
+        stats = pool.stats()
+        assert stats.active_clients == 0
+        # Tenants added explicitly keep their settings; auto-registered ones are dropped
+        assert stats.tenants == 1
+        assert pool.tenant_stats("ONE_OFF") is None
+        assert len(pool.call("PINNED", "list_media")) == 3
+
+
+def test_shared_metrics_registry(stub):
+    metrics = MetricsRegistry()
+    with RobopostClientPool(base_url=stub.base_url, metrics=metrics) as pool:
+        pool.call("KEY_A", "list_media")
+        pool.call("KEY_B", "list_media")
+        assert metrics.request_count(method="GET") == 2
+        assert "robopost_client_pool_maxsize" in metrics.render()
+
+
+def test_closed_pool_rejects_calls(stub):
+    pool = RobopostClientPool(base_url=stub.base_url)
+    pool.close()
+    with pytest.raises(RuntimeError):
+        pool.submit("KEY_A", "list_media")
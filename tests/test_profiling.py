@@ -0,0 +1,122 @@
+import json
+import os
+import time
+
+import pytest
+
+from robopost_client import (
+    HedgingPolicy,
+    Profiler,
+    PublicAPIScheduledPostCreateHTTPPayload,
+    RobopostClient,
+    StubConfig,
+    StubServer,
+)
+
+
+@pytest.fixture
+def stub():
+    with StubServer(StubConfig()) as server:
+        server.seed_media(20)
+        yield server
+
+
+def test_sampled_calls_are_timed_per_method_and_phase(stub):
+    profiler = Profiler(sample_rate=1.0)
+    client = RobopostClient(apikey="test", base_url=stub.base_url, profiler=profiler)
+    for _ in range(3):
+        client.list_media()
+    client.create_scheduled_posts(PublicAPIScheduledPostCreateHTTPPayload(text="hi", channel_ids=["c1"]))
+
+    report = client.profile_report()
+    media, posts = report["list_media"], report["create_scheduled_posts"]
+    assert (media.calls, media.sampled, posts.calls) == (3, 3, 1)
+    assert 0 < media.cpu_mean and 0 < media.wall_mean <= media.wall_max
+    assert media.phases["ttfb"] > 0 and media.phases["validate"] > 0
+    assert posts.phases["encode"] > 0
+    assert media.top_allocations == []
+
+
+def test_hedged_requests_report_their_network_phases(stub):
+    profiler = Profiler(sample_rate=1.0)
+    client = RobopostClient(apikey="test", base_url=stub.base_url, profiler=profiler, hedging=HedgingPolicy())
+    client.list_media()
+
+    media = client.profile_report()["list_media"]
+    assert media.phases["ttfb"] > 0 and media.phases["transfer"] > 0
+
+
+def test_unsampled_calls_are_only_counted(stub):
+    profiler = Profiler(sample_rate=0.0)
+    client = RobopostClient(apikey="test", base_url=stub.base_url, profiler=profiler)
+    client.list_media()
+    client.list_media()
+
+    media = client.profile_report()["list_media"]
+    assert (media.calls, media.sampled, media.wall_mean) == (2, 0, 0.0)
+
+    profiler.reset()
+    assert client.profile_report() == {}
+
+
+def test_profiling_is_enabled_from_the_environment(stub, monkeypatch):
+    assert RobopostClient(apikey="test", base_url=stub.base_url).profile_report() is None
+
+    monkeypatch.setenv("ROBOPOST_PROFILE", "1")
+    monkeypatch.setenv("ROBOPOST_PROFILE_ALLOCATIONS", "1")
+    client = RobopostClient(apikey="test", base_url=stub.base_url)
+    assert (client.profiler.sample_rate, client.profiler.trace_allocations) == (1.0, True)
+
+    monkeypatch.setenv("ROBOPOST_PROFILE", "on")
+    assert Profiler.from_env().sample_rate == 0.01
+    monkeypatch.setenv("ROBOPOST_PROFILE", "often")
+    assert Profiler.from_env() is None
+
+
+def test_allocations_of_model_construction_are_traced(stub):
+    profiler = Profiler(sample_rate=1.0, trace_allocations=True, allocation_rate=1.0)
+    client = RobopostClient(apikey="test", base_url=stub.base_url, profiler=profiler)
+    client.list_media()
+
+    media = client.profile_report()["list_media"]
+    assert media.allocation_samples == 1
+    assert media.allocated_mean > 0
+    assert media.top_allocations[0].size > 0
+
+
+def test_report_is_dumped_as_text_or_json(stub, tmp_path, capsys):
+    profiler = Profiler(sample_rate=1.0)
+    client = RobopostClient(apikey="test", base_url=stub.base_url, profiler=profiler)
+    client.list_media()
+
+    profiler.dump()
+    assert "list_media" in capsys.readouterr().err
+
+    profiler.dump(str(tmp_path / "profile.json"))
+    report = json.loads((tmp_path / "profile.json").read_text())
+    assert report["list_media"]["calls"] == 1
+    assert set(report["list_media"]["phases"]) == {"encode", "connect", "ttfb", "transfer", "decode", "validate"}
+
+    profiler.dump(str(tmp_path / "profile.txt"))
+    assert (tmp_path / "profile.txt").read_text() == profiler.format_report()
+
+
+def test_signal_arriving_while_the_lock_is_held_does_not_deadlock(tmp_path):
+    signal = pytest.importorskip("signal")
+    if not hasattr(signal, "SIGUSR2"):
+        pytest.skip("SIGUSR2 is not available")
+    path = tmp_path / "profile.txt"
+    profiler = Profiler(sample_rate=1.0)
+    previous = signal.getsignal(signal.SIGUSR2)
+    profiler.dump_on_signal(path=str(path))
+    try:
+        with profiler._lock:
+            os.kill(os.getpid(), signal.SIGUSR2)
+            time.sleep(0.1)
+            assert not path.exists()
+        deadline = time.monotonic() + 5
+        while not (path.exists() and path.read_text()) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert "Robopost client profile" in path.read_text()
+    finally:
+        signal.signal(signal.SIGUSR2, previous)
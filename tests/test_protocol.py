@@ -0,0 +1,156 @@
+import asyncio
+import inspect
+import json
+
+import pytest
+import requests
+
+from robopost_client import (
+    AsyncRobopostClient,
+    AsyncTransport,
+    PublicAPIGeneratedFacelessVideoSeriesCreate,
+    PublicAPIMediaRead,
+    PublicAPIScheduledPostCreateHTTPPayload,
+    RobopostAPIError,
+    RobopostClient,
+    RobopostPlanLimitError,
+    StubConfig,
+    StubServer,
+    protocol,
+)
+
+
+def test_specs_describe_requests_without_io():
+    spec = protocol.list_video_series(search_text="facts", limit=5)
+    params = spec.params
+
+    assert (spec.method, spec.url("https://api.test/v1")) == ("GET", "https://api.test/v1/video-series/")
+    assert spec.query("KEY") == dict(params, apikey="KEY")
+    assert "apikey" not in spec.params
+
+    post = protocol.create_scheduled_posts(PublicAPIScheduledPostCreateHTTPPayload(text="hi", channel_ids=["c1"]))
+    assert post.headers == {"Content-Type": "application/json"}
+    assert json.loads(post.body())["text"] == "hi"
+
+
+def test_parse_response_maps_results_and_errors():
+    spec = protocol.list_media()
+    items = [{"id": "m1", "name": "a.jpg", "extension": "jpg", "storage_object_id": "s1"}]
+
+    assert protocol.parse_response(spec, 200, json.dumps(items).encode()) == [PublicAPIMediaRead(**items[0])]
+
+    with pytest.raises(RobopostPlanLimitError) as plan:
+        protocol.parse_response(spec, 409, b'{"message": "Plan limit reached", "limit": 5, "current_usage": 5}')
+    assert (plan.value.limit, plan.value.current_usage) == (5, 5)
+
+    with pytest.raises(RobopostAPIError) as error:
+        protocol.parse_response(spec, 422, b'{"detail": "bad skip"}')
+    assert (error.value.status_code, error.value.message) == (422, "bad skip")
+
+    with pytest.raises(RobopostAPIError) as text_error:
+        protocol.parse_response(spec, 502, b"Bad Gateway")
+    assert text_error.value.message == "Bad Gateway"
+
+
+def test_empty_success_body_is_only_accepted_for_raw_results():
+    assert protocol.parse_response(protocol.delete_media("m1"), 204, b"") is None
+
+    with pytest.raises(RobopostAPIError) as error:
+        protocol.parse_response(protocol.get_media("m1"), 200, b"")
+    assert error.value.status_code == 200
+
+
+def test_sync_and_async_clients_map_text_errors_alike():
+    class GatewayAdapter(requests.adapters.BaseAdapter):
+        def send(self, request, **kwargs):
+            response = requests.Response()
+            response.status_code, response._content = 502, b"Bad Gateway"
+            response.request, response.url = request, request.url
+            return response
+
+        def close(self):
+            pass
+
+    class GatewayTransport(AsyncTransport):
+        async def send(self, method, url, params, headers, body):
+            return 502, b"Bad Gateway"
+
+    session = requests.Session()
+    session.mount("https://", GatewayAdapter())
+    client = RobopostClient(apikey="KEY", base_url="https://api.test/v1", session=session)
+    aclient = AsyncRobopostClient(apikey="KEY", base_url="https://api.test/v1", transport=GatewayTransport())
+
+    with pytest.raises(RobopostAPIError) as sync_error:
+        client.get_media("m1")
+    with pytest.raises(RobopostAPIError) as async_error:
+        asyncio.run(aclient.get_media("m1"))
+
+    assert (sync_error.value.status_code, sync_error.value.message) == (502, "Bad Gateway")
+    assert (async_error.value.status_code, async_error.value.message) == (502, "Bad Gateway")
+
+
+def test_async_methods_mirror_the_sync_signatures():
+    for name in protocol.ENDPOINTS:
+        method = getattr(AsyncRobopostClient, name)
+        assert inspect.iscoroutinefunction(method) and method.__doc__
+        assert inspect.signature(method) == inspect.signature(getattr(RobopostClient, name)), name
+
+
+def test_upload_spec_encodes_multipart():
+    spec = protocol.upload_media("clip.mp4", b"\x00\x01")
+    boundary = spec.headers["Content-Type"].split("boundary=")[1]
+    body = bytes(spec.body())
+
+    assert body.startswith(f"--{boundary}\r\n".encode())
+    assert b'filename="clip.mp4"' in body
+    assert body.endswith(f"\x00\x01\r\n--{boundary}--\r\n".encode())
+
+
+def test_async_client_against_stub(tmp_path):
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(b"\xff" * 100)
+
+    async def scenario(base_url):
+        async with AsyncRobopostClient(apikey="test", base_url=base_url) as client:
+            media = await client.upload_media(str(path))
+            series = await client.create_video_series(PublicAPIGeneratedFacelessVideoSeriesCreate(name="Facts"))
+            listed, fetched = await asyncio.gather(client.list_media(limit=10), client.get_video_series(series.id))
+            task = await client.generate_video(series.id)
+            done = await client.wait_for_video_completion(task.task_id, poll_interval=0, timeout=5)
+            return media, listed, fetched, series, done
+
+    with StubServer(StubConfig(apikey="test", polls_to_complete=2)) as stub:
+        media, listed, fetched, series, done = asyncio.run(scenario(stub.base_url))
+
+    assert media.name == "photo.jpg"
+    assert listed == [media]
+    assert fetched == series
+    assert done.status == "COMPLETE"
+
+
+def test_custom_async_transport_gets_prepared_requests():
+    class FakeTransport(AsyncTransport):
+        def __init__(self):
+            self.sent = []
+
+        async def send(self, method, url, params, headers, body):
+            self.sent.append((method, url, params))
+            return 404, b'{"detail": "Video series not found"}'
+
+    transport = FakeTransport()
+    client = AsyncRobopostClient(apikey="KEY", base_url="https://api.test/v1", transport=transport)
+
+    with pytest.raises(RobopostAPIError) as error:
+        asyncio.run(client.get_video_series("s1"))
+
+    assert error.value.status_code == 404
+    assert transport.sent == [("GET", "https://api.test/v1/video-series/s1", {"apikey": "KEY"})]
+
+
+def test_async_transport_without_send_cannot_be_created():
+    class IncompleteTransport(AsyncTransport):
+        async def aclose(self):
+            pass
+
+    with pytest.raises(TypeError):
+        IncompleteTransport()
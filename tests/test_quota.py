@@ -0,0 +1,190 @@
+import threading
+import time
+
+import pytest
+
+from robopost_client import (
+    MetricsRegistry,
+    PublicAPIGeneratedFacelessVideoSeriesCreate,
+    QuotaTracker,
+    RobopostClient,
+    RobopostPlanLimitError,
+    RobopostQuotaExhaustedError,
+    StubConfig,
+    StubServer,
+)
+
+SERIES = PublicAPIGeneratedFacelessVideoSeriesCreate(name="Facts")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def stub():
+    with StubServer(StubConfig(series_limit=2)) as server:
+        yield server
+
+
+def test_limit_is_learned_and_enforced_locally(stub):
+    tracker = QuotaTracker()
+    client = RobopostClient(apikey="test", base_url=stub.base_url, quota=tracker)
+    first = client.create_video_series(SERIES)
+    client.create_video_series(SERIES)
+    assert client.quota_stats()["video_series"].remaining is None
+
+    with pytest.raises(RobopostPlanLimitError) as from_server:
+        client.create_video_series(SERIES)
+    assert not isinstance(from_server.value, RobopostQuotaExhaustedError)
+
+    with pytest.raises(RobopostQuotaExhaustedError) as local:
+        client.create_video_series(SERIES)
+    assert (local.value.limit, local.value.current_usage, local.value.group) == (2, 2, "video_series")
+    assert local.value.retry_after > 0
+    assert stub.request_count("POST /video-series/") == 3
+
+    stats = client.quota_stats()["video_series"]
+    assert (stats.limit, stats.usage, stats.remaining, stats.exhausted) == (2, 2, 0, True)
+    assert stats.rejected_locally == 1
+
+    # Deleting a series frees quota, and the usage estimate follows creates again
+    client.delete_video_series(first.id)
+    assert tracker.remaining("test", "video_series") == 1
+    client.create_video_series(SERIES)
+    assert tracker.remaining("test", "video_series") == 0
+    with pytest.raises(RobopostQuotaExhaustedError):
+        client.create_video_series(SERIES)
+    assert stub.request_count("POST /video-series/") == 4
+
+
+def test_local_rejections_reach_the_error_counters(stub):
+    metrics = MetricsRegistry()
+    client = RobopostClient(apikey="test", base_url=stub.base_url, quota=QuotaTracker(), metrics=metrics)
+    stub.seed_video_series(2)
+    with pytest.raises(RobopostPlanLimitError):
+        client.create_video_series(SERIES)
+    with pytest.raises(RobopostQuotaExhaustedError):
+        client.create_video_series(SERIES)
+
+    lines = client.metrics_text().splitlines()
+    assert ('robopost_client_errors_total{method="POST",endpoint="/video-series/",'
+            'exception="RobopostPlanLimitError"} 1') in lines
+    assert ('robopost_client_errors_total{method="POST",endpoint="/video-series/",'
+            'exception="RobopostQuotaExhaustedError"} 1') in lines
+    assert 'robopost_client_requests_in_flight{method="POST",endpoint="/video-series/"} 0' in lines
+    assert stub.request_count("POST /video-series/") == 1
+
+
+def test_other_groups_and_keys_are_unaffected(stub):
+    tracker = QuotaTracker()
+    client = RobopostClient(apikey="test", base_url=stub.base_url, quota=tracker)
+    stub.seed_video_series(2)
+    with pytest.raises(RobopostPlanLimitError):
+        client.create_video_series(SERIES)
+
+    series_id = next(iter(stub.video_series))
+    assert client.generate_video(series_id).status == "IN_PROGRESS"
+
+    other = RobopostClient(apikey="other", base_url=stub.base_url, quota=tracker)
+    with pytest.raises(RobopostPlanLimitError) as error:
+        other.create_video_series(SERIES)
+    assert not isinstance(error.value, RobopostQuotaExhaustedError)
+    assert tracker.stats("other")["video_series"].limit == 2
+
+
+def test_server_is_probed_after_the_pause(stub):
+    clock = FakeClock()
+    client = RobopostClient(apikey="test", base_url=stub.base_url, quota=QuotaTracker(pause=60, clock=clock))
+    stub.seed_video_series(2)
+    with pytest.raises(RobopostPlanLimitError):
+        client.create_video_series(SERIES)
+    with pytest.raises(RobopostQuotaExhaustedError):
+        client.create_video_series(SERIES)
+
+    # The plan was upgraded in the meantime
+    stub.config.series_limit = 10
+    clock.now += 61
+    client.create_video_series(SERIES)
+    assert stub.request_count("POST /video-series/") == 2
+
+
+def test_wait_mode_pauses_instead_of_raising(stub):
+    client = RobopostClient(apikey="test", base_url=stub.base_url, quota=QuotaTracker(pause=0.2, wait=True))
+    stub.seed_video_series(2)
+    with pytest.raises(RobopostPlanLimitError):
+        client.create_video_series(SERIES)
+
+    stub.config.series_limit = 10
+    start = time.monotonic()
+    client.create_video_series(SERIES)
+    assert time.monotonic() - start >= 0.15
+
+
+def test_learned_limits_expire():
+    clock = FakeClock()
+    tracker = QuotaTracker(ttl=100, clock=clock)
+    tracker.record_limit("key", "scheduled_posts", RobopostPlanLimitError("Plan limit", limit=50, current_usage=50))
+    assert tracker.remaining("key", "scheduled_posts") == 0
+
+    clock.now += 101
+    assert tracker.remaining("key", "scheduled_posts") is None
+    tracker.check("key", "scheduled_posts")
+
+
+def test_only_one_call_probes_after_the_pause():
+    clock = FakeClock()
+    tracker = QuotaTracker(pause=60, clock=clock)
+    tracker.record_limit("key", "video_series", RobopostPlanLimitError("Plan limit", limit=2, current_usage=2))
+    clock.now += 61
+
+    tracker.check("key", "video_series")
+    with pytest.raises(RobopostQuotaExhaustedError) as held_back:
+        tracker.check("key", "video_series")
+    assert held_back.value.retry_after == 0.0
+
+    # A probe failing for another reason hands the probe to the next caller
+    tracker.record_error("key", "video_series")
+    tracker.check("key", "video_series")
+    with pytest.raises(RobopostQuotaExhaustedError):
+        tracker.check("key", "video_series")
+
+    # A successful probe lets everyone through, and the stale usage is dropped
+    tracker.record_success("key", "video_series", object())
+    tracker.check("key", "video_series")
+    tracker.check("key", "video_series")
+    assert tracker.remaining("key", "video_series") is None
+
+
+def test_waiting_calls_resume_once_the_probe_returns():
+    clock = FakeClock()
+    tracker = QuotaTracker(pause=60, wait=True, clock=clock)
+    tracker.record_limit("key", "video_series", RobopostPlanLimitError("Plan limit", limit=2, current_usage=2))
+    clock.now += 61
+    tracker.check("key", "video_series")
+
+    admitted = threading.Event()
+    waiter = threading.Thread(target=lambda: (tracker.check("key", "video_series"), admitted.set()))
+    waiter.start()
+    assert not admitted.wait(0.2)
+    tracker.record_success("key", "video_series", object())
+    assert admitted.wait(5)
+    waiter.join()
+
+
+def test_release_keeps_the_group_paused_while_still_over_the_limit():
+    clock = FakeClock()
+    tracker = QuotaTracker(pause=60, clock=clock)
+    tracker.record_limit("key", "video_series", RobopostPlanLimitError("Plan limit", limit=2, current_usage=3))
+
+    tracker.record_release("key", "video_series")
+    with pytest.raises(RobopostQuotaExhaustedError):
+        tracker.check("key", "video_series")
+
+    tracker.record_release("key", "video_series")
+    tracker.check("key", "video_series")
+    assert tracker.remaining("key", "video_series") == 1
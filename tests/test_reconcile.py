@@ -0,0 +1,125 @@
+import uuid
+from datetime import datetime, timezone
+
+from robopost_client import (
+    AIVoice,
+    PublicAPIGeneratedFacelessVideoSeriesCreate,
+    PublicAPIGeneratedFacelessVideoSeriesRead,
+    RobopostAPIError,
+    VideoColor,
+    VideoSeriesReconciler,
+)
+
+
+def make_read(config: PublicAPIGeneratedFacelessVideoSeriesCreate, **overrides) -> PublicAPIGeneratedFacelessVideoSeriesRead:
+    now = datetime.now(timezone.utc)
+    data = config.model_dump()
+    data.update(
+        id=str(uuid.uuid4()),
+        automation_id=None,
+        is_deleted=False,
+        created_at=now,
+        updated_at=now,
+    )
+    data.update(overrides)
+    return PublicAPIGeneratedFacelessVideoSeriesRead(**data)
+
+
+class FakeSeriesClient:
+    """In-memory stand-in for the video series methods of RobopostClient"""
+
+    def __init__(self, series=None, fail_on=()):
+        self.series = {s.id: s for s in series or []}
+        self.fail_on = set(fail_on)
+        self.calls = []
+
+    def list_video_series(self, skip=0, limit=10, sort_order="desc", **kwargs):
+        return list(self.series.values())[skip:skip + limit]
+
+    def create_video_series(self, payload):
+        self.calls.append(("create", payload.name))
+        if payload.name in self.fail_on:
+            raise RobopostAPIError("boom", status_code=500)
+        read = make_read(payload)
+        self.series[read.id] = read
+        return read
+
+    def update_video_series(self, series_id, payload):
+        self.calls.append(("update", series_id, sorted(payload.model_fields_set)))
+        if series_id in self.fail_on:
+            raise RobopostAPIError("boom", status_code=500)
+        current = self.series[series_id]
+        read = current.model_copy(update=payload.model_dump(exclude_unset=True))
+        self.series[series_id] = read
+        return read
+
+    def delete_video_series(self, series_id):
+        self.calls.append(("delete", series_id))
+        del self.series[series_id]
+        return {"message": "deleted"}
+
+
+def test_plan_computes_minimal_diffs():
+    unchanged = PublicAPIGeneratedFacelessVideoSeriesCreate(name="Unchanged")
+    changed = PublicAPIGeneratedFacelessVideoSeriesCreate(name="Changed", voice=AIVoice.BILL.value)
+    new = PublicAPIGeneratedFacelessVideoSeriesCreate(name="New")
+
+    live_changed = make_read(changed, voice=AIVoice.ALICE.value, font_color=VideoColor.WHITE)
+    live = [make_read(unchanged), live_changed, make_read(PublicAPIGeneratedFacelessVideoSeriesCreate(name="Extra"))]
+
+    client = FakeSeriesClient(live)
+    plan = VideoSeriesReconciler(client).plan([unchanged, changed, new])
+
+    assert [s.name for s in plan.creates] == ["New"]
+    assert [s.name for s in plan.unchanged] == ["Unchanged"]
+    assert len(plan.updates) == 1
+    assert plan.updates[0].series_id == live_changed.id
+    # font_color is not declared in the config, so its live value is kept
+    assert plan.updates[0].changed_fields == ["voice"]
+    # Without prune, unmatched live series are left alone
+    assert plan.deletes == []
+    assert client.calls == []
+
+
+def test_apply_runs_operations_and_skips_noops():
+    keep = PublicAPIGeneratedFacelessVideoSeriesCreate(name="Keep")
+    client = FakeSeriesClient([
+        make_read(keep),
+        make_read(PublicAPIGeneratedFacelessVideoSeriesCreate(name="Stale")),
+    ])
+    reconciler = VideoSeriesReconciler(client, prune=True, concurrency=4, page_size=1)
+
+    result = reconciler.sync([keep, PublicAPIGeneratedFacelessVideoSeriesCreate(name="Fresh")])
+
+    assert result.ok
+    assert [s.name for s in result.created] == ["Fresh"]
+    assert len(result.deleted) == 1
+    assert not any(call[0] == "update" for call in client.calls)
+    assert reconciler.plan([keep, PublicAPIGeneratedFacelessVideoSeriesCreate(name="Fresh")]).is_empty
+
+
+def test_apply_collects_errors():
+    desired = PublicAPIGeneratedFacelessVideoSeriesCreate(name="Broken", max_duration=30)
+    live = make_read(desired, max_duration=60)
+    client = FakeSeriesClient([live], fail_on={live.id})
+    reconciler = VideoSeriesReconciler(client)
+
+    result = reconciler.apply(reconciler.plan([desired]))
+
+    assert not result.ok
+    assert result.errors == [("update", "Broken", "boom")]
+
+
+def test_prune_deletes_run_after_creates_succeed():
+    keep = PublicAPIGeneratedFacelessVideoSeriesCreate(name="Keep")
+    stale = make_read(PublicAPIGeneratedFacelessVideoSeriesCreate(name="Stale"))
+    client = FakeSeriesClient([make_read(keep), stale])
+    fresh = PublicAPIGeneratedFacelessVideoSeriesCreate(name="Fresh")
+    assert VideoSeriesReconciler(client, prune=True).sync([keep, fresh]).ok
+    assert [call[0] for call in client.calls] == ["create", "delete"]
+
+    client = FakeSeriesClient([make_read(keep), stale], fail_on={"Broken"})
+    broken = PublicAPIGeneratedFacelessVideoSeriesCreate(name="Broken")
+    result = VideoSeriesReconciler(client, prune=True).sync([keep, broken])
+    assert result.errors == [("create", "Broken", "boom"), ("delete", "Stale", "skipped: a create failed")]
+    assert stale.id in client.series
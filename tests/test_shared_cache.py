@@ -0,0 +1,109 @@
+import multiprocessing
+import time
+
+import pytest
+
+from robopost_client import CacheConfig, RobopostClient, SharedCache, StubConfig, StubServer
+
+CACHE = {"video_series": CacheConfig(ttl=60), "media": CacheConfig(ttl=60)}
+
+
+@pytest.fixture
+def stub():
+    with StubServer(StubConfig()) as server:
+        server.seed_media(3)
+        server.seed_video_series(3)
+        yield server
+
+
+def fetch_in_child(path, base_url, series_id, results):
+    client = RobopostClient(apikey="test", base_url=base_url, cache=CACHE, shared_cache=SharedCache(path))
+    results.put(client.get_video_series(series_id).model_dump_json())
+
+
+def test_entries_are_shared_between_clients_and_processes(stub, tmp_path):
+    path = str(tmp_path / "shared.db")
+    series_id = next(iter(stub.video_series))
+    media_id = next(iter(stub.media))
+
+    first = RobopostClient(apikey="test", base_url=stub.base_url, cache=CACHE, shared_cache=SharedCache(path))
+    series = first.get_video_series(series_id)
+    media = first.get_media(media_id)
+
+    second = RobopostClient(apikey="test", base_url=stub.base_url, cache=CACHE, shared_cache=SharedCache(path))
+    assert second.get_video_series(series_id) == series
+    assert second.get_media(media_id) == media
+
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    child = context.Process(target=fetch_in_child, args=(path, stub.base_url, series_id, results))
+    child.start()
+    from_child = results.get(timeout=30)
+    child.join(timeout=30)
+
+    assert from_child == series.model_dump_json()
+    assert stub.request_count("GET /video-series/{id}") == 1
+    assert stub.request_count("GET /medias/{id}") == 1
+    assert second.cache_stats()["video_series"].hits == 1
+    assert second.cache_stats()["video_series"].size == 1
+
+
+def test_invalidation_reaches_other_processes(stub, tmp_path):
+    path = str(tmp_path / "shared.db")
+    series_id = next(iter(stub.video_series))
+    writer = RobopostClient(apikey="test", base_url=stub.base_url, cache=CACHE, shared_cache=SharedCache(path))
+    reader = RobopostClient(apikey="test", base_url=stub.base_url, cache=CACHE, shared_cache=SharedCache(path))
+
+    reader.get_video_series(series_id)
+    writer.delete_video_series(series_id)
+
+    assert reader.cache_stats()["video_series"].size == 0
+
+
+def test_entries_are_scoped_to_the_api_key(stub, tmp_path):
+    cache = SharedCache(str(tmp_path / "shared.db"))
+    series_id = next(iter(stub.video_series))
+    RobopostClient(apikey="one", base_url=stub.base_url, cache=CACHE, shared_cache=cache).get_video_series(series_id)
+    RobopostClient(apikey="two", base_url=stub.base_url, cache=CACHE, shared_cache=cache).get_video_series(series_id)
+
+    assert stub.request_count("GET /video-series/{id}") == 2
+
+
+def test_ttl_and_eviction(stub, tmp_path):
+    cache = SharedCache(str(tmp_path / "shared.db"))
+    config = {"media": CacheConfig(ttl=0.2, maxsize=2)}
+    client = RobopostClient(apikey="test", base_url=stub.base_url, cache=config, shared_cache=cache)
+    media_ids = list(stub.media)
+
+    for media_id in media_ids:
+        client.get_media(media_id)
+    stats = client.cache_stats()["media"]
+    assert (stats.size, stats.evictions) == (2, 1)
+
+    time.sleep(0.25)
+    client.get_media(media_ids[-1])
+    assert stub.request_count("GET /medias/{id}") == 4
+
+
+def test_invalidation_during_a_load_is_not_undone(tmp_path):
+    cache = SharedCache(str(tmp_path / "shared.db"))
+    view = cache.view("settings", scope="test")
+    # Another process opening the same file sees the same namespace
+    other = SharedCache(str(tmp_path / "shared.db")).view("settings", scope="test")
+
+    def load_then_delete():
+        other.delete("k")
+        return {"old": 1}
+
+    assert view.get_or_load("k", load_then_delete) == {"old": 1}
+    assert view.get("k") is None
+
+    def load_then_clear():
+        other.clear()
+        return {"old": 2}
+
+    view.get_or_load("k", load_then_clear)
+    assert view.get("k") is None
+
+    assert view.get_or_load("k", lambda: {"new": 3}) == {"new": 3}
+    assert other.get("k") == {"new": 3}
@@ -0,0 +1,68 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from robopost_client import RobopostAPIError, RobopostClient, SingleFlight
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+def wait_for_calls(group: SingleFlight, calls: int, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while group.stats().calls < calls and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_concurrent_identical_gets_share_one_request():
+    client = RobopostClient(apikey="test", coalesce_gets=True)
+    requests_made = []
+
+    def fake_request(method, endpoint, **kwargs):
+        requests_made.append(endpoint)
+        wait_for_calls(client._singleflight, 8)
+        return FakeResponse({
+            "task_id": "t1",
+            "video_series_id": "s1",
+            "status": "IN_PROGRESS",
+            "created_at": "2025-01-01T00:00:00Z",
+        })
+
+    client._make_request = fake_request
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: client.get_video_task("t1"), range(8)))
+
+    assert requests_made == ["/video-tasks/t1"]
+    assert all(result is results[0] for result in results)
+
+    stats = client.coalescing_stats()
+    assert (stats.calls, stats.executions, stats.coalesced, stats.in_flight) == (8, 1, 7, 0)
+
+
+def test_waiters_receive_the_leaders_exception():
+    group = SingleFlight()
+    started = threading.Event()
+
+    def failing():
+        started.set()
+        wait_for_calls(group, 2)
+        raise RobopostAPIError("not found", status_code=404)
+
+    leader = ThreadPoolExecutor(max_workers=1).submit(group.do, "key", failing)
+    started.wait()
+
+    with pytest.raises(RobopostAPIError):
+        group.do("key", lambda: "unused")
+    with pytest.raises(RobopostAPIError):
+        leader.result()
+
+    # Once the call has finished, the next call runs again
+    assert group.do("key", lambda: "fresh") == "fresh"
@@ -0,0 +1,74 @@
+import pytest
+
+from robopost_client import (
+    PublicAPIGeneratedFacelessVideoSeriesCreate,
+    PublicAPIGeneratedFacelessVideoSeriesUpdate,
+    PublicAPIScheduledPostCreateHTTPPayload,
+    RobopostAPIError,
+    RobopostClient,
+    RobopostPlanLimitError,
+    StubConfig,
+    StubServer,
+)
+
+
+@pytest.fixture
+def stub():
+    with StubServer(StubConfig(polls_to_complete=2, seed=1)) as server:
+        yield server
+
+
+@pytest.fixture
+def client(stub):
+    return RobopostClient(apikey="test", base_url=stub.base_url)
+
+
+def test_media_and_posts_round_trip(stub, client, tmp_path):
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(b"\xff" * 1000)
+
+    media = client.upload_media(str(path))
+    stub.seed_media(4)
+    posts = client.create_scheduled_posts(PublicAPIScheduledPostCreateHTTPPayload(
+        text="hello", channel_ids=["c1"], image_object_ids=[media.storage_object_id]
+    ))
+
+    assert media.name == "photo.jpg"
+    assert client.get_media(media.id) == media
+    assert [m.id for m in client.list_media(skip=0, limit=3)] == [m.id for m in client.list_media(limit=5)][:3]
+    assert posts[0].image_object_ids == [media.storage_object_id]
+    assert stub.request_count("POST /medias/upload") == 1
+
+
+def test_video_series_and_task_lifecycle(stub, client):
+    series = client.create_video_series(PublicAPIGeneratedFacelessVideoSeriesCreate(name="Facts"))
+    updated = client.update_video_series(series.id, PublicAPIGeneratedFacelessVideoSeriesUpdate(max_duration=90))
+    task = client.generate_video(series.id)
+    done = client.wait_for_video_completion(task.task_id, poll_interval=0, timeout=5)
+
+    assert updated.max_duration == 90
+    assert done.status == "COMPLETE"
+    assert stub.request_count("GET /video-tasks/{id}") == 2
+    assert [t.task_id for t in client.list_video_tasks(series_id=series.id)] == [task.task_id]
+
+
+def test_errors_throttling_and_plan_limits(stub, client):
+    stub.fail_next(503, {"detail": "maintenance"}, path="/medias")
+    with pytest.raises(RobopostAPIError) as excinfo:
+        client.list_media()
+    assert excinfo.value.status_code == 503
+
+    stub.config.series_limit = 0
+    with pytest.raises(RobopostPlanLimitError):
+        client.create_video_series(PublicAPIGeneratedFacelessVideoSeriesCreate(name="Over the limit"))
+
+    stub.config.throttle_rps = 1
+    stub.config.throttle_burst = 2
+    statuses = []
+    for _ in range(4):
+        try:
+            client.list_media()
+            statuses.append(200)
+        except RobopostAPIError as e:
+            statuses.append(e.status_code)
+    assert 429 in statuses
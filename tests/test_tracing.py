@@ -0,0 +1,108 @@
+import json
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from robopost_client import RobopostClient, tracing
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    polls = 0
+
+    def do_GET(self):
+        Handler.polls += 1
+        status = "COMPLETE" if Handler.polls >= 3 else "PROCESSING"
+        body = json.dumps({
+            "task_id": "t1", "video_series_id": "s1", "status": status, "created_at": "2024-01-01T00:00:00",
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeSpan:
+    def __init__(self, name, parent, attributes):
+        self.name = name
+        self.parent = parent
+        self.attributes = dict(attributes)
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def is_recording(self):
+        return True
+
+
+class FakeTracer:
+    def __init__(self):
+        self.spans = []
+        self._local = threading.local()
+
+    @contextmanager
+    def start_as_current_span(self, name, attributes=None, context=None):
+        parent = getattr(self._local, "current", None)
+        current = FakeSpan(name, parent, attributes or {})
+        self.spans.append(current)
+        self._local.current = current
+        try:
+            yield current
+        finally:
+            self._local.current = parent
+
+
+@pytest.fixture
+def tracer():
+    fake = FakeTracer()
+    tracing.set_tracer(fake)
+    yield fake
+    tracing.set_tracer(None)
+
+
+@pytest.fixture
+def base_url():
+    Handler.polls = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/v1"
+    server.shutdown()
+
+
+def test_spans_for_methods_attempts_and_poll_iterations(tracer, base_url):
+    client = RobopostClient(apikey="secret", base_url=base_url)
+
+    task = client.wait_for_video_completion("t1", poll_interval=0, timeout=10)
+
+    assert task.status == "COMPLETE"
+    root = tracer.spans[0]
+    assert root.name == "robopost.wait_for_video_completion"
+    assert root.attributes["robopost.task_id"] == "t1"
+    assert root.attributes["robopost.status"] == "COMPLETE"
+
+    polls = [s for s in tracer.spans if s.name == "robopost.wait_for_video_completion.poll"]
+    assert [p.attributes["robopost.poll.iteration"] for p in polls] == [1, 2, 3]
+    assert [p.attributes["robopost.task.status"] for p in polls] == ["PROCESSING", "PROCESSING", "COMPLETE"]
+    assert all(p.parent is root for p in polls)
+
+    attempts = [s for s in tracer.spans if s.name == "GET"]
+    assert len(attempts) == 3
+    assert attempts[0].parent.name == "robopost.get_video_task"
+    assert attempts[0].parent.parent is polls[0]
+    assert attempts[0].attributes["http.response.status_code"] == 200
+    assert attempts[0].attributes["http.response.body.size"] > 0
+    assert all("secret" not in str(s.attributes) for s in tracer.spans)
+
+
+def test_no_spans_without_tracer(base_url):
+    tracing.set_tracer(None)
+    client = RobopostClient(apikey="secret", base_url=base_url)
+
+    assert client.get_video_task("t1").task_id == "t1"
+    assert client.get_video_task.__name__ == "get_video_task"
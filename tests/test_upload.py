@@ -0,0 +1,101 @@
+import asyncio
+import io
+
+import pytest
+
+from robopost_client import AsyncRobopostClient, RobopostClient, StubServer, protocol
+
+DATA = bytes(range(256)) * 4096
+
+
+@pytest.fixture
+def stub():
+    with StubServer() as server:
+        yield server
+
+
+def sources(tmp_path):
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(DATA)
+    return {
+        "path": (str(path), None),
+        "bytes": (DATA, "clip.mp4"),
+        "bytearray": (bytearray(DATA), "clip.mp4"),
+        "memoryview": (memoryview(DATA)[1024:], "clip.mp4"),
+        "file object": (open(path, "rb"), None),
+        "BytesIO": (io.BytesIO(DATA), "clip.mp4"),
+        "generator": ((DATA[i:i + 100000] for i in range(0, len(DATA), 100000)), "clip.mp4"),
+    }
+
+
+def test_upload_from_any_source(stub, tmp_path):
+    client = RobopostClient(apikey="test", base_url=stub.base_url)
+    sent = []
+    client.add_after_response_hook(lambda info: sent.append(info.bytes_sent))
+
+    for kind, (source, filename) in sources(tmp_path).items():
+        media = client.upload_media(source, filename=filename)
+        if kind == "file object":
+            source.close()
+        expected = len(DATA) - 1024 if kind == "memoryview" else len(DATA)
+        assert media.name == "clip.mp4", kind
+        assert stub.media[media.id]["size"] == expected, kind
+
+    # Only the generator's size is unknown up front; it is sent chunked
+    assert [size is None for size in sent] == [False] * 6 + [True]
+
+
+def test_iterable_with_size_gets_a_content_length(stub):
+    client = RobopostClient(apikey="test", base_url=stub.base_url)
+    sent = []
+    client.add_after_response_hook(lambda info: sent.append(info.bytes_sent))
+
+    chunks = iter([DATA[:1000], b"", DATA[1000:]])
+    media = client.upload_media(chunks, filename="frame.png", content_type="image/png", size=len(DATA))
+    assert stub.media[media.id]["size"] == len(DATA)
+    assert sent[0] > len(DATA)
+
+
+def test_buffers_are_streamed_without_copies():
+    view = memoryview(DATA)
+    chunks = list(protocol.MultipartBody("file", "a.bin", view, "b0undary", "application/octet-stream"))
+    assert len(chunks) == 3
+    assert chunks[1].obj is DATA
+    assert b"Content-Type: application/octet-stream" in chunks[0]
+
+    body = protocol.MultipartBody("file", "a.bin", DATA, "b0undary")
+    assert bytes(body) == protocol.encode_multipart("file", "a.bin", DATA, "b0undary")
+    assert body.len == len(bytes(body))
+
+
+def test_files_are_read_in_blocks(monkeypatch):
+    monkeypatch.setattr(protocol, "CHUNK_SIZE", 64 * 1024)
+    file = io.BytesIO(DATA)
+    file.seek(1000)
+    body = protocol.MultipartBody("file", "a.bin", file, "b0undary")
+    chunks = list(body)
+    assert max(len(chunk) for chunk in chunks[1:-1]) == 64 * 1024
+    assert b"".join(chunks[1:-1]) == DATA[1000:]
+    assert body.len == sum(len(chunk) for chunk in chunks)
+
+
+def test_filename_is_required_for_unnamed_content(stub):
+    client = RobopostClient(apikey="test", base_url=stub.base_url)
+    with pytest.raises(ValueError):
+        client.upload_media(DATA)
+    with pytest.raises(TypeError):
+        client.upload_media(iter(["text"]), filename="a.txt")
+    assert stub.request_count("POST /medias/upload") == 0
+
+    media = client.upload_media(DATA, filename='odd "name".png')
+    assert media.name == "odd %22name%22.png"
+
+
+def test_async_upload_from_generator(stub):
+    async def upload():
+        async with AsyncRobopostClient(apikey="test", base_url=stub.base_url) as client:
+            return await client.upload_media((DATA[i:i + 4096] for i in range(0, len(DATA), 4096)),
+                                             filename="clip.mp4", content_type="video/mp4")
+
+    media = asyncio.run(upload())
+    assert stub.media[media.id]["size"] == len(DATA)
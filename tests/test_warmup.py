@@ -0,0 +1,92 @@
+import socket
+import threading
+
+import pytest
+
+from robopost_client import DNSCache, RobopostClient, StubConfig, StubServer
+
+
+class FakeResolver:
+    def __init__(self, addresses):
+        self.addresses = addresses
+        self.calls = 0
+
+    def __call__(self, host, port, family=0, type=0, proto=0, flags=0):
+        self.calls += 1
+        if host != "api.robopost.test":
+            raise socket.gaierror(socket.EAI_NONAME, "unknown host")
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (address, port)) for address in self.addresses]
+
+
+@pytest.fixture
+def stub():
+    with StubServer(StubConfig()) as server:
+        server.seed_media(2)
+        yield server
+
+
+def test_dns_cache_resolves_once_per_ttl():
+    resolver = FakeResolver(["10.0.0.1", "10.0.0.2", "10.0.0.1"])
+    cache = DNSCache(ttl=60, resolver=resolver)
+
+    assert cache.resolve("api.robopost.test", 443) == ["10.0.0.1", "10.0.0.2"]
+    assert cache.resolve("API.robopost.test", 443) == ["10.0.0.1", "10.0.0.2"]
+    assert cache.resolve("127.0.0.1", 443) == ["127.0.0.1"]
+    assert resolver.calls == 1
+
+    cache.invalidate("api.robopost.test")
+    cache.resolve("api.robopost.test", 443)
+    assert resolver.calls == 2
+    assert cache.stats().hits == 1
+
+    with pytest.raises(socket.gaierror):
+        cache.resolve("elsewhere.test", 443)
+
+
+def test_client_connects_through_dns_cache(stub):
+    # 127.0.0.2 refuses connections to the stub, which listens on 127.0.0.1 only
+    resolver = FakeResolver(["127.0.0.2", "127.0.0.1"])
+    dns_cache = DNSCache(resolver=resolver)
+    client = RobopostClient(apikey="test", base_url=f"http://api.robopost.test:{stub.port}/v1",
+                            dns_cache=dns_cache, pool_maxsize=8)
+
+    threads = [threading.Thread(target=client.list_media) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(client.list_media()) == 2
+    assert resolver.calls == 1
+    assert stub.request_count("GET /medias/") == 9
+
+
+def test_warmup_opens_pooled_connections(stub):
+    dns_cache = DNSCache(resolver=FakeResolver(["127.0.0.1"]))
+    client = RobopostClient(apikey="test", base_url=f"http://api.robopost.test:{stub.port}/v1",
+                            dns_cache=dns_cache, pool_maxsize=4)
+    connects = []
+    client.add_after_response_hook(lambda info: connects.append(info.timing.connect))
+
+    assert client.warmup(n_connections=4) == 4
+    assert dns_cache.stats().size == 1
+
+    barrier = threading.Barrier(4)
+
+    def call():
+        barrier.wait()
+        client.list_media()
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Every call found a connection already open
+    assert connects == [0.0] * 4
+
+
+def test_warmup_is_capped_by_pool_size(stub):
+    client = RobopostClient(apikey="test", base_url=stub.base_url, pool_maxsize=2)
+    assert client.warmup(n_connections=10) == 2
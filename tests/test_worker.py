@@ -0,0 +1,107 @@
+import threading
+import time
+
+from robopost_client import JobQueue, PublicAPIMediaRead, Worker
+
+
+class FakeClient:
+    def __init__(self):
+        self.order = []
+        self.lock = threading.Lock()
+
+    def upload_media(self, path):
+        if path == "missing.jpg":
+            raise FileNotFoundError(path)
+        time.sleep(0.01)
+        with self.lock:
+            self.order.append(path)
+        return PublicAPIMediaRead(id=path, name=path, extension="jpg", storage_object_id="so-" + path)
+
+
+def test_jobs_are_claimed_in_priority_order(tmp_path):
+    queue = JobQueue(str(tmp_path / "queue.sqlite"))
+    low = queue.enqueue("upload_media", {"path": "low.jpg"}, priority=0)
+    high = queue.enqueue("upload_media", {"path": "high.jpg"}, priority=10)
+
+    assert queue.claim().id == high
+    assert queue.claim().id == low
+    assert queue.claim() is None
+    assert queue.counts()["running"] == 2
+    assert queue.requeue_running() == 0
+
+
+def test_only_jobs_with_an_expired_lease_are_requeued(tmp_path):
+    path = str(tmp_path / "queue.sqlite")
+    queue = JobQueue(path, lease=0.3)
+    job = queue.enqueue("upload_media", {"path": "slow.jpg"})
+
+    class SlowClient(FakeClient):
+        def upload_media(self, path):
+            time.sleep(1.0)
+            return super().upload_media(path)
+
+    # A worker that crashed after claiming the job
+    assert JobQueue(path, lease=0.3).claim().id == job
+    time.sleep(0.35)
+
+    worker = Worker(SlowClient(), queue, concurrency=1, poll_interval=0.01)
+    runner = threading.Thread(target=worker.run, kwargs={"until_empty": True})
+    runner.start()
+    time.sleep(0.6)
+
+    # The live worker renews its lease, so a second worker on the queue leaves the job alone
+    other = JobQueue(path, lease=0.3)
+    assert other.requeue_running() == 0
+    assert other.claim() is None
+    runner.join(timeout=10)
+    assert (queue.get(job).state, queue.get(job).attempts) == ("done", 2)
+
+
+def test_a_lost_lease_cannot_overwrite_the_outcome(tmp_path):
+    path = str(tmp_path / "queue.sqlite")
+    slow = JobQueue(path, lease=0.1)
+    job_id = slow.enqueue("upload_media", {"path": "a.jpg"})
+    stale = slow.claim()
+    time.sleep(0.15)
+
+    other = JobQueue(path)
+    assert other.requeue_running() == 1
+    current = other.claim()
+    assert current.id == job_id and current.lease_token != stale.lease_token
+
+    assert not slow.fail(stale, "TimeoutError")
+    assert other.complete(current, {"id": "a.jpg"})
+    assert not slow.complete(stale, {"id": "stale"})
+    assert (other.get(job_id).state, other.get(job_id).result) == ("done", {"id": "a.jpg"})
+
+
+def test_worker_drains_queue_and_records_results(tmp_path):
+    queue = JobQueue(str(tmp_path / "queue.sqlite"))
+    ids = [queue.enqueue("upload_media", {"path": f"{i}.jpg"}) for i in range(10)]
+    failing = queue.enqueue("upload_media", {"path": "missing.jpg"}, priority=5)
+
+    stats = Worker(FakeClient(), queue, concurrency=4, poll_interval=0.01).run(until_empty=True)
+
+    assert (stats.processed, stats.failed, stats.in_flight, stats.queue_depth) == (10, 1, 0, 0)
+    assert queue.get(ids[0]).result["storage_object_id"] == "so-0.jpg"
+    assert queue.get(failing).error.startswith("FileNotFoundError")
+
+
+def test_stop_waits_for_in_flight_jobs(tmp_path):
+    queue = JobQueue(str(tmp_path / "queue.sqlite"))
+    for i in range(20):
+        queue.enqueue("upload_media", {"path": f"{i}.jpg"})
+
+    client = FakeClient()
+    worker = Worker(client, queue, concurrency=2, poll_interval=0.01)
+    runner = threading.Thread(target=worker.run)
+    runner.start()
+    time.sleep(0.03)
+    worker.stop()
+    runner.join(timeout=5)
+
+    counts = queue.counts()
+    assert not runner.is_alive()
+    assert counts["running"] == 0
+    assert counts["done"] == len(client.order)
+    assert counts["queued"] == 20 - counts["done"]